@@ -110,10 +110,10 @@ if __name__ == "__main__":
     scale = scale / magnitudes * variances ** 0.5
 
     array = modes._getArray()
-    coordinates = lightdock_structure.atom_coordinates[0].coordinates
+    coordinates = lightdock_structure.atom_coordinates[0].coordinates.copy()
     for i in range(args.n_confs):
         conf = (array * scale * randn[i]).sum(1).reshape((num_atoms_prody, 3))
-        lightdock_structure.atom_coordinates[0].coordinates = coordinates + conf
+        lightdock_structure.atom_coordinates[0] = coordinates + conf
         output_file = f"anm_{i+1}_{args.pdb_file}"
         write_pdb_to_file(lightdock_structure, output_file, lightdock_structure[0])
         log.info(f"Conformation {i+1} written to [{output_file}]")
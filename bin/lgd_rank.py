@@ -4,26 +4,34 @@
 
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from lightdock.constants import (
     DEFAULT_SWARM_FOLDER,
     GSO_OUTPUT_FILE,
     EVALUATION_FILE,
-    SCORING_FILE,
-    LIGHTDOCK_PDB_FILE,
     CLUSTER_REPRESENTATIVES_FILE,
 )
 from lightdock.util.logger import LoggingManager
 from lightdock.util.analysis import (
     read_rmsd_and_contacts_data,
-    read_lightdock_output,
-    write_ranking_to_file,
-    read_cluster_representatives_file,
+    read_swarm_solutions,
+    SolutionsTable,
 )
 
 
 log = LoggingManager.get_logger("lgd_rank")
 
 
+def valid_positive_integer(int_value):
+    try:
+        int_value = int(int_value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{int_value} is an invalid value")
+    if int_value <= 0:
+        raise argparse.ArgumentTypeError(f"{int_value} is an invalid value")
+    return int_value
+
+
 def parse_command_line():
     parser = argparse.ArgumentParser(prog="lgd_rank")
     parser.add_argument(
@@ -52,76 +60,95 @@ def parse_command_line():
         dest="ignore_clusters",
         action="store_true",
     )
+    parser.add_argument(
+        "--top",
+        help="only write the best N solutions of each ranking",
+        dest="top",
+        type=valid_positive_integer,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--cores",
+        help="processes reading the swarm results, all the available by default",
+        dest="cores",
+        type=valid_positive_integer,
+    )
     return parser.parse_args()
 
 
+def read_swarms(
+    swarm_ids, result_file_names, cluster_file_names, rmsds, contacts, cores
+):
+    """Solutions of each swarm, read by a pool of cores processes"""
+    arguments = (
+        swarm_ids,
+        result_file_names,
+        cluster_file_names,
+        [rmsds.get(swarm_id) for swarm_id in swarm_ids],
+        [contacts.get(swarm_id) for swarm_id in swarm_ids],
+    )
+    if cores == 1 or len(swarm_ids) <= 1:
+        return list(map(read_swarm_solutions, *arguments))
+    with ProcessPoolExecutor(max_workers=cores) as executor:
+        chunk_size = max(1, len(swarm_ids) // (4 * cores))
+        return list(
+            executor.map(read_swarm_solutions, *arguments, chunksize=chunk_size)
+        )
+
+
 if __name__ == "__main__":
     try:
         # Parse command line
         args = parse_command_line()
 
-        solutions = []
         contacts = {}
         rmsds = {}
         if os.path.isfile(EVALUATION_FILE):
             contacts, rmsds = read_rmsd_and_contacts_data(EVALUATION_FILE)
 
-        num_swarms_found = 0
-        for swarm_id in range(args.num_swarms):
+        swarm_ids = list(range(args.num_swarms))
+        result_file_names = []
+        cluster_file_names = []
+        for swarm_id in swarm_ids:
+            swarm_folder = DEFAULT_SWARM_FOLDER + str(swarm_id)
             if args.result_file:
-                result_file_name = os.path.join(
-                    DEFAULT_SWARM_FOLDER + str(swarm_id), args.result_file
-                )
+                result_file_names.append(os.path.join(swarm_folder, args.result_file))
             else:
-                result_file_name = os.path.join(
-                    DEFAULT_SWARM_FOLDER + str(swarm_id), (GSO_OUTPUT_FILE % args.steps)
+                result_file_names.append(
+                    os.path.join(swarm_folder, (GSO_OUTPUT_FILE % args.steps))
                 )
-
-            cluster_representatives_file = os.path.join(
-                DEFAULT_SWARM_FOLDER + str(swarm_id), CLUSTER_REPRESENTATIVES_FILE
-            )
-            clusters = []
-            if (
-                os.path.isfile(cluster_representatives_file)
-                and not args.ignore_clusters
-            ):
-                clusters = read_cluster_representatives_file(
-                    cluster_representatives_file
+            if args.ignore_clusters:
+                cluster_file_names.append(None)
+            else:
+                cluster_file_names.append(
+                    os.path.join(swarm_folder, CLUSTER_REPRESENTATIVES_FILE)
                 )
 
-            scoring_file_name = os.path.join(
-                DEFAULT_SWARM_FOLDER + str(swarm_id), SCORING_FILE
-            )
-            try:
-                results = read_lightdock_output(result_file_name)
-                num_swarms_found += 1
-                for result in results:
-                    result.id_swarm = swarm_id
-                    result.pdb_file = LIGHTDOCK_PDB_FILE % result.id_glowworm
-                    try:
-                        result.rmsd = rmsds[result.id_swarm][result.id_glowworm]
-                        result.contacts = contacts[result.id_swarm][result.id_glowworm]
-                    except Exception:
-                        pass
-                    if len(clusters):
-                        # Clusters read
-                        if result.id_glowworm in clusters:
-                            solutions.append(result)
-                    else:
-                        # Default without clustering
-                        solutions.append(result)
-            except IOError:
+        cores = min(args.cores or os.cpu_count() or 1, max(1, args.num_swarms))
+        tables = read_swarms(
+            swarm_ids, result_file_names, cluster_file_names, rmsds, contacts, cores
+        )
+        swarm_tables = []
+        for result_file_name, table in zip(result_file_names, tables):
+            if table is None:
                 log.warning("Results %s not found, ignoring." % result_file_name)
+            else:
+                swarm_tables.append(table)
+        num_swarms_found = len(swarm_tables)
 
-        write_ranking_to_file(solutions, args.clashes_cutoff)
-        write_ranking_to_file(solutions, args.clashes_cutoff, order_by="luciferin")
-        write_ranking_to_file(solutions, args.clashes_cutoff, order_by="rmsd")
-        write_ranking_to_file(solutions, args.clashes_cutoff, order_by="scoring")
+        # All the rankings are sorted from the same table
+        solutions = SolutionsTable.concatenate(swarm_tables)
+        if args.clashes_cutoff:
+            solutions = solutions.select(solutions.contacts <= args.clashes_cutoff)
+        for order_by in [None, "luciferin", "rmsd", "scoring"]:
+            solutions.write_ranking(order_by, args.top)
 
         log.info("Number of swarms: %d" % args.num_swarms)
         log.info("Number of steps: %d" % args.steps)
         if args.clashes_cutoff:
             log.info("Clashes cutoff: %5.3f" % args.clashes_cutoff)
+        if args.top:
+            log.info("Solutions per ranking: %d" % args.top)
         if args.result_file:
             log.info("Output files: %s" % args.result_file)
         else:
@@ -2,12 +2,14 @@
 
 """Execution controller
 
-Depending on the environment, executes a MPI or multiprocessing version.
+Depending on the environment, executes a MPI or multiprocessing version, or serves the
+swarms to workers (--coordinator) or runs as one of them (--worker HOST:PORT).
 """
 
 import traceback
+from lightdock.util.profiling import startup_profile
 from lightdock.util.logger import LoggingManager
-from lightdock.util.parser import CommandLineParser
+from lightdock.util.parser import CommandLineParser, get_worker_address
 
 
 log = LoggingManager.get_logger("lgd_run")
@@ -16,20 +18,33 @@ log = LoggingManager.get_logger("lgd_run")
 if __name__ == "__main__":
 
     try:
-        parser = CommandLineParser()
-        mpi_support = parser.args.mpi
-        if mpi_support:
-            from lightdock.simulation.docking_mpi import (
-                run_simulation as mpi_simulation,
-            )
-
-            mpi_simulation(parser)
-        else:
-            from lightdock.simulation.docking_multiprocessing import (
-                run_simulation as multiprocessing_simulation,
-            )
+        worker_address = get_worker_address()
+        if worker_address:
+            from lightdock.simulation.docking_network import run_worker
 
-            multiprocessing_simulation(parser)
+            run_worker(worker_address)
+        else:
+            parser = CommandLineParser()
+            startup_profile.mark("Command line")
+            mpi_support = parser.args.mpi
+            if parser.args.coordinator:
+                from lightdock.simulation.docking_network import run_coordinator
+
+                run_coordinator(parser)
+            elif mpi_support:
+                from lightdock.simulation.docking_mpi import (
+                    run_simulation as mpi_simulation,
+                )
+                startup_profile.mark("Imports")
+
+                mpi_simulation(parser)
+            else:
+                from lightdock.simulation.docking_multiprocessing import (
+                    run_simulation as multiprocessing_simulation,
+                )
+                startup_profile.mark("Imports")
+
+                multiprocessing_simulation(parser)
 
     except Exception:
         log.error("LightDock has failed, please check traceback:")
@@ -6,6 +6,10 @@ This step parses the input PDB structures, calculates the minimum ellipsoid
 containing each of them, calculates the swarms on the surface of the
 receptor and populates each swarm with random coordinates for each glowworm's
 optimization vector.
+
+Setup stages are cached: running the setup again only recalculates the stages
+whose input has changed (i.e. changing the number of swarms does not recalculate
+the normal modes).
 """
 
 from pathlib import Path
@@ -20,12 +24,17 @@ from lightdock.prep.simulation import (
     calculate_anm,
     parse_restraints_file,
     get_restraints,
+    get_lightdock_structure_files,
 )
+from lightdock.prep.starting_points import calculate_sasa
+from lightdock.prep.pipeline import SetupPipeline, SetupStage
 from lightdock.constants import (
     DEFAULT_LIGHTDOCK_PREFIX,
     DEFAULT_ELLIPSOID_DATA_EXTENSION,
     DEFAULT_REC_NM_FILE,
     DEFAULT_LIG_NM_FILE,
+    DEFAULT_POSITIONS_FOLDER,
+    NUMPY_FILE_SAVE_EXTENSION,
 )
 from lightdock.mathutil.ellipsoid import MinimumVolumeEllipsoid
 from lightdock.util.logger import LoggingManager
@@ -82,19 +91,6 @@ if __name__ == "__main__":
             np.save(ellipsoid_data_file, np.array([lig_ellipsoid.center.copy()]))
         log.info("Done.")
 
-        # Save to file parsed structures
-        save_lightdock_structure(receptor)
-        save_lightdock_structure(ligand)
-
-        # Calculate and save ANM if required
-        if args.use_anm:
-            if args.anm_rec > 0:
-                log.info("Calculating ANM for receptor molecule...")
-                calculate_anm(receptor, args.anm_rec, args.anm_rec_rmsd, args.anm_seed, DEFAULT_REC_NM_FILE)
-            if args.anm_lig > 0:
-                log.info("Calculating ANM for ligand molecule...")
-                calculate_anm(ligand, args.anm_lig, args.anm_lig_rmsd, args.anm_seed, DEFAULT_LIG_NM_FILE)
-
         # Parse restraints if any:
         receptor_restraints = ligand_restraints = None
         if args.restraints:
@@ -138,37 +134,125 @@ if __name__ == "__main__":
         except (KeyError, TypeError):
             lig_restraints = None
 
+        # Setup stages: structures, ANM, SASA and starting positions. ANM and SASA run
+        # in parallel and every stage is cached, so only the stages affected by a change
+        # in the input are recalculated
+        pipeline = SetupPipeline()
+        input_flags = {"noxt": args.noxt, "noh": args.noh, "now": args.now}
+        for name, structure in [("receptor", receptor), ("ligand", ligand)]:
+            pipeline.add_stage(
+                SetupStage(
+                    f"{name}_structure",
+                    save_lightdock_structure,
+                    args=(structure,),
+                    parameters=input_flags,
+                    input_files=structure.structure_file_names,
+                    outputs=get_lightdock_structure_files(structure),
+                )
+            )
+
+        # Calculate and save ANM if required
+        if args.use_anm:
+            for name, structure, num_nmodes, rmsd, nm_file in [
+                ("receptor", receptor, args.anm_rec, args.anm_rec_rmsd, DEFAULT_REC_NM_FILE),
+                ("ligand", ligand, args.anm_lig, args.anm_lig_rmsd, DEFAULT_LIG_NM_FILE),
+            ]:
+                if num_nmodes > 0:
+                    pipeline.add_stage(
+                        SetupStage(
+                            f"{name}_anm",
+                            calculate_anm,
+                            args=(structure, num_nmodes, rmsd, args.anm_seed, nm_file),
+                            parameters={"modes": num_nmodes, "rmsd": rmsd, "seed": args.anm_seed},
+                            outputs=[nm_file + NUMPY_FILE_SAVE_EXTENSION],
+                            depends_on=[f"{name}_structure"],
+                            parallel=True,
+                        )
+                    )
+
+        # Total SASA is only required for the automatic number of swarms
+        receptor_file_name = receptor.structure_file_names[receptor.representative_id]
+        positions_dependencies = ["receptor_structure", "ligand_structure"]
+        has_receptor_restraints = receptor_restraints and (
+            receptor_restraints["active"] + receptor_restraints["passive"]
+        )
+        if not args.swarms and not has_receptor_restraints and not (args.membrane or args.transmembrane):
+            pipeline.add_stage(
+                SetupStage(
+                    "receptor_sasa",
+                    calculate_sasa,
+                    args=(receptor_file_name,),
+                    input_files=[receptor_file_name],
+                    parallel=True,
+                )
+            )
+            positions_dependencies.append("receptor_sasa")
+
         # Calculate surface points (swarm centers) over receptor structure
-        starting_points_files = calculate_starting_positions(
-            receptor,
-            ligand,
-            args.swarms,
-            args.glowworms,
-            args.starting_points_seed,
-            receptor_restraints,
-            lig_restraints,
-            rec_translation,
-            lig_translation,
-            args.surface_density,
-            args.use_anm,
-            args.anm_seed,
-            args.anm_rec,
-            args.anm_lig,
-            args.membrane,
-            args.transmembrane,
-            args.write_starting_positions,
-            args.swarm_radius,
-            args.flip,
-            args.fixed_distance,
-            args.swarms_per_restraint,
-            args.dense_sampling,
+        positions_parameters = {
+            k: getattr(args, k)
+            for k in [
+                "swarms",
+                "glowworms",
+                "starting_points_seed",
+                "surface_density",
+                "use_anm",
+                "anm_seed",
+                "anm_rec",
+                "anm_lig",
+                "membrane",
+                "transmembrane",
+                "write_starting_positions",
+                "swarm_radius",
+                "flip",
+                "fixed_distance",
+                "swarms_per_restraint",
+                "dense_sampling",
+                "batch_poses",
+            ]
+        }
+        pipeline.add_stage(
+            SetupStage(
+                "starting_positions",
+                lambda: calculate_starting_positions(
+                    receptor,
+                    ligand,
+                    args.swarms,
+                    args.glowworms,
+                    args.starting_points_seed,
+                    receptor_restraints,
+                    lig_restraints,
+                    rec_translation,
+                    lig_translation,
+                    args.surface_density,
+                    args.use_anm,
+                    args.anm_seed,
+                    args.anm_rec,
+                    args.anm_lig,
+                    args.membrane,
+                    args.transmembrane,
+                    args.write_starting_positions,
+                    args.swarm_radius,
+                    args.flip,
+                    args.fixed_distance,
+                    args.swarms_per_restraint,
+                    args.dense_sampling,
+                    pipeline.results.get("receptor_sasa"),
+                    args.batch_poses,
+                ),
+                parameters=positions_parameters,
+                input_files=[args.restraints] if args.restraints else None,
+                outputs=[DEFAULT_POSITIONS_FOLDER],
+                depends_on=positions_dependencies,
+            )
         )
+        starting_points_files = pipeline.run()["starting_positions"]
         if len(starting_points_files) != args.swarms:
             args.swarms = len(starting_points_files)
             log.info(f"Number of calculated swarms is {args.swarms}")
 
         # Create simulation folders
-        prepare_results_environment(args.swarms)
+        prepare_results_environment(args.swarms, keep_empty=True)
 
         # Add manually setup version
         args.setup_version = CURRENT_VERSION
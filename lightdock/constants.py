@@ -15,6 +15,34 @@ DEFAULT_TRANSLATION_STEP = 0.5
 """Interpolation step for translation (in %)"""
 DEFAULT_ROTATION_STEP = 0.5
 """Normalized SLERP step. 1 means full jump, 0 means no movement"""
+DEFAULT_MINIMIZER = "powell"
+"""Local minimization method: Powell on the best glowworm or pattern search"""
+DEFAULT_MINIMIZATION_TOP = 1
+"""Number of glowworms of a swarm refined by local minimization at each step"""
+DEFAULT_MINIMIZATION_BUDGET = 200
+"""Scoring evaluations of the local minimization allowed per swarm and step"""
+DEFAULT_MINIMIZATION_TRANSLATION = 1.0
+"""Initial translation step of the local minimization (in Angstroms)"""
+DEFAULT_MINIMIZATION_ROTATION = 0.1
+"""Initial rotation step of the local minimization (in radians)"""
+DEFAULT_MINIMIZATION_NMODES = 0.25
+"""Initial normal modes extent step of the local minimization"""
+DEFAULT_CONVERGENCE_PATIENCE = 0
+"""Steps without changes to stop a swarm, 0 means the swarm is never stopped"""
+DEFAULT_CONVERGENCE_SCORING = 1e-3
+"""Maximum change of the best scoring of a converged swarm"""
+DEFAULT_CONVERGENCE_LUCIFERIN = 1e-3
+"""Maximum change of the mean luciferin of a converged swarm"""
+DEFAULT_CONVERGENCE_MOVING = 0.1
+"""Maximum fraction of moving glowworms of a converged swarm"""
+DEFAULT_SWAP_RATE = 0.0
+"""Probability of trying other conformers when a glowworm moves, 0 means disabled"""
+DEFAULT_PRUNE_FRACTION = 0.5
+"""Fraction of the running swarms pruned after each round of a simulation"""
+DEFAULT_HEARTBEAT_INTERVAL = 5.0
+"""Seconds between the heartbeats of a worker of a distributed simulation"""
+DEFAULT_WORKER_TIMEOUT = 30.0
+"""Seconds without heartbeats after which a worker is considered dead"""
 GSO_SEED = 324324
 """Seed for the random number generator in the GSO algorithm"""
 STARTING_POINTS_SEED = 324324
@@ -41,6 +69,10 @@ DEFAULT_NMODES_STEP = 0.5
 DEFAULT_REC_NM_FILE = "lightdock_rec.nm"
 DEFAULT_LIG_NM_FILE = "lightdock_lig.nm"
 
+# Structures
+DEFAULT_ENSEMBLE_MMAP_SIZE = 128 * 1024 * 1024
+"""Size in bytes above which the coordinates of an ensemble are memory mapped"""
+
 # Scoring function constants
 DEFAULT_SCORING_FUNCTION = "fastdfire"
 """LightDock default scoring function if none is specified"""
@@ -66,6 +98,8 @@ DEFAULT_SWARM_FOLDER = "swarm_"
 """Folder where GSO execution for a given swarm will be stored"""
 DEFAULT_SETUP_FILE = "setup.json"
 """Stores simulation step information"""
+DEFAULT_SETUP_CACHE_FILE = ".setup_cache.json"
+"""Stores the keys and results of the setup stages already calculated"""
 DEFAULT_PDB_STARTING_PREFIX = "starting_positions"
 DEFAULT_BILD_STARTING_PREFIX = "starting_poses"
 DEFAULT_STARTING_PREFIX = "initial_positions"
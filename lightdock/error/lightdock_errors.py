@@ -131,3 +131,9 @@ class MembraneSetupError(LightDockError):
     """Error in membrane setup"""
 
     pass
+
+
+class TentacleError(LightDockError):
+    """Error in a process of the parallel execution of swarms"""
+
+    pass
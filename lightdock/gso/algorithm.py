@@ -25,12 +25,24 @@ class GSO(object):
         random_number_generator,
         initial_coordinates_file="",
         local_minimization=False,
+        convergence=None,
+        conformer_swap=None,
     ):
         self.swarm = swarm
         self.parameters = gso_parameters
         self.random_number_generator = random_number_generator
         self.initial_coordinates_file = initial_coordinates_file
-        self.local_minimization = local_minimization
+        # True minimizes the best glowworm with Powell, otherwise a minimizer is given
+        self.local_minimization = bool(local_minimization)
+        self.minimizer = None
+        if self.local_minimization and local_minimization is not True:
+            self.minimizer = local_minimization
+        # Stops the simulation of the swarm early if defined
+        self.convergence = convergence
+        self.converged = False
+        self.last_step = 0
+        # Tries other conformers of the receptor and ligand ensembles if defined
+        self.conformer_swap = conformer_swap
 
     def run(
         self,
@@ -40,24 +52,34 @@ class GSO(object):
         saving_path=".",
         save_intermediary=False,
         save_all_intermediary=False,
+        stop_step=None,
     ):
-        """Runs the simulation for the given simulation_steps"""
-        if save_intermediary:
+        """Runs the simulation for the given simulation_steps.
+
+        The simulation can be run in parts up to stop_step, each call continuing from
+        the last step reached. If the swarm converges, the simulation stops and its last
+        state is saved as the one of the last step, noting the step reached.
+        """
+        if self.converged:
+            return
+        if save_intermediary and self.last_step == 0:
             self.swarm.save(0, saving_path)
+        if stop_step is None or stop_step > simulation_steps:
+            stop_step = simulation_steps
 
-        for step in range(1, simulation_steps + 1):
+        for step in range(self.last_step + 1, stop_step + 1):
             if verbose:
-                if cluster_id is not None:
-                    print("[%d] step %d" % (cluster_id, step))
-                else:
-                    print("step %d" % step)
+                self._print("step %d" % step, cluster_id)
             # Evaluate energy and update luciferin accordingly:
-            self.swarm.update_luciferin()
+            self.swarm.update_luciferin(self.conformer_swap)
             # Perform local minimization of the best
             if self.local_minimization:
-                self.swarm.minimize_best()
+                self.swarm.minimize_best(self.minimizer)
             # Each glowworm move if required to the best neighbour
-            self.swarm.movement_phase(self.random_number_generator)
+            self.swarm.movement_phase(self.random_number_generator, self.conformer_swap)
+            self.last_step = step
+            if self.convergence:
+                self.converged = self.convergence.update(self.swarm)
             if save_intermediary:
                 if (
                     save_all_intermediary
@@ -65,6 +87,30 @@ class GSO(object):
                     or step >= simulation_steps
                 ):
                     self.swarm.save(step, saving_path)
+            if self.converged:
+                break
+
+        if self.converged and self.last_step < simulation_steps:
+            if verbose:
+                self._print("converged at step %d" % self.last_step, cluster_id)
+            if save_intermediary:
+                self.swarm.save(
+                    simulation_steps,
+                    saving_path,
+                    comment="Converged at step %d" % self.last_step,
+                )
+        finished = self.converged or self.last_step >= simulation_steps
+        if self.minimizer and verbose and finished:
+            self._print(self.minimizer.report(), cluster_id)
+        if self.conformer_swap and verbose and finished:
+            self._print(self.conformer_swap.report(), cluster_id)
+
+    @staticmethod
+    def _print(message, cluster_id=None):
+        if cluster_id is not None:
+            print("[%d] %s" % (cluster_id, message))
+        else:
+            print(message)
 
     def report(self, output_file_name=""):
         """Writes to output_file_name if defined or to standard output the result of a GSO execution."""
@@ -97,6 +143,10 @@ class GSO(object):
             self.parameters.max_neighbors,
             os.linesep,
         )
+        if self.minimizer:
+            output += "%s%s" % (self.minimizer.report(), os.linesep)
+        if self.conformer_swap:
+            output += "%s%s" % (self.conformer_swap.report(), os.linesep)
 
         if output_file_name:
             output_file = open(output_file_name, "w")
@@ -188,6 +238,8 @@ class LightdockGSOBuilder(object):
         local_minimization,
         anm_rec,
         anm_lig,
+        convergence=None,
+        conformer_swap=None,
     ):
         """Creates a new GSO instance of the algorithm reading the initial position of the glowworms
         agents from initial_population_file and using the scoring function adapter.
@@ -211,4 +263,6 @@ class LightdockGSOBuilder(object):
             gso_parameters,
             random_number_generator,
             local_minimization=local_minimization,
+            convergence=convergence,
+            conformer_swap=conformer_swap,
         )
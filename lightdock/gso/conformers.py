@@ -0,0 +1,62 @@
+"""Swaps of the receptor and ligand conformers of the glowworms of a swarm"""
+
+import time
+from lightdock.constants import DEFAULT_SWAP_RATE
+
+
+class ConformerSwap(object):
+    """Tries other structures of the receptor and ligand ensembles for moved glowworms.
+
+    When a glowworm moves, random receptor and ligand conformers are drawn and kept as
+    a trial with probability rate. On the next evaluation of the glowworm, which is
+    required anyway as it has moved, the trial conformers are scored at the new pose
+    and replace the current ones if their scoring is better. The extra cost of a step
+    is then bounded by rate scoring evaluations per moved glowworm.
+    """
+
+    def __init__(self, rate=DEFAULT_SWAP_RATE):
+        self.rate = rate
+        # Counters
+        self.trials = 0
+        self.accepted = 0
+        self.elapsed = 0.0
+
+    def propose(self, position, rnd_generator):
+        """Draws the trial conformers of a landscape position which has moved"""
+        receptor_id = rnd_generator.randint(upper_limit=(len(position.receptor) - 1))
+        ligand_id = rnd_generator.randint(upper_limit=(len(position.ligand) - 1))
+        position.trial_conformers = None
+        if rnd_generator() < self.rate and (receptor_id, ligand_id) != (
+            position.receptor_id,
+            position.ligand_id,
+        ):
+            position.trial_conformers = (receptor_id, ligand_id)
+
+    def evaluate(self, position):
+        """Scoring of position, swapping to its trial conformers if they score better"""
+        scoring = position.evaluate_objective_function()
+        if position.trial_conformers is None:
+            return scoring
+        start = time.perf_counter()
+        receptor_id, ligand_id = position.trial_conformers
+        position.trial_conformers = None
+        scoring = position.swap_conformers(receptor_id, ligand_id, scoring)
+        self.trials += 1
+        if (position.receptor_id, position.ligand_id) == (receptor_id, ligand_id):
+            self.accepted += 1
+        self.elapsed += time.perf_counter() - start
+        return scoring
+
+    @property
+    def acceptance(self):
+        """Fraction of the trials accepted"""
+        return self.accepted / self.trials if self.trials else 0.0
+
+    def report(self):
+        """Counters of the conformer swaps"""
+        return "Conformer swaps: %d trials, %d accepted (%.1f%%), %.2f s" % (
+            self.trials,
+            self.accepted,
+            100.0 * self.acceptance,
+            self.elapsed,
+        )
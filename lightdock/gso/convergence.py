@@ -0,0 +1,51 @@
+"""Detection of the convergence of a swarm"""
+
+from lightdock.constants import (
+    DEFAULT_CONVERGENCE_SCORING,
+    DEFAULT_CONVERGENCE_LUCIFERIN,
+    DEFAULT_CONVERGENCE_MOVING,
+)
+
+
+class ConvergenceMonitor(object):
+    """A swarm has converged when, for patience consecutive steps, its best scoring and
+    its mean luciferin have not changed more than their tolerances and the fraction of
+    glowworms which have moved is not larger than max_moving.
+    """
+
+    def __init__(
+        self,
+        patience,
+        scoring_tolerance=DEFAULT_CONVERGENCE_SCORING,
+        luciferin_tolerance=DEFAULT_CONVERGENCE_LUCIFERIN,
+        max_moving=DEFAULT_CONVERGENCE_MOVING,
+    ):
+        self.patience = patience
+        self.scoring_tolerance = scoring_tolerance
+        self.luciferin_tolerance = luciferin_tolerance
+        self.max_moving = max_moving
+        self.stalled_steps = 0
+        self.best_scoring = None
+        self.mean_luciferin = None
+
+    def update(self, swarm):
+        """Checks swarm after a step of the algorithm and returns True if converged"""
+        num_glowworms = swarm.get_size()
+        best_scoring = max(glowworm.scoring for glowworm in swarm.glowworms)
+        mean_luciferin = (
+            sum(glowworm.luciferin for glowworm in swarm.glowworms) / num_glowworms
+        )
+        moving = sum(glowworm.moved for glowworm in swarm.glowworms) / num_glowworms
+
+        if (
+            self.best_scoring is not None
+            and abs(best_scoring - self.best_scoring) <= self.scoring_tolerance
+            and abs(mean_luciferin - self.mean_luciferin) <= self.luciferin_tolerance
+            and moving <= self.max_moving
+        ):
+            self.stalled_steps += 1
+        else:
+            self.stalled_steps = 0
+        self.best_scoring = best_scoring
+        self.mean_luciferin = mean_luciferin
+        return self.stalled_steps >= self.patience
@@ -47,13 +47,22 @@ class Glowworm(object):
         """Compares if this glowworm is not other"""
         return self.id != other.id
 
-    def compute_luciferin(self):
-        """Updates luciferin of the current glowworm and returns its value"""
+    def compute_luciferin(self, conformer_swap=None):
+        """Updates luciferin of the current glowworm and returns its value.
+
+        If conformer_swap is given, trial conformers are scored and maybe swapped.
+        """
         if self.moved or self.step == 0:
-            self.scoring = sum(
-                landscape_position.evaluate_objective_function()
-                for landscape_position in self.landscape_positions
-            )
+            if conformer_swap:
+                self.scoring = sum(
+                    conformer_swap.evaluate(landscape_position)
+                    for landscape_position in self.landscape_positions
+                )
+            else:
+                self.scoring = sum(
+                    landscape_position.evaluate_objective_function()
+                    for landscape_position in self.landscape_positions
+                )
         self.luciferin = (1.0 - self.rho) * self.luciferin + self.gamma * self.scoring
         self.step += 1
         return self.luciferin
@@ -106,11 +115,14 @@ class Glowworm(object):
                         other.landscape_positions[scoring_id]
                     )
 
-    def update_conformers(self, other, random_number=None):
+    def update_conformers(self, other, random_number=None, conformer_swap=None):
         """Updates the conformers structures for receptor and ligand"""
         for scoring_id in range(len(self.landscape_positions)):
             self.landscape_positions[scoring_id].update_conformers(
-                other.landscape_positions[scoring_id], random_number, self.scoring
+                other.landscape_positions[scoring_id],
+                random_number,
+                self.scoring,
+                conformer_swap,
             )
 
     def update_vision_range(self):
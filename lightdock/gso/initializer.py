@@ -1,5 +1,6 @@
 """Module to generate initial populations of glowworms agents used by the GSO algorithm"""
 
+import numpy as np
 from lightdock.gso.swarm import Swarm
 from lightdock.gso.coordinates import CoordinatesFileReader, Coordinates
 from lightdock.error.lightdock_errors import GSOCoordinatesError
@@ -54,18 +55,21 @@ class RandomInitializer(Initializer):
         """Generates a list of landscape positions that have been read
         from initial_population_file.
         """
-        positions = []
-        for index in range(self.number_of_glowworms):
-            coordinates = []
-            for dimension in range(self.bounding_box.dimension):
-                bound = self.bounding_box.get_boundary_of_dimension(dimension)
-                coord = self.random_number_generator(
-                    bound.lower_limit, bound.upper_limit
-                )
-                coordinates.append(coord)
-            positions.append(
-                LandscapePosition(self.objective_functions[0], Coordinates(coordinates))
-            )
+        dimension = self.bounding_box.dimension
+        bounds = [
+            self.bounding_box.get_boundary_of_dimension(d) for d in range(dimension)
+        ]
+        lower_limits = np.array([bound.lower_limit for bound in bounds])
+        upper_limits = np.array([bound.upper_limit for bound in bounds])
+        # Numbers are drawn glowworm by glowworm, dimension by dimension
+        random_numbers = self.random_number_generator.take(
+            self.number_of_glowworms * dimension
+        ).reshape(self.number_of_glowworms, dimension)
+        all_coordinates = lower_limits + (upper_limits - lower_limits) * random_numbers
+        positions = [
+            LandscapePosition(self.objective_functions[0], Coordinates(coordinates))
+            for coordinates in all_coordinates.tolist()
+        ]
         return [positions]
 
 
@@ -165,16 +169,20 @@ class LightdockFromFileInitializer(Initializer):
                 "Number of coordinates read and number of glowworms does not correspond"
             )
 
+        num_receptors = len(self.adapters[0].receptor_model)
+        num_ligands = len(self.adapters[0].ligand_model)
         positions = []
         for i, adapter in enumerate(self.adapters):
             positions.append([])
+            # Same numbers as a receptor and a ligand randint for each glowworm
+            random_numbers = self.random_number_generator.take(
+                2 * self.number_of_glowworms
+            ).reshape(self.number_of_glowworms, 2)
+            receptor_indexes = (random_numbers[:, 0] * num_receptors).astype(int)
+            ligand_indexes = (random_numbers[:, 1] * num_ligands).astype(int)
             for index in range(self.number_of_glowworms):
-                receptor_index = self.random_number_generator.randint(
-                    0, len(self.adapters[0].receptor_model) - 1
-                )
-                ligand_index = self.random_number_generator.randint(
-                    0, len(self.adapters[0].ligand_model) - 1
-                )
+                receptor_index = int(receptor_indexes[index])
+                ligand_index = int(ligand_indexes[index])
                 positions[i].append(
                     DockingLandscapePosition(
                         self.objective_functions[i],
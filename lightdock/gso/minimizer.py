@@ -0,0 +1,127 @@
+"""Local minimization of the best glowworms of a swarm"""
+
+import heapq
+import time
+from operator import attrgetter
+import numpy as np
+from lightdock.constants import (
+    DEFAULT_MINIMIZATION_TOP,
+    DEFAULT_MINIMIZATION_BUDGET,
+    DEFAULT_MINIMIZATION_TRANSLATION,
+    DEFAULT_MINIMIZATION_ROTATION,
+    DEFAULT_MINIMIZATION_NMODES,
+)
+from lightdock.mathutil.cython.quaternion import Quaternion
+
+
+class PatternSearch(object):
+    """Derivative-free compass search on the optimization vector of docking glowworms.
+
+    At each iteration, a glowworm is moved one step forward and one step backward along
+    each of its degrees of freedom: translation axes, rotations around the axes and
+    normal modes extents. The poses of all these candidates are built at once, then
+    scored one by one, and the best one is kept if it improves the scoring, otherwise
+    steps are halved.
+
+    The top glowworms by scoring are refined at each step of the simulation, sharing a
+    budget of scoring evaluations.
+    """
+
+    def __init__(
+        self,
+        top=DEFAULT_MINIMIZATION_TOP,
+        budget=DEFAULT_MINIMIZATION_BUDGET,
+        translation_step=DEFAULT_MINIMIZATION_TRANSLATION,
+        rotation_step=DEFAULT_MINIMIZATION_ROTATION,
+        nmodes_step=DEFAULT_MINIMIZATION_NMODES,
+        min_scale=1.0 / 16.0,
+    ):
+        self.top = top
+        self.budget = budget
+        self.translation_step = translation_step
+        self.rotation_step = rotation_step
+        self.nmodes_step = nmodes_step
+        self.min_scale = min_scale
+        # Counters
+        self.refined = 0
+        self.improved = 0
+        self.evaluations = 0
+        self.elapsed = 0.0
+
+    def get_candidates(self, vector, scale):
+        """Vectors one step away from vector along each degree of freedom"""
+        num_extents = len(vector) - 7
+        candidates = np.repeat(vector[np.newaxis], 2 * (6 + num_extents), axis=0)
+        signs = np.array([1.0, -1.0])
+        for axis in range(3):
+            candidates[2 * axis : 2 * axis + 2, axis] += (
+                signs * self.translation_step * scale
+            )
+        # Small rotations around each axis, applied after the current one
+        rotation = Quaternion(*vector[3:7])
+        half_angle = 0.5 * self.rotation_step * scale
+        for axis in range(3):
+            for sign_id, sign in enumerate(signs):
+                delta = [np.cos(half_angle), 0.0, 0.0, 0.0]
+                delta[axis + 1] = sign * np.sin(half_angle)
+                q = Quaternion(*delta) * rotation
+                candidates[6 + 2 * axis + sign_id, 3:7] = [q.w, q.x, q.y, q.z]
+        for extent in range(num_extents):
+            candidates[12 + 2 * extent : 14 + 2 * extent, 7 + extent] += (
+                signs * self.nmodes_step * scale
+            )
+        return candidates
+
+    def minimize(self, glowworms):
+        """Refines the glowworms with the best scoring"""
+        start = time.perf_counter()
+        best_glowworms = heapq.nlargest(self.top, glowworms, key=attrgetter("scoring"))
+        budget = self.budget
+        for i, glowworm in enumerate(best_glowworms):
+            # Evaluations not used by a glowworm are left to the next ones
+            budget -= self.minimize_glowworm(
+                glowworm, budget // (len(best_glowworms) - i)
+            )
+        self.elapsed += time.perf_counter() - start
+
+    def minimize_glowworm(self, glowworm, budget):
+        """Refines a glowworm with up to budget evaluations and returns the ones used"""
+        positions = glowworm.landscape_positions
+        vector = positions[0].get_optimization_vector()
+        scoring = glowworm.scoring
+        num_candidates = 2 * (len(vector) - 1)
+        # The new position is scored again at the end to update its poses
+        budget -= len(positions)
+        scale = 1.0
+        evaluations = 0
+        improved = False
+        while scale >= self.min_scale and evaluations + num_candidates <= budget:
+            candidates = self.get_candidates(vector, scale)
+            scores = sum(position.score_vectors(candidates) for position in positions)
+            evaluations += num_candidates
+            best = np.argmax(scores)
+            if scores[best] > scoring:
+                vector = candidates[best]
+                scoring = scores[best]
+                improved = True
+            else:
+                scale *= 0.5
+
+        if improved:
+            for position in positions:
+                position.update_landscape_position(vector.copy())
+            glowworm.scoring = sum(
+                position.evaluate_objective_function() for position in positions
+            )
+            evaluations += len(positions)
+            self.improved += 1
+        self.refined += 1
+        self.evaluations += evaluations
+        return evaluations
+
+    def report(self):
+        """Counters of the minimization"""
+        return (
+            "Local minimization: %d glowworms refined, %d improved, %d evaluations, "
+            "%.2f s" % (self.refined, self.improved, self.evaluations, self.elapsed)
+        )
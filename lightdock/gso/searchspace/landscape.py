@@ -1,7 +1,6 @@
 """Objective function landscape representations"""
 
 import numpy as np
-from scipy.optimize import fmin_powell
 
 from lightdock.constants import (
     DEFAULT_STEP_SIZE,
@@ -9,6 +8,29 @@ from lightdock.constants import (
     DEFAULT_ROTATION_STEP,
 )
 from lightdock.mathutil.cython.quaternion import Quaternion
+from lightdock.structure.space import SpacePoints
+
+
+def quaternion_matrices(quaternions):
+    """Rotation matrices of an array of (w, x, y, z) quaternions, normalized first"""
+    quaternions = quaternions / np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+    w, x, y, z = quaternions.T
+    matrices = np.empty((len(quaternions), 3, 3))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y - w * z)
+    matrices[:, 0, 2] = 2.0 * (x * z + w * y)
+    matrices[:, 1, 0] = 2.0 * (x * y + w * z)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    matrices[:, 1, 2] = 2.0 * (y * z - w * x)
+    matrices[:, 2, 0] = 2.0 * (x * z - w * y)
+    matrices[:, 2, 1] = 2.0 * (y * z + w * x)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return matrices
+
+
+def get_mask(model):
+    """Atoms moved by the normal modes of model, all of them if it has no mask"""
+    return slice(None) if model.nm_mask is None else model.nm_mask
 
 
 class LandscapePosition(object):
@@ -93,7 +115,9 @@ class LandscapePosition(object):
             self += delta_x
         return self
 
-    def update_conformers(self, other, rnd_generator=None, current_scoring=0):
+    def update_conformers(
+        self, other, rnd_generator=None, current_scoring=0, conformer_swap=None
+    ):
         """Compatibility with GSO test function tests"""
         pass
 
@@ -147,10 +171,12 @@ class DockingLandscapePosition(LandscapePosition):
             if self.num_lig_nmodes > 0
             else np.array([])
         )
-        # This part is important, each position needs to retain its own pose coordinates
-        self.receptor_pose = self.receptor.coordinates[self.receptor_id].clone()
-        self.ligand_pose = self.ligand.coordinates[self.ligand_id].clone()
+        # Poses are views of the structures until the position is evaluated
+        self.receptor_pose = self.receptor.coordinates[self.receptor_id]
+        self.ligand_pose = self.ligand.coordinates[self.ligand_id]
         self.ligand_reference_points = self.ligand.reference_points.clone()
+        # Receptor and ligand structures to try on the next evaluation
+        self.trial_conformers = None
 
     def clone(self):
         """Creates a copy of this landscape position"""
@@ -183,12 +209,12 @@ class DockingLandscapePosition(LandscapePosition):
         self, receptor_structure_id=None, ligand_structure_id=None
     ):
         """Evaluates the objective function at the given coordinates"""
-        # Copy of the coordinates
         if receptor_structure_id:
             rec_id = receptor_structure_id
         else:
             rec_id = self.receptor_id
-        self.receptor_pose = self.receptor.coordinates[rec_id].clone()
+        # The receptor is not moved, its pose is only copied if normal modes are used
+        self.receptor_pose = self.receptor.coordinates[rec_id]
         if ligand_structure_id:
             lig_id = ligand_structure_id
         else:
@@ -198,6 +224,7 @@ class DockingLandscapePosition(LandscapePosition):
 
         # Use normal modes if provided:
         if self.num_rec_nmodes > 0:
+            self.receptor_pose = self.receptor_pose.clone()
             for i in range(self.num_rec_nmodes):
                 # Only atoms as True in the mask are moved
                 self.receptor_pose.coordinates[self.receptor.nm_mask, :] += (
@@ -275,16 +302,35 @@ class DockingLandscapePosition(LandscapePosition):
                     self.lig_extent += delta_x
         return self
 
-    def update_conformers(self, other, rnd_generator, current_scoring):
-        """Updates the structures for receptor and ligand"""
+    def update_conformers(
+        self, other, rnd_generator, current_scoring, conformer_swap=None
+    ):
+        """Draws the structures for receptor and ligand to try after moving"""
         if self != other:
-            _ = rnd_generator.randint(upper_limit=(len(self.receptor) - 1))
-            _ = rnd_generator.randint(upper_limit=(len(self.ligand) - 1))
-            # Experimental, disabled
-            # scoring = self.evaluate_objective_function(random_receptor_id, random_ligand_id)
-            # if scoring > current_scoring:
-            #    self.receptor_id = random_receptor_id
-            #    self.ligand_id = random_ligand_id
+            if conformer_swap:
+                conformer_swap.propose(self, rnd_generator)
+            else:
+                # Random receptor and ligand conformers, not used but drawn to keep
+                # the sequence of random numbers
+                rnd_generator.skip(2)
+
+    def swap_conformers(self, receptor_id, ligand_id, scoring):
+        """Scores the current pose using the receptor_id and ligand_id structures, which
+        replace the current ones if they improve scoring. Returns the new scoring.
+        """
+        receptor_poses, ligand_poses = self.get_poses(
+            self.get_optimization_vector(), receptor_id, ligand_id
+        )
+        trial_scoring = self.objective_function(
+            self.receptor, receptor_poses[0], self.ligand, ligand_poses[0]
+        )
+        if trial_scoring > scoring:
+            self.receptor_id = receptor_id
+            self.ligand_id = ligand_id
+            self.receptor_pose = receptor_poses[0]
+            self.ligand_pose = ligand_poses[0]
+            return trial_scoring
+        return scoring
 
     @staticmethod
     def _calculate_scoring(optimization_vector, self):
@@ -315,6 +361,79 @@ class DockingLandscapePosition(LandscapePosition):
             else np.array([])
         )
 
+    def get_optimization_vector(self):
+        """Translation, rotation and normal modes extents as a single vector"""
+        q = self.rotation
+        return np.concatenate(
+            (self.translation, [q.w, q.x, q.y, q.z], self.rec_extent, self.lig_extent)
+        )
+
+    def get_poses(self, vectors, receptor_id=None, ligand_id=None):
+        """Receptor and ligand poses of each one of the optimization vectors.
+
+        The poses of all the vectors are built at once from the original structures,
+        the current ones if receptor_id or ligand_id are not given, and the receptor
+        pose is shared if the receptor has no normal modes.
+        """
+        if receptor_id is None:
+            receptor_id = self.receptor_id
+        if ligand_id is None:
+            ligand_id = self.ligand_id
+        vectors = np.atleast_2d(vectors)
+        num_vectors = vectors.shape[0]
+        translations = vectors[:, :3]
+        rotations = quaternion_matrices(vectors[:, 3:7])
+
+        receptor_coordinates = self.receptor.coordinates[receptor_id].coordinates
+        if self.num_rec_nmodes > 0:
+            receptor_coordinates = np.repeat(
+                receptor_coordinates[np.newaxis], num_vectors, axis=0
+            )
+            receptor_coordinates[:, get_mask(self.receptor), :] += np.tensordot(
+                vectors[:, 7 : 7 + self.num_rec_nmodes],
+                self.receptor.n_modes[: self.num_rec_nmodes],
+                axes=1,
+            )
+            receptor_poses = [
+                SpacePoints.from_array(coordinates)
+                for coordinates in receptor_coordinates
+            ]
+        else:
+            receptor_pose = SpacePoints.from_array(receptor_coordinates)
+            receptor_poses = [receptor_pose] * num_vectors
+
+        ligand_coordinates = self.ligand.coordinates[ligand_id].coordinates
+        if self.num_lig_nmodes > 0:
+            ligand_coordinates = np.repeat(
+                ligand_coordinates[np.newaxis], num_vectors, axis=0
+            )
+            ligand_coordinates[:, get_mask(self.ligand), :] += np.tensordot(
+                vectors[:, -self.num_lig_nmodes :],
+                self.ligand.n_modes[: self.num_lig_nmodes],
+                axes=1,
+            )
+        # Rotate first, then translate
+        ligand_coordinates = (
+            np.matmul(ligand_coordinates, rotations.transpose(0, 2, 1))
+            + translations[:, np.newaxis, :]
+        )
+        ligand_poses = [
+            SpacePoints.from_array(coordinates) for coordinates in ligand_coordinates
+        ]
+        return receptor_poses, ligand_poses
+
+    def score_vectors(self, vectors):
+        """Scores each one of the optimization vectors without moving this position"""
+        receptor_poses, ligand_poses = self.get_poses(vectors)
+        return np.array(
+            [
+                self.objective_function(
+                    self.receptor, receptor_pose, self.ligand, ligand_pose
+                )
+                for receptor_pose, ligand_pose in zip(receptor_poses, ligand_poses)
+            ]
+        )
+
     def minimize(self):
         """Returns the new scoring after minimizing this landscape position using a local non-grandient
         minimization method.
@@ -328,6 +447,8 @@ class DockingLandscapePosition(LandscapePosition):
         optimization_vector = np.array(optimization_vector)
 
         # Minimize using Powell algorythm
+        from scipy.optimize import fmin_powell
+
         result = fmin_powell(
             DockingLandscapePosition._calculate_scoring,
             optimization_vector,
@@ -21,23 +21,25 @@ class Swarm(object):
             landscape_positions[0][0].__class__.__name__ != "LandscapePosition"
         )
 
-    def update_luciferin(self):
+    def update_luciferin(self, conformer_swap=None):
         """Updates luciferin of each glowworm"""
         for glowworm in self.glowworms:
-            glowworm.compute_luciferin()
+            glowworm.compute_luciferin(conformer_swap)
 
-    def movement_phase(self, rnd_generator):
+    def movement_phase(self, rnd_generator, conformer_swap=None):
         """Updates luciferin and probabilities of each glowworm to move if required
-        following GSO algorithm.
+        following GSO algorithm. Trial conformers are drawn if conformer_swap is given.
         """
         selected = []
         positions = {}
         num_glowworms = self.get_size()
+        # One number per glowworm, drawn in order
+        random_numbers = rnd_generator.take(num_glowworms).tolist()
         for i in range(num_glowworms):
             glowworm = self.glowworms[i]
             glowworm.search_neighbors(self.glowworms)
             glowworm.compute_probability_moving_toward_neighbor()
-            selected.append(glowworm.select_random_neighbor(rnd_generator()))
+            selected.append(glowworm.select_random_neighbor(random_numbers[i]))
             positions[i] = [
                 landscape_position.clone()
                 for landscape_position in selected[-1].landscape_positions
@@ -48,20 +50,27 @@ class Swarm(object):
             neighbor = selected[i]
             position = positions[i]
             glowworm.move(neighbor, position)
-            glowworm.update_conformers(neighbor, rnd_generator)
+            glowworm.update_conformers(neighbor, rnd_generator, conformer_swap)
             glowworm.update_vision_range()
 
-    def minimize_best(self):
-        """Minimizes the glowworm with better energy using a local non-gradient minimization method"""
-        best_glowworm = max(self.glowworms, key=attrgetter("scoring"))
-        best_glowworm.minimize()
+    def minimize_best(self, minimizer=None):
+        """Minimizes the glowworms with better energy using a local non-gradient
+        minimization method. Without minimizer, only the best one is minimized (Powell).
+        """
+        if minimizer:
+            minimizer.minimize(self.glowworms)
+        else:
+            best_glowworm = max(self.glowworms, key=attrgetter("scoring"))
+            best_glowworm.minimize()
 
     def get_size(self):
         """Gets the population size of this swarm of glowworms"""
         return len(self.glowworms)
 
-    def save(self, step, destination_path, file_name=""):
-        """Saves actual population status to a file"""
+    def save(self, step, destination_path, file_name="", comment=""):
+        """Saves actual population status to a file. A comment line is added at the end
+        if given.
+        """
         if file_name:
             dest_file_name = Path(destination_path) / file_name
         else:
@@ -69,6 +78,8 @@ class Swarm(object):
 
         dest_file = open(dest_file_name, "w")
         dest_file.write(str(self))
+        if comment:
+            dest_file.write(f"#{comment}\n")
         dest_file.close()
 
     def __repr__(self):
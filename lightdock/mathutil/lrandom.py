@@ -2,33 +2,79 @@
 
 import random
 import os
+from itertools import islice
 import numpy as np
 from lightdock.error.lightdock_errors import RandomNumberError
 
 
+# Numbers generated at once by MTGenerator
+DEFAULT_RANDOM_BLOCK_SIZE = 4096
+
+
 class RandomNumberGenerator(object):
     """Random number generator interface"""
 
     def __call__(self):
         raise NotImplementedError()
 
+    def take(self, size, lower_limit=0.0, upper_limit=1.0):
+        """Next size numbers of the sequence as an array"""
+        numbers = np.array([self() for _ in range(size)], dtype=float)
+        return lower_limit + (upper_limit - lower_limit) * numbers
+
+    def skip(self, size):
+        """Discards the next size numbers of the sequence"""
+        for _ in range(size):
+            self()
+
 
 class MTGenerator(RandomNumberGenerator):
     """Python uses the Mersenne Twister as the core generator.
     It produces 53-bit precision floats and has a period of 2**19937-1
+
+    The state of a Python random.Random seeded with seed is loaded into a NumPy
+    RandomState, which produces the same 53-bit floats, so numbers are generated in
+    blocks of block_size and the sequence is the same as the one of random.Random.
     """
 
-    def __init__(self, seed):
+    def __init__(self, seed, block_size=DEFAULT_RANDOM_BLOCK_SIZE):
         self.seed = seed
-        self.random = random.Random()
-        self.random.seed(self.seed, version=1)
+        self.block_size = block_size
+        python_random = random.Random()
+        python_random.seed(self.seed, version=1)
+        _, state, _ = python_random.getstate()
+        self.random = np.random.RandomState()
+        self.random.set_state(
+            ("MT19937", np.array(state[:-1], dtype=np.uint32), state[-1])
+        )
+        self._numbers = iter(())
+
+    def _next_block(self):
+        self._numbers = iter(self.random.random_sample(self.block_size).tolist())
 
     def __call__(self, lower_limit=0.0, upper_limit=1.0):
-        return self.random.uniform(lower_limit, upper_limit)
+        try:
+            number = next(self._numbers)
+        except StopIteration:
+            self._next_block()
+            number = next(self._numbers)
+        return lower_limit + (upper_limit - lower_limit) * number
 
     def randint(self, lower_limit=0, upper_limit=9):
         return int(self() * (upper_limit + 1)) + lower_limit
 
+    def take(self, size, lower_limit=0.0, upper_limit=1.0):
+        """Next size numbers of the sequence as an array"""
+        numbers = list(islice(self._numbers, size))
+        while len(numbers) < size:
+            self._next_block()
+            numbers.extend(islice(self._numbers, size - len(numbers)))
+        return lower_limit + (upper_limit - lower_limit) * np.array(numbers)
+
+    def skip(self, size):
+        """Discards the next size numbers of the sequence"""
+        self.take(size)
+
 
 class RandomNumberGeneratorFromFile(RandomNumberGenerator):
     """Class to interact with a previously generated list of random numbers
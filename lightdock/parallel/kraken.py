@@ -1,7 +1,10 @@
 """Module in charge of parallelizing the execution of the GSO algorithm in different clusters."""
 
-from multiprocessing import Process, cpu_count
+import math
+import traceback
+from multiprocessing import Process, Pipe, cpu_count
 import cProfile
+from lightdock.error.lightdock_errors import TentacleError
 from lightdock.util.logger import LoggingManager
 
 
@@ -26,6 +29,51 @@ class Tentacle(Process):
         self.log.info("folding tentacle %s" % self.name)
 
 
+class RoundTentacle(Tentacle):
+    """A tentacle which keeps its tasks between the rounds of a simulation.
+
+    For each round, it receives from the Kraken the step to reach and the IDs of the
+    surviving tasks, prunes the rest and answers with the summary of the tasks run. If a
+    task fails, the traceback is sent instead and the tentacle stops.
+    """
+
+    def __init__(self, tasks, connection, profiling=False):
+        super(RoundTentacle, self).__init__(tasks, profiling)
+        self.connection = connection
+
+    def run(self):
+        if not self.profiling:
+            self.serve()
+        else:
+            cProfile.runctx(
+                "self.serve()", globals(), locals(), "process_%s.out" % self.name
+            )
+        self.log.info("folding tentacle %s" % self.name)
+
+    def serve(self):
+        """Runs rounds until the Kraken sends None"""
+        while True:
+            message = self.connection.recv()
+            if message is None:
+                break
+            stop_step, survivors = message
+            summaries = {}
+            try:
+                for task in self.tasks:
+                    if task.finished:
+                        continue
+                    if task.id in survivors:
+                        task.run(stop_step)
+                        summaries[task.id] = task.summary()
+                    else:
+                        task.prune()
+            except Exception:
+                self.log.error("Swarm failed in tentacle %s" % self.name)
+                self.connection.send((None, traceback.format_exc()))
+                break
+            self.connection.send((summaries, None))
+
+
 class Kraken(object):
     """Below the thunders of the upper deep;
     Far, far beneath in the abysmal sea,
@@ -62,11 +110,14 @@ class Kraken(object):
         ]
 
         for i in range(self.num_processes):
-            tentacle = Tentacle(tentacle_tasks[i], profiling)
+            tentacle = self._create_tentacle(tentacle_tasks[i], profiling)
             self.tentacles.append(tentacle)
 
         self.log.info("%d ships ready to be smashed" % self.num_tasks)
 
+    def _create_tentacle(self, tasks, profiling):
+        return Tentacle(tasks, profiling)
+
     def release(self):
         """Unleash the wrath of this monster"""
         self.log.info("Release the Kraken!")
@@ -87,3 +138,101 @@ class Kraken(object):
         for tentacle in self.tentacles:
             tentacle.terminate()
         self.log.warning("Kraken sunk to the bottom of the ocean")
+
+
+class HalvingKraken(Kraken):
+    """A Kraken which prunes the worst swarms of a simulation (successive halving).
+
+    Swarms are run in rounds of round_steps steps. After each round, the swarms still
+    running are ranked by their best or median scoring and the given fraction of them
+    is pruned, saving their current state as the one of the last step. Tasks stay in
+    the same tentacle for the whole simulation.
+    """
+
+    def __init__(
+        self,
+        tasks,
+        num_cpus=0,
+        profiling=False,
+        round_steps=10,
+        fraction=0.5,
+        criterion="best",
+    ):
+        self.connections = []
+        self.tentacle_connections = []
+        super(HalvingKraken, self).__init__(tasks, num_cpus, profiling)
+        self.round_steps = round_steps
+        self.fraction = fraction
+        self.criterion = criterion
+
+    def _create_tentacle(self, tasks, profiling):
+        connection, tentacle_connection = Pipe()
+        self.connections.append(connection)
+        self.tentacle_connections.append(tentacle_connection)
+        return RoundTentacle(tasks, tentacle_connection, profiling)
+
+    def select(self, summaries):
+        """IDs of the swarms surviving a round given their summaries"""
+        ranking = sorted(
+            summaries,
+            key=lambda task_id: getattr(summaries[task_id], self.criterion),
+            reverse=True,
+        )
+        num_pruned = math.floor(len(ranking) * self.fraction)
+        return set(ranking[: max(1, len(ranking) - num_pruned)])
+
+    def gather(self):
+        """Summaries of the round sent by the tentacles"""
+        summaries = {}
+        for connection in self.connections:
+            try:
+                tentacle_summaries, error = connection.recv()
+            except EOFError:
+                raise TentacleError("A tentacle died in the middle of a round")
+            if error:
+                raise TentacleError("A swarm failed in a tentacle:\n%s" % error)
+            summaries.update(tentacle_summaries)
+        return summaries
+
+    def release(self):
+        """Unleash the wrath of this monster, round by round"""
+        self.log.info("Release the Kraken!")
+        for tentacle in self.tentacles:
+            tentacle.start()
+        # Only tentacles keep their end, so a dead one is noticed when receiving
+        for connection in self.tentacle_connections:
+            connection.close()
+
+        steps = max(task.steps for task in self.tasks)
+        survivors = {task.id for task in self.tasks}
+        stop_step = 0
+        while survivors:
+            stop_step = min(stop_step + self.round_steps, steps)
+            try:
+                for connection in self.connections:
+                    connection.send((stop_step, survivors))
+                summaries = self.gather()
+            except (OSError, TentacleError):
+                self.sink()
+                raise
+            running = {
+                task_id: summary
+                for task_id, summary in summaries.items()
+                if not summary.finished
+            }
+            survivors = self.select(running) if running else set()
+            self.log.info(
+                "Step %d: %d swarms continue, %d pruned"
+                % (stop_step, len(survivors), len(running) - len(survivors))
+            )
+
+        for connection in self.connections:
+            connection.send(None)
+        for tentacle in self.tentacles:
+            tentacle.join()
+
+        self.log.info("%d ships destroyed" % self.num_tasks)
+
+        reports = [task.gso.report() for task in self.tasks]
+
+        return reports
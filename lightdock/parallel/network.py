@@ -0,0 +1,292 @@
+"""Execution of the swarms of a simulation by workers connected through TCP.
+
+A coordinator serves the command line of the simulation and the IDs of the swarms to
+simulate. Workers, in the same or in other hosts, connect to it, pull swarms one by one
+and send back their results. Workers send heartbeats while simulating, so swarms held
+by a dead worker are served again to the other ones.
+
+Messages are JSON objects preceded by their length.
+"""
+
+import json
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import deque
+from lightdock.constants import DEFAULT_HEARTBEAT_INTERVAL, DEFAULT_WORKER_TIMEOUT
+from lightdock.util.logger import LoggingManager
+
+
+log = LoggingManager.get_logger("network")
+
+_HEADER = struct.Struct("!I")
+
+
+def send_message(connection, message):
+    data = json.dumps(message).encode()
+    connection.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _receive_bytes(connection, size):
+    data = b""
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            if data:
+                raise ConnectionError("Connection closed in the middle of a message")
+            return None
+        data += chunk
+    return data
+
+
+def receive_message(connection):
+    """Next message of connection, None if it has been closed"""
+    header = _receive_bytes(connection, _HEADER.size)
+    if header is None:
+        return None
+    data = _receive_bytes(connection, _HEADER.unpack(header)[0])
+    if data is None:
+        raise ConnectionError("Connection closed in the middle of a message")
+    return json.loads(data)
+
+
+class _WorkerHandler(socketserver.BaseRequestHandler):
+    """Attends the messages of a connected worker"""
+
+    def handle(self):
+        coordinator = self.server.coordinator
+        worker_id = coordinator.register(self.request)
+        try:
+            while True:
+                message = receive_message(self.request)
+                if message is None:
+                    break
+                coordinator.touch(worker_id)
+                if message["type"] == "hello":
+                    send_message(
+                        self.request,
+                        {
+                            "type": "configuration",
+                            "worker": worker_id,
+                            "arguments": coordinator.arguments,
+                        },
+                    )
+                elif message["type"] == "request":
+                    send_message(self.request, coordinator.next_swarm(worker_id))
+                elif message["type"] == "completed":
+                    coordinator.complete(worker_id, message["swarm"], message["result"])
+        except (OSError, ValueError) as e:
+            log.warning("Connection with worker %d lost: %s" % (worker_id, e))
+        finally:
+            coordinator.release(worker_id)
+
+
+class _CoordinatorServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, coordinator):
+        self.coordinator = coordinator
+        super(_CoordinatorServer, self).__init__(address, _WorkerHandler)
+
+
+class SwarmCoordinator(object):
+    """Serves swarm_ids to the workers until all of them are completed.
+
+    arguments is the command line of the simulation sent to the workers. on_completed,
+    if given, is called with the ID and result of each completed swarm.
+    """
+
+    def __init__(
+        self,
+        swarm_ids,
+        arguments,
+        host="",
+        port=0,
+        timeout=DEFAULT_WORKER_TIMEOUT,
+        on_completed=None,
+    ):
+        self.arguments = list(arguments)
+        self.pending = deque(swarm_ids)
+        self.num_swarms = len(self.pending)
+        # Swarm ID -> worker ID
+        self.assigned = {}
+        # Swarm ID -> result
+        self.results = {}
+        # Worker ID -> [connection, last time seen]
+        self.workers = {}
+        self.num_workers = 0
+        self.timeout = timeout
+        self.on_completed = on_completed
+        self.condition = threading.Condition()
+        self.server = _CoordinatorServer((host, port), self)
+        self.address = self.server.server_address[:2]
+
+    @property
+    def finished(self):
+        return len(self.results) == self.num_swarms
+
+    def register(self, connection):
+        with self.condition:
+            worker_id = self.num_workers
+            self.num_workers += 1
+            self.workers[worker_id] = [connection, time.monotonic()]
+        host, port = connection.getpeername()[:2]
+        log.info("Worker %d connected from %s:%d" % (worker_id, host, port))
+        return worker_id
+
+    def touch(self, worker_id):
+        with self.condition:
+            if worker_id in self.workers:
+                self.workers[worker_id][1] = time.monotonic()
+
+    def next_swarm(self, worker_id):
+        """Message with the next swarm for the worker"""
+        with self.condition:
+            if self.finished:
+                return {"type": "done"}
+            if not self.pending or worker_id not in self.workers:
+                # Swarms may be served again if a worker dies
+                return {"type": "wait", "seconds": min(1.0, self.timeout / 4.0)}
+            swarm_id = self.pending.popleft()
+            self.assigned[swarm_id] = worker_id
+        log.info("Swarm %d sent to worker %d" % (swarm_id, worker_id))
+        return {"type": "swarm", "swarm": swarm_id}
+
+    def complete(self, worker_id, swarm_id, result):
+        with self.condition:
+            if swarm_id in self.results:
+                return
+            self.results[swarm_id] = result
+            self.assigned.pop(swarm_id, None)
+            if swarm_id in self.pending:
+                self.pending.remove(swarm_id)
+        log.info("Swarm %d completed by worker %d" % (swarm_id, worker_id))
+        if self.on_completed:
+            self.on_completed(swarm_id, result)
+        with self.condition:
+            self.condition.notify_all()
+
+    def release(self, worker_id):
+        """Serves again the swarms held by a worker which is gone"""
+        with self.condition:
+            if self.workers.pop(worker_id, None) is None:
+                return
+            swarm_ids = [
+                swarm_id
+                for swarm_id, holder in self.assigned.items()
+                if holder == worker_id
+            ]
+            for swarm_id in swarm_ids:
+                del self.assigned[swarm_id]
+                self.pending.appendleft(swarm_id)
+        if swarm_ids:
+            log.warning(
+                "Worker %d gone, swarms %s queued again"
+                % (worker_id, ", ".join(str(swarm_id) for swarm_id in swarm_ids))
+            )
+
+    def check_workers(self):
+        """Releases the workers without heartbeats for longer than the timeout"""
+        now = time.monotonic()
+        with self.condition:
+            dead = [
+                (worker_id, connection)
+                for worker_id, (connection, last_seen) in self.workers.items()
+                if now - last_seen > self.timeout
+            ]
+        for worker_id, connection in dead:
+            log.warning("Worker %d not responding" % worker_id)
+            self.release(worker_id)
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def serve(self):
+        """Serves swarms until all of them are completed and returns their results"""
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        log.info("Coordinator listening on %s:%d" % self.address)
+        try:
+            while True:
+                with self.condition:
+                    if self.finished:
+                        break
+                    self.condition.wait(self.timeout / 4.0)
+                self.check_workers()
+        finally:
+            self.server.shutdown()
+            self.server.server_close()
+        return self.results
+
+
+class SwarmWorker(object):
+    """Simulates the swarms served by the coordinator at host:port"""
+
+    def __init__(self, host, port, heartbeat=DEFAULT_HEARTBEAT_INTERVAL):
+        self.host = host
+        self.port = port
+        self.heartbeat = heartbeat
+        self.connection = None
+        self.send_lock = threading.Lock()
+        self.stop = threading.Event()
+        self.heartbeats = None
+        self.id = None
+
+    def send(self, message):
+        with self.send_lock:
+            send_message(self.connection, message)
+
+    def connect(self):
+        """Connects to the coordinator and returns the command line of the simulation.
+
+        Heartbeats are sent from this moment, as preparing the simulation may be slow.
+        """
+        self.connection = socket.create_connection((self.host, self.port))
+        self.send({"type": "hello"})
+        reply = receive_message(self.connection)
+        if reply is None:
+            raise ConnectionError("Connection closed by the coordinator")
+        self.id = reply["worker"]
+        self.heartbeats = threading.Thread(target=self._send_heartbeats, daemon=True)
+        self.heartbeats.start()
+        return reply["arguments"]
+
+    def _send_heartbeats(self):
+        while not self.stop.wait(self.heartbeat):
+            try:
+                self.send({"type": "heartbeat"})
+            except OSError:
+                break
+
+    def close(self):
+        self.stop.set()
+        if self.heartbeats:
+            self.heartbeats.join()
+        self.connection.close()
+
+    def run(self, run_swarm):
+        """Calls run_swarm with the ID of each swarm served and sends back its result,
+        which must be serializable to JSON. Returns the number of swarms simulated.
+        """
+        num_swarms = 0
+        try:
+            while True:
+                self.send({"type": "request"})
+                reply = receive_message(self.connection)
+                if reply is None or reply["type"] == "done":
+                    break
+                if reply["type"] == "wait":
+                    time.sleep(reply["seconds"])
+                    continue
+                result = run_swarm(reply["swarm"])
+                self.send(
+                    {"type": "completed", "swarm": reply["swarm"], "result": result}
+                )
+                num_swarms += 1
+        finally:
+            self.close()
+        return num_swarms
@@ -1,3 +1,11 @@
+from collections import namedtuple
+import numpy as np
+
+
+# State of a swarm reported between rounds of a simulation
+SwarmSummary = namedtuple("SwarmSummary", ["finished", "best", "median"])
+
+
 class GSOClusterTask(object):
     """A GSO execution in a given cluster"""
 
@@ -6,12 +14,31 @@ class GSOClusterTask(object):
         self.gso = gso
         self.steps = steps
         self.saving_path = dest_folder
+        self.pruned = False
 
-    def run(self):
+    def run(self, stop_step=None):
         self.gso.run(
             self.steps,
             cluster_id=self.id,
             verbose=True,
             saving_path=self.saving_path,
             save_intermediary=True,
+            stop_step=stop_step,
         )
+
+    @property
+    def finished(self):
+        return self.pruned or self.gso.converged or self.gso.last_step >= self.steps
+
+    def prune(self):
+        """Stops this simulation, saving its current state as the one of the last step"""
+        self.gso.swarm.save(
+            self.steps,
+            self.saving_path,
+            comment="Pruned at step %d" % self.gso.last_step,
+        )
+        self.pruned = True
+
+    def summary(self):
+        scorings = [glowworm.scoring for glowworm in self.gso.swarm.glowworms]
+        return SwarmSummary(self.finished, max(scorings), float(np.median(scorings)))
@@ -0,0 +1,203 @@
+"""Setup pipeline: a small dependency graph of cached and parallel stages"""
+
+import os
+import json
+import shutil
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from lightdock.constants import DEFAULT_SETUP_CACHE_FILE
+from lightdock.error.lightdock_errors import SetupError
+from lightdock.util.logger import LoggingManager
+
+
+log = LoggingManager.get_logger("lgd_setup")
+
+
+def file_hash(file_name, block_size=1 << 20):
+    """Calculates the SHA-256 hash of the content of file_name"""
+    sha = hashlib.sha256()
+    with open(file_name, "rb") as input_file:
+        for block in iter(lambda: input_file.read(block_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+class SetupStage(object):
+    """A step of the setup.
+
+    The stage is considered up to date if its key, calculated from its parameters, the
+    content of its input files and the keys of the stages it depends on, has not changed
+    since the last execution and all its output files exist. Stages marked as parallel
+    are executed in a process pool, so their function and arguments must be picklable.
+    """
+
+    def __init__(
+        self,
+        name,
+        function,
+        args=(),
+        kwargs=None,
+        parameters=None,
+        input_files=None,
+        outputs=None,
+        depends_on=None,
+        parallel=False,
+    ):
+        self.name = name
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs if kwargs else {}
+        self.parameters = parameters if parameters else {}
+        self.input_files = [str(f) for f in input_files] if input_files else []
+        self.outputs = [str(f) for f in outputs] if outputs else []
+        self.depends_on = depends_on if depends_on else []
+        self.parallel = parallel
+        self.key = None
+
+    def calculate_key(self, dependency_keys):
+        """Content hash of everything this stage depends on"""
+        data = {
+            "name": self.name,
+            "parameters": self.parameters,
+            "input_files": [
+                file_hash(f) if Path(f).is_file() else None for f in self.input_files
+            ],
+            "depends_on": dependency_keys,
+        }
+        self.key = hashlib.sha256(
+            json.dumps(data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return self.key
+
+    def run(self):
+        return self.function(*self.args, **self.kwargs)
+
+
+class SetupPipeline(object):
+    """Runs a set of SetupStage objects respecting their dependencies.
+
+    Results of the stages are stored in a cache file together with their keys, so stages
+    already calculated in a previous setup are skipped.
+    """
+
+    def __init__(self, cache_file=DEFAULT_SETUP_CACHE_FILE, num_processes=None):
+        self.cache_file = Path(cache_file)
+        self.num_processes = num_processes if num_processes else os.cpu_count()
+        self.stages = {}
+        self.results = {}
+        self.cache = {}
+        if self.cache_file.is_file():
+            try:
+                with open(self.cache_file) as input_file:
+                    self.cache = json.load(input_file)
+            except ValueError:
+                log.warning(f"Ignoring malformed setup cache {self.cache_file}")
+
+    def add_stage(self, stage):
+        if stage.name in self.stages:
+            raise SetupError(f"Stage {stage.name} already defined")
+        for dependency in stage.depends_on:
+            if dependency not in self.stages:
+                raise SetupError(f"Stage {stage.name} depends on unknown stage {dependency}")
+        self.stages[stage.name] = stage
+        return stage
+
+    def is_up_to_date(self, stage):
+        """Checks if stage was already calculated with the same key"""
+        entry = self.cache.get(stage.name)
+        return (
+            entry is not None
+            and entry["key"] == stage.key
+            and all(Path(output).exists() for output in stage.outputs)
+        )
+
+    def _clean_outputs(self, stage):
+        """Removes the outputs of a previous execution of this stage"""
+        entry = self.cache.get(stage.name)
+        if entry is None:
+            return
+        for output in entry["outputs"]:
+            output = Path(output)
+            if output.is_dir():
+                shutil.rmtree(output)
+            elif output.exists():
+                output.unlink()
+        del self.cache[stage.name]
+        self._save_cache()
+
+    def _save_cache(self):
+        with open(self.cache_file, "w") as output_file:
+            json.dump(self.cache, output_file, indent=4, sort_keys=True)
+
+    def _finish(self, stage, result):
+        self.results[stage.name] = result
+        self.cache[stage.name] = {
+            "key": stage.key,
+            "outputs": stage.outputs,
+            "result": result,
+        }
+        self._save_cache()
+
+    def run(self):
+        """Executes the stages not up to date, returns a dictionary with their results.
+
+        Results of finished stages are also available in the results attribute, so
+        stages running in the main process can use them.
+        """
+        # Stages are added in order, so dependencies have already been hashed
+        for stage in self.stages.values():
+            stage.calculate_key([self.stages[d].key for d in stage.depends_on])
+
+        results = self.results
+        pending = []
+        for stage in self.stages.values():
+            if self.is_up_to_date(stage):
+                log.info(f"Stage {stage.name} is up to date, skipping")
+                results[stage.name] = self.cache[stage.name]["result"]
+            else:
+                pending.append(stage)
+
+        num_parallel = sum(1 for stage in pending if stage.parallel)
+        executor = None
+        if num_parallel:
+            executor = ProcessPoolExecutor(max_workers=min(num_parallel, self.num_processes))
+        running = {}
+        try:
+            while pending or running:
+                ready = [
+                    stage
+                    for stage in pending
+                    if all(d in results for d in stage.depends_on)
+                ]
+                # Parallel stages are submitted first, so they run while the main
+                # process takes care of the rest
+                for stage in [s for s in ready if s.parallel]:
+                    pending.remove(stage)
+                    self._clean_outputs(stage)
+                    log.info(f"Stage {stage.name} submitted")
+                    running[executor.submit(stage.run)] = stage
+                serial = [s for s in ready if not s.parallel]
+                if serial:
+                    stage = serial[0]
+                    pending.remove(stage)
+                    self._clean_outputs(stage)
+                    log.info(f"Stage {stage.name} running")
+                    self._finish(stage, stage.run())
+                    continue
+                if not running:
+                    raise SetupError(
+                        "Unsatisfiable stage dependencies: "
+                        + ", ".join(stage.name for stage in pending)
+                    )
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    self._finish(stage, future.result())
+                    log.info(f"Stage {stage.name} done")
+        finally:
+            for future in running:
+                future.cancel()
+            if executor:
+                executor.shutdown()
+        return results
@@ -139,6 +139,37 @@ def get_quaternion_for_restraint(
     return q
 
 
+def flatten_restraints(restraints):
+    """Joins active and passive restraints if restraints is a dictionary"""
+    if restraints:
+        try:
+            restraints = restraints["active"] + restraints["passive"]
+        except TypeError:
+            pass
+    return restraints
+
+
+def get_closest_restraints(receptor_restraints, center, num_closest=10):
+    """Calculates the indexes of the num_closest residue restraints to center"""
+    if not receptor_restraints:
+        return []
+    distances = []
+    for i, residue in enumerate(receptor_restraints):
+        ca = residue.get_calpha()
+        if not ca:
+            ca = residue.get_atom("P")
+            if not ca:
+                ca = residue.get_central_atom()
+                if not ca:
+                    raise StructureError(f"Cannot find a central atom for residue {residue.full_name()}")
+
+        distances.append(
+            (i, cdistance(ca.x, ca.y, ca.z, center[0], center[1], center[2]))
+        )
+    distances.sort(key=lambda tup: tup[1])
+    return [x[0] for x in distances[:num_closest]]
+
+
 def populate_poses(
     to_generate,
     center,
@@ -157,33 +188,10 @@ def populate_poses(
     """Creates new poses around a given center and a given radius"""
     new_poses = []
 
-    # Flatten if necessary receptor_restraints
-    if receptor_restraints:
-        try:
-            receptor_restraints = (
-                receptor_restraints["active"] + receptor_restraints["passive"]
-            )
-        except TypeError:
-            pass
+    receptor_restraints = flatten_restraints(receptor_restraints)
 
     # Calculate closest residue restraints
-    closest_residues = []
-    if receptor_restraints:
-        distances = []
-        for i, residue in enumerate(receptor_restraints):
-            ca = residue.get_calpha()
-            if not ca:
-                ca = residue.get_atom("P")
-                if not ca:
-                    ca = residue.get_central_atom()
-                    if not ca:
-                        raise StructureError(f"Cannot find a central atom for residue {residue.full_name()}")
-
-            distances.append(
-                (i, cdistance(ca.x, ca.y, ca.z, center[0], center[1], center[2]))
-            )
-        distances.sort(key=lambda tup: tup[1])
-        closest_residues = [x[0] for x in distances[:10]]
+    closest_residues = get_closest_restraints(receptor_restraints, center)
 
     # Uncomment for fixed translations:
     # x, y, z = get_random_point_within_sphere(number_generator, radius)
@@ -268,13 +276,114 @@ def populate_poses(
     return new_poses
 
 
+def get_random_points_within_sphere(rng, radius, num_points):
+    """Generates num_points random points within a sphere of given radius.
+
+    rng is a numpy.random.Generator, points are drawn in blocks by rejection sampling.
+    """
+    points = np.empty((0, 3))
+    r2 = radius ** 2
+    while len(points) < num_points:
+        # Around 52% of the points in the cube are inside the sphere
+        block = (2 * rng.random((2 * (num_points - len(points)) + 8, 3)) - 1) * radius
+        block = block[(block ** 2).sum(axis=1) <= r2]
+        points = np.vstack([points, block])
+    return points[:num_points]
+
+
+def get_random_quaternions(rng, num_quaternions):
+    """Generates num_quaternions random quaternions uniformly distributed as (w, x, y, z)
+    rows, using the same method as Quaternion.random.
+    """
+    u1, u2, u3 = rng.random((3, num_quaternions))
+    return np.column_stack(
+        [
+            np.sqrt(1 - u1) * np.sin(2 * np.pi * u2),
+            np.sqrt(1 - u1) * np.cos(2 * np.pi * u2),
+            np.sqrt(u1) * np.sin(2 * np.pi * u3),
+            np.sqrt(u1) * np.cos(2 * np.pi * u3),
+        ]
+    )
+
+
+def populate_poses_batch(
+    to_generate,
+    center,
+    radius,
+    rng,
+    rec_translation,
+    lig_translation,
+    rng_nm=None,
+    rec_nm=0,
+    lig_nm=0,
+    receptor_restraints=None,
+    ligand_restraints=None,
+    ligand_diameter=1.0,
+    flip=False,
+):
+    """Creates new poses around a given center and a given radius.
+
+    Equivalent to populate_poses, but translations, orientations and ANM extents are drawn
+    as arrays from the numpy.random.Generator objects rng and rng_nm. Returns an array of
+    to_generate rows with the optimization vector of each glowworm.
+    """
+    receptor_restraints = flatten_restraints(receptor_restraints)
+
+    translations = get_random_points_within_sphere(rng, radius, to_generate) + np.asarray(center)
+
+    if ligand_restraints:
+        lig_residue_ids = rng.integers(0, len(ligand_restraints), to_generate)
+        if receptor_restraints:
+            closest_residues = get_closest_restraints(receptor_restraints, center)
+            rec_residues = [
+                receptor_restraints[closest_residues[i]]
+                for i in rng.integers(0, len(closest_residues), to_generate)
+            ]
+        else:
+            # Simulated point over the receptor surface, see populate_poses
+            coef = norm(center) / ligand_diameter
+            if coef > 1.5:
+                raise LightDockWarning(
+                    "Found wrong coefficient on calculating poses with restraints"
+                )
+            rec_residues = [
+                Residue.dummy(
+                    center[0] * coef - rec_translation[0],
+                    center[1] * coef - rec_translation[1],
+                    center[2] * coef - rec_translation[2],
+                )
+            ] * to_generate
+        orientations = np.empty((to_generate, 4))
+        for i, (rec_residue, (tx, ty, tz)) in enumerate(zip(rec_residues, translations)):
+            q = get_quaternion_for_restraint(
+                rec_residue,
+                ligand_restraints[lig_residue_ids[i]],
+                tx,
+                ty,
+                tz,
+                rec_translation,
+                lig_translation,
+                rng.random,
+                flip,
+            )
+            orientations[i] = [q.w, q.x, q.y, q.z]
+    else:
+        orientations = get_random_quaternions(rng, to_generate)
+
+    poses = [translations, orientations]
+
+    # If ANM is enabled, we need to create random components for the extents
+    if rng_nm and rec_nm + lig_nm > 0:
+        poses.append(
+            rng_nm.normal(DEFAULT_EXTENT_MU, DEFAULT_EXTENT_SIGMA, (to_generate, rec_nm + lig_nm))
+        )
+
+    return np.hstack(poses)
+
+
 def create_file_from_poses(pos_file_name, poses):
     """Writes to file the initial poses"""
-    positions_file = open(pos_file_name, "w")
-    for pose in poses:
-        position = " ".join(["{:.9f}".format(coord) for coord in pose])
-        positions_file.write(position + os.linesep)
-    positions_file.close()
+    np.savetxt(pos_file_name, np.asarray(poses), fmt="%.9f", delimiter=" ", newline=os.linesep)
 
 
 def apply_restraints(
@@ -464,20 +573,32 @@ def calculate_initial_poses(
     flip=False,
     swarms_at_fixed_distance=DEFAULT_SWARM_DISTANCE,
     swarms_per_restraint=DEFAULT_SWARMS_PER_RESTRAINT,
-    dense_sampling=False
+    dense_sampling=False,
+    total_sasa=None,
+    batch_poses=False,
 ):
-    """Calculates the starting points for each of the glowworms using the center of swarms"""
-
-    # Random number generator for poses
-    rng = MTGenerator(seed)
+    """Calculates the starting points for each of the glowworms using the center of swarms.
 
-    # Random number generator for NM
-    if nm_mode:
-        rng_nm = NormalGenerator(
-            nm_seed, mu=DEFAULT_EXTENT_MU, sigma=DEFAULT_EXTENT_SIGMA
-        )
+    If batch_poses is enabled, poses of each swarm are generated as arrays using NumPy
+    random generators (populate_poses_batch). Otherwise, the sequential random number
+    generators are used, which reproduce the starting poses of previous versions.
+    """
+    if batch_poses:
+        rng = np.random.default_rng(seed)
+        rng_nm = np.random.default_rng(nm_seed) if nm_mode else None
+        populate = populate_poses_batch
     else:
-        rng_nm = None
+        # Random number generator for poses
+        rng = MTGenerator(seed)
+
+        # Random number generator for NM
+        if nm_mode:
+            rng_nm = NormalGenerator(
+                nm_seed, mu=DEFAULT_EXTENT_MU, sigma=DEFAULT_EXTENT_SIGMA
+            )
+        else:
+            rng_nm = None
+        populate = populate_poses
 
     # Calculate swarm centers
     has_membrane = is_membrane or is_transmembrane
@@ -502,6 +623,7 @@ def calculate_initial_poses(
         swarms_at_fixed_distance=swarms_at_fixed_distance,
         swarms_per_restraint=swarms_per_restraint,
         dense_sampling=dense_sampling,
+        total_sasa=total_sasa,
     )
 
     # Filter swarms far from the restraints
@@ -530,7 +652,7 @@ def calculate_initial_poses(
     positions_files = []
 
     for swarm_id, swarm_center in enumerate(swarm_centers):
-        poses = populate_poses(
+        poses = populate(
             num_glowworms,
             swarm_center,
             swarm_radius,
@@ -6,7 +6,6 @@ import json
 import time
 import numpy as np
 from pathlib import Path
-from lightdock.prep.poses import calculate_initial_poses
 from lightdock.constants import (
     DEFAULT_POSITIONS_FOLDER,
     DEFAULT_SWARM_FOLDER,
@@ -107,21 +106,30 @@ def write_mask_to_file(nm_mask, mask_file_name):
     np.save(mask_file_name, nm_mask)
 
 
+def get_lightdock_structure_files(structure):
+    """Gets the PDB and mask file names saved by save_lightdock_structure"""
+    file_names = []
+    for file_name in structure.structure_file_names:
+        file_names.append(
+            Path(file_name).parent / Path(DEFAULT_LIGHTDOCK_PREFIX % Path(file_name).name)
+        )
+        file_names.append(
+            Path(file_name).parent / Path(DEFAULT_MASK_FILE % Path(file_name).stem)
+        )
+    return file_names
+
+
 def save_lightdock_structure(structure):
     """Saves the structure parsed by LightDock"""
     log.info("Saving processed structure to PDB file...")
-    for structure_index, file_name in enumerate(structure.structure_file_names):
-        moved_file_name = Path(file_name).parent / Path(
-            DEFAULT_LIGHTDOCK_PREFIX % Path(file_name).name
-        )
+    file_names = get_lightdock_structure_files(structure)
+    for structure_index in range(len(structure.structure_file_names)):
+        moved_file_name, mask_file_name = file_names[2 * structure_index:2 * structure_index + 2]
         if moved_file_name.exists():
             raise LightDockError(
                 f"{moved_file_name} already exists, please delete previous setup generated files"
             )
         write_pdb_to_file(structure, moved_file_name, structure[structure_index])
-        mask_file_name = Path(file_name).parent / Path(
-            DEFAULT_MASK_FILE % Path(file_name).stem
-        )
         write_mask_to_file(structure.nm_mask, mask_file_name)
     log.info("Done.")
 
@@ -175,12 +183,17 @@ def calculate_starting_positions(
     flip=False,
     swarms_at_fixed_distance=DEFAULT_SWARM_DISTANCE,
     swarms_per_restraint=DEFAULT_SWARMS_PER_RESTRAINT,
-    dense_sampling=False
+    dense_sampling=False,
+    total_sasa=None,
+    batch_poses=False,
 ):
     """Defines the starting positions of each glowworm in the simulation.
 
     If the init folder already exists, uses the starting positions from this folder.
     """
+    # Setup only, its dependencies are not needed to run a simulation
+    from lightdock.prep.poses import calculate_initial_poses
+
     log.info("Calculating starting positions...")
     log.info(f"  * Surface density: TotalSASA/{surface_density:.2f}")
     log.info(f"  * Swarm radius: {swarm_radius:.2f} Å")
@@ -212,6 +225,8 @@ def calculate_starting_positions(
             swarms_at_fixed_distance,
             swarms_per_restraint,
             dense_sampling,
+            total_sasa,
+            batch_poses,
         )
         log.info(f"Generated {len(starting_points_files)} positions files")
     else:
@@ -260,12 +275,17 @@ def load_starting_positions(
     return starting_points_files
 
 
-def prepare_results_environment(swarms=10):
-    """Prepares the folder structure required by the simulation"""
+def prepare_results_environment(swarms=10, keep_empty=False):
+    """Prepares the folder structure required by the simulation.
+
+    If keep_empty is enabled, already existing empty simulation folders are reused.
+    """
     log.info("Preparing environment")
     for id_swarm in range(swarms):
         saving_path = "%s%d" % (DEFAULT_SWARM_FOLDER, id_swarm)
         if Path(saving_path).is_dir():
+            if keep_empty and not any(Path(saving_path).iterdir()):
+                continue
             raise LightDockError(f"Simulation folder {saving_path} already exists")
         os.mkdir(saving_path)
     log.info("Done.")
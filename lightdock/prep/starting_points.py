@@ -1,7 +1,6 @@
 """Calculate the position of a set of points around a protein."""
 
 import warnings
-import itertools
 from math import sqrt, cos, sin, pi, ceil
 from pathlib import Path
 import numpy as np
@@ -29,7 +28,7 @@ freesasa.setVerbosity(freesasa.silent)
 
 def points_in_hull(p, hull, tolerance=1e-12):
     """Calculates for a set of p points if they are inside of the convex hull"""
-    return np.all(hull.equations[:, :-1] @ p.T + np.repeat(hull.equations[:, -1][None, :], len(p), axis=0).T <= tolerance, 0)
+    return np.all(hull.equations[:, :-1] @ p.T + hull.equations[:, -1][:, None] <= tolerance, 0)
 
 
 def equidistant_points(p1, p2, parts):
@@ -40,6 +39,43 @@ def equidistant_points(p1, p2, parts):
                     )
 
 
+def equidistant_segments(p1, p2, parts):
+    """Calculates equidistant points for several segments at once.
+
+    p1 and p2 are (N, 3) arrays with the ends of each segment and parts is an array of N
+    integers. Returns the flattened (sum(parts + 1), 3) array of points, equivalent to
+    concatenating equidistant_points for each segment, and the segment id of each point.
+    """
+    parts = np.asarray(parts, dtype=int)
+    segment_ids = np.repeat(np.arange(len(parts)), parts + 1)
+    segment_starts = np.cumsum(parts + 1) - (parts + 1)
+    steps = np.arange(len(segment_ids)) - segment_starts[segment_ids]
+    # Same arithmetic as np.linspace, last point of each segment is exactly p2
+    delta = np.where(parts[:, None] > 0, (p2 - p1) / np.maximum(parts, 1)[:, None], 0.0)
+    points = steps[:, None] * delta[segment_ids] + p1[segment_ids]
+    points[segment_starts + parts] = p2
+    points[segment_starts[parts == 0]] = p1[parts == 0]
+    return points, segment_ids
+
+
+def max_consecutive_true(values, segment_ids, num_segments):
+    """Calculates the length of the longest run of True values for each segment"""
+    values = np.asarray(values, dtype=bool)
+    new_segment = np.ones(len(values), dtype=bool)
+    new_segment[1:] = segment_ids[1:] != segment_ids[:-1]
+    end_segment = np.ones(len(values), dtype=bool)
+    end_segment[:-1] = new_segment[1:]
+    previous = np.zeros(len(values), dtype=bool)
+    previous[1:] = values[:-1]
+    following = np.zeros(len(values), dtype=bool)
+    following[:-1] = values[1:]
+    run_starts = np.flatnonzero(values & (new_segment | ~previous))
+    run_ends = np.flatnonzero(values & (end_segment | ~following))
+    max_runs = np.zeros(num_segments, dtype=int)
+    np.maximum.at(max_runs, segment_ids[run_starts], run_ends - run_starts + 1)
+    return max_runs
+
+
 def points_on_sphere(number_of_points):
     """Creates a list of points using a spiral method.
 
@@ -60,6 +96,13 @@ def points_on_sphere(number_of_points):
     return points
 
 
+def calculate_sasa(pdb_file_name):
+    """Calculates the total SASA of the structure in pdb_file_name"""
+    structure = freesasa.Structure(str(pdb_file_name))
+    result = freesasa.calc(structure)
+    return result.totalArea()
+
+
 def calculate_surface_points(
     receptor,
     ligand,
@@ -76,6 +119,7 @@ def calculate_surface_points(
     dense_sampling=False,
     verbose=True,
     probe_tolerance=0.5,
+    total_sasa=None,
 ):
     """Calculates the position of num_points on the surface of the given protein.
 
@@ -92,6 +136,8 @@ def calculate_surface_points(
     6. If not dense_sampling is enabled, clusters the final number of swarms in the
        given input number.
 
+    If total_sasa is given, it is used instead of calculating the SASA of the receptor
+    for estimating the number of swarms.
     """
     if num_points < 0:
         raise SetupError("Invalid number of points to generate over the surface")
@@ -143,12 +189,8 @@ def calculate_surface_points(
     else:
         if num_points == 0:
             # Use SASA to get an estimation of points to calculate
-            if has_membrane:
-                structure = freesasa.Structure(pdb_no_membrane)
-            else:
-                structure = freesasa.Structure(str(pdb_file_name))
-            result = freesasa.calc(structure)
-            total_sasa = result.totalArea()
+            if total_sasa is None:
+                total_sasa = calculate_sasa(pdb_no_membrane if has_membrane else pdb_file_name)
             # fix if using restraints
             num_points = ceil(total_sasa / surface_density)
 
@@ -163,47 +205,37 @@ def calculate_surface_points(
         surface_centroids = coords
 
     # Create points over the surface of each surface cluster
-    sampling = []
-    for sc in surface_centroids:
-        sphere_points = np.array(points_on_sphere(num_sphere_points))
-        surface_points = sphere_points * surface_distance + sc
-        sampling.append(surface_points)
+    sphere_points = np.array(points_on_sphere(num_sphere_points))
+    sampling = (sphere_points[None, :, :] * surface_distance + surface_centroids[:, None, :]).reshape(-1, 3)
+    sampling_owners = np.repeat(np.arange(len(surface_centroids)), num_sphere_points)
 
-    # Filter out not compatible points
+    # Filter out not compatible points: a point is removed if it is too close to any other
+    # centroid which is a neighbor (within 20 Å) of the centroid the point belongs to
     centroids_kd_tree = KDTree(surface_centroids)
-    for i_centroid in range(len(sampling)):
-        # print('.', end="", flush=True)
-        centroid = surface_centroids[i_centroid]
-        # Search for this centroid neighbors
-        centroid_neighbors = centroids_kd_tree.query_ball_point(centroid, r=20.0)
-        # For each neighbor, remove points too close
-        for n in centroid_neighbors:
-            points_to_remove = []
-            if n != i_centroid:
-                for i_p, p in enumerate(sampling[i_centroid]):
-                    if np.linalg.norm(p - surface_centroids[n]) <= surface_distance:
-                        points_to_remove.append(i_p)
-                points_to_remove = list(set(points_to_remove))
-                sampling[i_centroid] = [
-                    sampling[i_centroid][i_p]
-                    for i_p in range(len(sampling[i_centroid]))
-                    if i_p not in points_to_remove
-                ]
-
-    s = []
-    for points in sampling:
-        s.extend(points)
+    sampling_kd_tree = KDTree(sampling)
+    pairs = sampling_kd_tree.sparse_distance_matrix(
+        centroids_kd_tree, surface_distance, output_type="ndarray"
+    )
+    point_ids, neighbor_ids = pairs["i"], pairs["j"]
+    owner_ids = sampling_owners[point_ids]
+    are_neighbors = np.linalg.norm(
+        surface_centroids[owner_ids] - surface_centroids[neighbor_ids], axis=1
+    ) <= 20.0
+    incompatible = (owner_ids != neighbor_ids) & are_neighbors
+    keep = np.ones(len(sampling), dtype=bool)
+    keep[point_ids[incompatible]] = False
+    s = sampling[keep]
 
     if verbose:
         log.info(f"Swarms after incompatible filter: {len(s)}")
 
     # Filter interior points
-    surface_swarms = []
-    molecule_kd_tree = KDTree(molecule.getCoords())
-    for swarm in s:
-        if not molecule_kd_tree.query_ball_point(swarm, SWARM_DISTANCE_TO_SURFACE_CUTOFF):
-            surface_swarms.append(swarm)
-    s = surface_swarms
+    if len(s):
+        molecule_kd_tree = KDTree(molecule.getCoords())
+        num_close_atoms = molecule_kd_tree.query_ball_point(
+            s, SWARM_DISTANCE_TO_SURFACE_CUTOFF, return_length=True
+        )
+        s = s[num_close_atoms == 0]
 
     if verbose:
         log.info(f"Swarms after interior points filter: {len(s)}")
@@ -213,39 +245,28 @@ def calculate_surface_points(
     if receptor_restraints:
         # Calculate convex hull of surface atoms
         hull = ConvexHull(surface_centroids)
-        swarms_with_visibility = []
-        for swarm in s:
-            # Find nearest restraint
-            rst_centroids = [residue.get_central_atom() for residue in receptor_restraints]
-            rst_centroid_coords = [[a.x, a.y, a.z] for a in rst_centroids]
-            near_rst_centroid = np.array(rst_centroid_coords[np.argmin(distance.cdist(np.array([swarm]), rst_centroid_coords, 'euclidean'))])
-
-            # Calculate probe positions between swarm and closest restraint
-            p1 = np.array(swarm)
-            p2 = near_rst_centroid
-
-            num_probes = int(np.ceil(np.linalg.norm(p1 - p2)))
-            p = equidistant_points(p1, p2, num_probes)
-
-            # Calculate fraction of probes inside the convex hull described by the surface atoms
-            a = points_in_hull(p, hull)
-
-            #num_inside = np.count_nonzero(a)
-            try:
-                max_consecutive_inside = max(
-                    sum(1 for _ in group)
-                    for key, group in itertools.groupby(a == True)
-                    if key
-                )
-            except ValueError:
-                max_consecutive_inside = 0
-
-            # Accept swarm depending on the ratio of probes found inside
-            if max_consecutive_inside <= probe_tolerance * num_probes:
-                swarms_with_visibility.append(swarm)
-
-        # Update set of swarms
-        s = swarms_with_visibility
+        rst_centroid_coords = np.array(
+            [
+                [atom.x, atom.y, atom.z]
+                for atom in (residue.get_central_atom() for residue in receptor_restraints)
+            ]
+        )
+        swarms = np.asarray(s).reshape(-1, 3)
+
+        # Find nearest restraint for each swarm
+        nearest = np.argmin(distance.cdist(swarms, rst_centroid_coords, "euclidean"), axis=1)
+        near_rst_centroids = rst_centroid_coords[nearest]
+
+        # Calculate probe positions between swarms and their closest restraint
+        num_probes = np.ceil(np.linalg.norm(swarms - near_rst_centroids, axis=1)).astype(int)
+        probes, probe_swarm_ids = equidistant_segments(swarms, near_rst_centroids, num_probes)
+
+        # Calculate longest run of probes inside the convex hull described by the surface atoms
+        inside = points_in_hull(probes, hull)
+        max_consecutive_inside = max_consecutive_true(inside, probe_swarm_ids, len(swarms))
+
+        # Accept swarm depending on the ratio of probes found inside
+        s = swarms[max_consecutive_inside <= probe_tolerance * num_probes]
 
         if verbose:
             log.info(f"Swarms after occlusion filter: {len(s)}")
@@ -0,0 +1,95 @@
+"""AMBER94 force-field parameters shared by the atomic scoring functions.
+
+Atoms are identified by "RES-ATOM" and point to an atom type. Charges are stored per
+atom and masses and Van der Waals parameters per atom type, all of them as arrays, so
+adapters can look up the parameters of a whole molecule at once. Tables are read the
+first time they are needed and shared by all the scoring functions of a process.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import numpy as np
+
+
+DATA_PATH = Path(__file__).absolute().parent / "data"
+
+
+class AmberParameters(object):
+    """Atom and atom type tables of the AMBER94 force-field"""
+
+    # Atom names of nucleic acids which differ from the AMBER convention
+    translate = {"OP1": "O1P", "OP2": "O2P"}
+
+    def __init__(
+        self, atom_ids, atom_types, charges, type_names, masses, vdw_energy, vdw_radii
+    ):
+        self.atom_ids = list(atom_ids)
+        self.atom_index = {atom_id: index for index, atom_id in enumerate(atom_ids)}
+        self.type_names = list(type_names)
+        self.type_index = {name: index for index, name in enumerate(type_names)}
+        # Index of the atom type of each atom
+        self.atom_types = np.array(
+            [self.type_index[atom_type] for atom_type in atom_types], dtype=np.intp
+        )
+        self.charges = np.array(charges, dtype=float)
+        self.masses = np.array(masses, dtype=float)
+        self.vdw_energy = np.array(vdw_energy, dtype=float)
+        self.vdw_radii = np.array(vdw_radii, dtype=float)
+
+    @classmethod
+    def from_files(cls, atoms_file_name, types_file_name):
+        """Reads the atom and atom type tables"""
+        atoms = [
+            line.split()
+            for line in Path(atoms_file_name).read_text().splitlines()
+            if line and not line.startswith("#")
+        ]
+        types = [
+            line.split()
+            for line in Path(types_file_name).read_text().splitlines()
+            if line and not line.startswith("#")
+        ]
+        return cls(
+            [fields[0] for fields in atoms],
+            [fields[1] for fields in atoms],
+            [float(fields[2]) for fields in atoms],
+            [fields[0] for fields in types],
+            [float(fields[1]) for fields in types],
+            [float(fields[2]) for fields in types],
+            [float(fields[3]) for fields in types],
+        )
+
+    def __contains__(self, atom_id):
+        return atom_id in self.atom_index
+
+    def __len__(self):
+        return len(self.atom_ids)
+
+    def get_indexes(self, atom_ids):
+        """Indexes in the atom tables of the given "RES-ATOM" identifiers.
+
+        Raises KeyError if any of the atoms is not defined.
+        """
+        return np.array([self.atom_index[atom_id] for atom_id in atom_ids], dtype=np.intp)
+
+    def assign(self, atoms, indexes):
+        """Sets the AMBER type and mass of atoms from their indexes in the atom tables"""
+        atom_types = self.atom_types[indexes]
+        for atom, type_index, mass in zip(atoms, atom_types, self.masses[atom_types]):
+            atom.amber_type = self.type_names[type_index]
+            atom.mass = float(mass)
+        return atom_types
+
+    def amber_type(self, atom_id):
+        return self.type_names[self.atom_types[self.atom_index[atom_id]]]
+
+    def charge(self, atom_id):
+        return float(self.charges[self.atom_index[atom_id]])
+
+
+@lru_cache(maxsize=None)
+def get_amber_parameters():
+    """AMBER94 parameters, loaded on first use"""
+    return AmberParameters.from_files(
+        DATA_PATH / "amber94_atoms.dat", DATA_PATH / "amber94_types.dat"
+    )
@@ -0,0 +1,148 @@
+/**
+ *
+ * Receptor cell list shared by the C-implementations of the scoring functions.
+ *
+ * Receptor atoms are sorted in cells of at least the largest cutoff of the scoring
+ * function, so the candidate pairs of a ligand atom are in the 27 neighbour cells of its
+ * cell. The cell list keeps a copy of the receptor coordinates used to build it and it
+ * is only rebuilt if a different receptor conformation is given, so it is reused across
+ * evaluations of a rigid receptor.
+ *
+ **/
+#ifndef LIGHTDOCK_NEIGHBORS_H
+#define LIGHTDOCK_NEIGHBORS_H
+
+#include <math.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+typedef struct {
+    unsigned int num_atoms;
+    double cell_size;
+    double origin[3];
+    int num_cells[3];
+    int *head;
+    int *next;
+    double *coordinates;
+} CellList;
+
+
+static void cell_list_free(CellList *cells) {
+    free(cells->head);
+    free(cells->next);
+    free(cells->coordinates);
+    cells->head = NULL;
+    cells->next = NULL;
+    cells->coordinates = NULL;
+    cells->num_atoms = 0;
+}
+
+
+static int cell_index(const CellList *cells, const double *point, int d) {
+    return (int)floor((point[d] - cells->origin[d]) / cells->cell_size);
+}
+
+
+/**
+ * Builds the cell list of coordinates (num_atoms x 3, C order) if it is not already
+ * built for the same coordinates and cell size. Returns 0 if memory is exhausted.
+ **/
+static int cell_list_update(CellList *cells, const double *coordinates, unsigned int num_atoms,
+                            double cell_size) {
+    unsigned int i, num_total;
+    int d, index;
+
+    if (cells->coordinates != NULL && cells->num_atoms == num_atoms && cells->cell_size == cell_size
+            && memcmp(cells->coordinates, coordinates, 3 * num_atoms * sizeof(double)) == 0) {
+        return 1;
+    }
+    cell_list_free(cells);
+
+    cells->cell_size = cell_size;
+    for (d = 0; d < 3; d++) {
+        cells->origin[d] = num_atoms ? coordinates[d] : 0.0;
+        cells->num_cells[d] = 1;
+    }
+    for (i = 0; i < num_atoms; i++) {
+        for (d = 0; d < 3; d++) {
+            if (coordinates[i*3+d] < cells->origin[d]) cells->origin[d] = coordinates[i*3+d];
+        }
+    }
+    for (i = 0; i < num_atoms; i++) {
+        for (d = 0; d < 3; d++) {
+            index = cell_index(cells, &coordinates[i*3], d) + 1;
+            if (index > cells->num_cells[d]) cells->num_cells[d] = index;
+        }
+    }
+
+    num_total = cells->num_cells[0] * cells->num_cells[1] * cells->num_cells[2];
+    cells->head = malloc(num_total * sizeof(int));
+    cells->next = malloc((num_atoms ? num_atoms : 1) * sizeof(int));
+    cells->coordinates = malloc((num_atoms ? 3 * num_atoms : 1) * sizeof(double));
+    if (cells->head == NULL || cells->next == NULL || cells->coordinates == NULL) {
+        cell_list_free(cells);
+        return 0;
+    }
+    memcpy(cells->coordinates, coordinates, 3 * num_atoms * sizeof(double));
+    cells->num_atoms = num_atoms;
+
+    for (i = 0; i < num_total; i++) cells->head[i] = -1;
+    for (i = 0; i < num_atoms; i++) {
+        index = (cell_index(cells, &coordinates[i*3], 0) * cells->num_cells[1]
+                 + cell_index(cells, &coordinates[i*3], 1)) * cells->num_cells[2]
+                 + cell_index(cells, &coordinates[i*3], 2);
+        cells->next[i] = cells->head[index];
+        cells->head[index] = i;
+    }
+    return 1;
+}
+
+
+/**
+ * Stores in neighbors the cells around point (at most 27) and returns how many there are.
+ * Receptor atoms of a cell are traversed as:
+ *     for (i = cells->head[cell]; i >= 0; i = cells->next[i])
+ **/
+static int cell_list_neighbors(const CellList *cells, const double *point, int *neighbors) {
+    int cell[3], cx, cy, cz, d, num_neighbors = 0;
+
+    for (d = 0; d < 3; d++) cell[d] = cell_index(cells, point, d);
+    for (cx = cell[0] - 1; cx <= cell[0] + 1; cx++) {
+        if (cx < 0 || cx >= cells->num_cells[0]) continue;
+        for (cy = cell[1] - 1; cy <= cell[1] + 1; cy++) {
+            if (cy < 0 || cy >= cells->num_cells[1]) continue;
+            for (cz = cell[2] - 1; cz <= cell[2] + 1; cz++) {
+                if (cz < 0 || cz >= cells->num_cells[2]) continue;
+                neighbors[num_neighbors++] = (cx * cells->num_cells[1] + cy) * cells->num_cells[2] + cz;
+            }
+        }
+    }
+    return num_neighbors;
+}
+
+
+/**
+ * Stores a new pair of interface atoms, growing the arrays if required.
+ * Returns 0 if memory is exhausted.
+ **/
+static int add_interface_pair(unsigned int **interface_receptor, unsigned int **interface_ligand,
+                              unsigned int *interface_len, unsigned int *interface_size,
+                              unsigned int i, unsigned int j) {
+    unsigned int *larger;
+
+    if (*interface_len == *interface_size) {
+        *interface_size = *interface_size ? 2 * *interface_size : 1024;
+        larger = realloc(*interface_receptor, *interface_size * sizeof(unsigned int));
+        if (larger == NULL) return 0;
+        *interface_receptor = larger;
+        larger = realloc(*interface_ligand, *interface_size * sizeof(unsigned int));
+        if (larger == NULL) return 0;
+        *interface_ligand = larger;
+    }
+    (*interface_receptor)[*interface_len] = i;
+    (*interface_ligand)[(*interface_len)++] = j;
+    return 1;
+}
+
+#endif
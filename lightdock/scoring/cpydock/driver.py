@@ -8,12 +8,11 @@ import numpy as np
 import freesasa
 from freesasa import Structure
 from lightdock.scoring.functions import ScoringFunction, ModelAdapter
+from lightdock.scoring.amber import get_amber_parameters
 from lightdock.structure.model import DockingModel
 import lightdock.scoring.cpydock.energy.c.cpydock as cpydock
 import lightdock.scoring.cpydock.energy.parameters as parameters
 from lightdock.util.logger import LoggingManager
-import lightdock.scoring.cpydock.data.amber as amber
-import lightdock.scoring.cpydock.data.vdw as vdw
 import lightdock.scoring.cpydock.data.solvation as solvation
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 from lightdock.error.lightdock_errors import NotSupportedInScoringError
@@ -57,7 +56,7 @@ class CPyDockModel(DockingModel):
         """Creates a copy of the current model"""
         return CPyDockModel(
             self.objects,
-            self.coordinates.copy(),
+            self.coordinates,
             self.restraints,
             self.charges,
             self.vdw_energy,
@@ -76,8 +75,10 @@ class CPyDockAdapter(ModelAdapter):
     """
 
     def _get_docking_model(self, molecule, restraints):
+        amber = get_amber_parameters()
         atoms = molecule.atoms
         parsed_restraints = {}
+        indexes = []
         # Assign properties to atoms
         for atom_index, atom in enumerate(atoms):
             res_id = f"{atom.chain_id}.{atom.residue_name}.{atom.residue_number}{atom.residue_insertion}"
@@ -94,11 +95,7 @@ class CPyDockAdapter(ModelAdapter):
                 if atom_name in amber.translate:
                     atom_name = amber.translate[atom.name]
                 atom_id = "%s-%s" % (res_name, atom_name)
-                atom.amber_type = amber.amber_types[atom_id]
-                atom.charge = amber.charges[atom_id]
-                atom.mass = amber.masses[atom.amber_type]
-                atom.vdw_energy = vdw.vdw_energy[atom.amber_type]
-                atom.vdw_radius = vdw.vdw_radii[atom.amber_type]
+                indexes.append(amber.atom_index[atom_id])
             except KeyError:
                 raise NotSupportedInScoringError(
                     "Residue {} or atom {} not supported. ".format(res_id, atom_name)
@@ -106,10 +103,12 @@ class CPyDockAdapter(ModelAdapter):
                 )
 
         # Prepare common model information
-        elec_charges = np.array([atom.charge for atom in atoms])
-        vdw_energies = np.array([atom.vdw_energy for atom in atoms])
-        vdw_radii = np.array([atom.vdw_radius for atom in atoms])
-        coordinates = molecule.copy_coordinates()
+        indexes = np.array(indexes, dtype=np.intp)
+        atom_types = amber.assign(atoms, indexes)
+        elec_charges = amber.charges[indexes]
+        vdw_energies = amber.vdw_energy[atom_types]
+        vdw_radii = amber.vdw_radii[atom_types]
+        coordinates = molecule.atom_coordinates
         des_energy, des_radii = solvation.get_solvation(molecule)
 
         # Calculate desolvation reference energy
@@ -139,7 +138,9 @@ class CPyDockAdapter(ModelAdapter):
             else:
                 sasa.append(-1.0)
         sasa = np.array(sasa)
-        hydrogens = np.array([0 if atom.is_hydrogen() else 1 for atom in atoms])
+        hydrogens = np.array(
+            [1 if atom.is_hydrogen() else 0 for atom in atoms], dtype=np.intc
+        )
         log.info("Done.")
 
         reference_points = ModelAdapter.load_reference_points(molecule)
@@ -175,7 +176,12 @@ class CPyDockAdapter(ModelAdapter):
 
 
 class CPyDock(ScoringFunction):
-    def __init__(self, weight=1.0):
+    def __init__(self, weight=1.0, grid_spacing=None, grid_cache_folder="."):
+        """If grid_spacing is given or found in the grid input file, receptor
+        electrostatics are interpolated from a precomputed grid instead of calculated
+        for every pair of atoms. An empty grid input file sets the default spacing.
+        Grid mode needs a rigid receptor, so receptor normal modes are not supported.
+        """
         super(CPyDock, self).__init__(weight)
         try:
             with open(parameters.vdw_input_file) as vdw_file:
@@ -185,10 +191,77 @@ class CPyDock(ScoringFunction):
             self.scoring_vdw_weight = parameters.scoring_vdw_weight
         log.info("PyDock VDW cutoff is: %3.2f" % self.scoring_vdw_weight)
 
+        if grid_spacing is None:
+            try:
+                with open(parameters.grid_input_file) as grid_file:
+                    line = grid_file.readline().strip()
+                grid_spacing = (
+                    float(line) if line else parameters.default_grid_spacing
+                )
+            except IOError:
+                pass
+            except ValueError as e:
+                log.warning("Error (%s), grid mode disabled" % str(e))
+        self.grid_spacing = grid_spacing
+        self.grid_cache_folder = grid_cache_folder
+        self.grids = {}
+        if self.grid_spacing:
+            self.anm_rec_support = False
+            log.info("PyDock grid mode, spacing is: %3.2f" % self.grid_spacing)
+
+    def get_grid(self, receptor, receptor_coordinates):
+        """A grid is calculated once for each receptor conformation.
+
+        The receptor is rigid in grid mode, so the poses of a conformation are backed by
+        the same coordinates array, and its address is used as the key. The coordinates
+        are kept with their grid, so the address can not be reused.
+        """
+        # Grid mode is optional, SciPy is only loaded when it is used
+        from lightdock.scoring.cpydock.energy.grid import CPyDockGrid, get_array
+
+        coordinates = get_array(receptor_coordinates)
+        key = coordinates.__array_interface__["data"][0]
+        try:
+            return self.grids[key][1]
+        except KeyError:
+            if len(self.grids) >= len(receptor.coordinates):
+                raise NotSupportedInScoringError(
+                    "PyDock grid mode does not support receptor normal modes"
+                )
+            grid = CPyDockGrid.from_receptor(
+                coordinates, receptor, self.grid_spacing, self.grid_cache_folder
+            )
+            self.grids[key] = (coordinates, grid)
+            return grid
+
     def __call__(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
         """Computes the pyDock scoring energy using receptor and ligand which are
         instances of DockingModel.
         """
+        if self.grid_spacing:
+            energy_terms = self.get_grid(
+                receptor, receptor_coordinates
+            ).calculate_energy(
+                receptor, ligand, ligand_coordinates, DEFAULT_CONTACT_RESTRAINTS_CUTOFF
+            )
+        else:
+            energy_terms = cpydock.calculate_energy(
+                receptor_coordinates,
+                ligand_coordinates,
+                receptor.charges,
+                ligand.charges,
+                receptor.vdw_energy,
+                ligand.vdw_energy,
+                receptor.vdw_radii,
+                ligand.vdw_radii,
+                receptor.hydrogens,
+                ligand.hydrogens,
+                receptor.sasa,
+                ligand.sasa,
+                receptor.des_energy,
+                ligand.des_energy,
+                DEFAULT_CONTACT_RESTRAINTS_CUTOFF,
+            )
         (
             elec,
             vdw,
@@ -196,30 +269,14 @@ class CPyDock(ScoringFunction):
             solv_lig,
             interface_receptor,
             interface_ligand,
-        ) = cpydock.calculate_energy(
-            receptor_coordinates,
-            ligand_coordinates,
-            receptor.charges,
-            ligand.charges,
-            receptor.vdw_energy,
-            ligand.vdw_energy,
-            receptor.vdw_radii,
-            ligand.vdw_radii,
-            receptor.hydrogens,
-            ligand.hydrogens,
-            receptor.sasa,
-            ligand.sasa,
-            receptor.des_energy,
-            ligand.des_energy,
-            DEFAULT_CONTACT_RESTRAINTS_CUTOFF,
-        )
+        ) = energy_terms
         solv = -1 * (solv_rec + solv_lig)
         energy = (elec + parameters.scoring_vdw_weight * vdw + solv) * -1.0
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, set(interface_receptor)
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, set(interface_ligand)
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
@@ -0,0 +1,258 @@
+"""Grid approximation of the pyDock scoring function.
+
+The receptor electrostatic potential is precomputed once on a regular grid and
+interpolated at the ligand atom positions. Pairs of atoms closer than
+grid_short_range_cutoff, which carry the clamped electrostatics, the Van der Waals
+energy, the desolvation and the interface, are still calculated exactly.
+
+Each pair of atoms within elec_dist_cutoff contributes q_i*q_j/r^2 to electrostatics,
+which is split in three parts so that only smooth functions are interpolated:
+
+- q_i*q_j/elec_dist_cutoff^2 for every pair within the cutoff. It is the step of the
+  hard cutoff, and it is summed exactly by counting the pairs within the cutoff,
+  weighted by their charges.
+- q_i*q_j*(1/r^2 - 1/elec_dist_cutoff^2), smoothly switched on from
+  grid_switch_distance to grid_short_range_cutoff. It is continuous at the cutoff and
+  it is the only part stored in the grid.
+- The short range pairs subtract the switched part to recover the exact value.
+
+With the default spacing, electrostatics of the 1AY7 complex are within 0.05 kcal/mol,
+about 1%, of the exact calculation for several poses around the bound one. The error
+decreases with the square of the spacing. The other terms are exact. Electrostatics
+clamping is neglected beyond the short range cutoff.
+"""
+
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+import numpy as np
+from scipy.spatial import cKDTree
+import lightdock.scoring.cpydock.energy.parameters as parameters
+from lightdock.util.logger import LoggingManager
+
+
+log = LoggingManager.get_logger("cpydock")
+
+# Bump it when the content of the grids changes, so cached files are not reused
+GRID_VERSION = 2
+
+
+def get_array(coordinates):
+    """Coordinates can be a SpacePoints object or a numpy array"""
+    return np.asarray(getattr(coordinates, "coordinates", coordinates), dtype=float)
+
+
+def switching(distance):
+    """Smooth step from 0 at grid_switch_distance to 1 at grid_short_range_cutoff"""
+    t = np.clip(
+        (distance - parameters.grid_switch_distance)
+        / (parameters.grid_short_range_cutoff - parameters.grid_switch_distance),
+        0.0,
+        1.0,
+    )
+    return t * t * (3.0 - 2.0 * t)
+
+
+class CPyDockGrid(object):
+    """Receptor electrostatics grid for the pyDock scoring function"""
+
+    def __init__(self, origin, spacing, values, receptor_coordinates):
+        self.origin = np.asarray(origin, dtype=float)
+        self.spacing = spacing
+        self.values = values
+        self.shape = np.array(values.shape)
+        self.tree = cKDTree(receptor_coordinates)
+
+    @staticmethod
+    def receptor_hash(receptor_coordinates, receptor, spacing):
+        """Identifies a grid by its receptor and parameters"""
+        sha = hashlib.sha256()
+        for array in (
+            receptor_coordinates,
+            receptor.charges,
+            np.array(
+                [
+                    spacing,
+                    parameters.grid_switch_distance,
+                    parameters.grid_short_range_cutoff,
+                    parameters.elec_dist_cutoff,
+                    GRID_VERSION,
+                ],
+                dtype=float,
+            ),
+        ):
+            sha.update(np.ascontiguousarray(array, dtype=float).tobytes())
+        return sha.hexdigest()
+
+    @classmethod
+    def calculate(cls, receptor_coordinates, receptor, spacing):
+        """Calculates the grid for the given receptor"""
+        receptor_coordinates = get_array(receptor_coordinates)
+        cutoff = parameters.elec_dist_cutoff
+        origin = receptor_coordinates.min(axis=0) - cutoff
+        extent = receptor_coordinates.max(axis=0) + cutoff - origin
+        shape = np.ceil(extent / spacing).astype(int) + 1
+        axes = [origin[d] + spacing * np.arange(shape[d]) for d in range(3)]
+        values = np.zeros(shape)
+
+        switch_distance2 = parameters.grid_switch_distance**2
+        inverse_cutoff2 = 1.0 / cutoff**2
+        for atom_id, coordinate in enumerate(receptor_coordinates):
+            first = np.maximum(np.ceil((coordinate - cutoff - origin) / spacing), 0)
+            last = np.minimum(
+                np.floor((coordinate + cutoff - origin) / spacing) + 1, shape
+            )
+            block = tuple(slice(int(f), int(l)) for f, l in zip(first, last))
+            distance2 = (
+                ((axes[0][block[0]] - coordinate[0]) ** 2)[:, None, None]
+                + ((axes[1][block[1]] - coordinate[1]) ** 2)[None, :, None]
+                + ((axes[2][block[2]] - coordinate[2]) ** 2)[None, None, :]
+            )
+            mask = (distance2 > switch_distance2) & (distance2 <= cutoff**2)
+            potential = np.zeros_like(distance2)
+            potential[mask] = switching(np.sqrt(distance2[mask])) * (
+                1.0 / distance2[mask] - inverse_cutoff2
+            )
+            values[block] += receptor.charges[atom_id] * potential
+        return cls(origin, spacing, values, receptor_coordinates)
+
+    @classmethod
+    def from_receptor(cls, receptor_coordinates, receptor, spacing, cache_folder="."):
+        """Loads the grid of this receptor from cache_folder or calculates it"""
+        receptor_coordinates = get_array(receptor_coordinates)
+        key = CPyDockGrid.receptor_hash(receptor_coordinates, receptor, spacing)
+        cache_file = Path(cache_folder) / f"{parameters.grid_cache_prefix}{key}.npz"
+        if cache_file.is_file():
+            log.info(f"Loading pyDock grid from {cache_file}")
+            with np.load(cache_file) as data:
+                return cls(
+                    data["origin"], spacing, data["values"], receptor_coordinates
+                )
+
+        log.info(f"Calculating pyDock grid (spacing {spacing:3.2f})...")
+        grid = cls.calculate(receptor_coordinates, receptor, spacing)
+        # Several processes may calculate the same grid, files are replaced atomically
+        handle, temp_file = tempfile.mkstemp(dir=cache_file.parent, suffix=".npz")
+        try:
+            with os.fdopen(handle, "wb") as output_file:
+                np.savez(output_file, origin=grid.origin, values=grid.values)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            log.warning(f"Grid could not be cached ({e})")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        log.info("Done.")
+        return grid
+
+    def interpolate(self, points):
+        """Trilinear interpolation of the grid at points. Points outside of the grid
+        are further than the cutoff from any receptor atom, so their value is zero.
+        """
+        interpolated = np.zeros(len(points))
+        scaled = (points - self.origin) / self.spacing
+        lower = np.floor(scaled).astype(int)
+        inside = np.all((lower >= 0) & (lower < self.shape - 1), axis=1)
+        lower = lower[inside]
+        fraction = scaled[inside] - lower
+        for dx in (0, 1):
+            wx = fraction[:, 0] if dx else 1.0 - fraction[:, 0]
+            for dy in (0, 1):
+                wy = fraction[:, 1] if dy else 1.0 - fraction[:, 1]
+                for dz in (0, 1):
+                    wz = fraction[:, 2] if dz else 1.0 - fraction[:, 2]
+                    interpolated[inside] += self.values[
+                        lower[:, 0] + dx, lower[:, 1] + dy, lower[:, 2] + dz
+                    ] * (wx * wy * wz)
+        return interpolated
+
+    def calculate_energy(self, receptor, ligand, ligand_coordinates, interface_cutoff):
+        """Same terms as the C-implementation calculate_energy, but interpolating the
+        electrostatics of the pairs of atoms further than grid_short_range_cutoff.
+        """
+        ligand_coordinates = get_array(ligand_coordinates)
+        max_elec = parameters.default_max_electrostatics_cutoff * (
+            parameters.electrostatics_epsilon / parameters.electrostatics_factor
+        )
+        min_elec = parameters.default_min_electrostatics_cutoff * (
+            parameters.electrostatics_epsilon / parameters.electrostatics_factor
+        )
+        inverse_cutoff2 = 1.0 / parameters.elec_dist_cutoff**2
+
+        # Step of the hard cutoff, from the pairs within the cutoff weighted by charge
+        ligand_tree = cKDTree(ligand_coordinates)
+        elec = (
+            self.tree.count_neighbors(
+                ligand_tree,
+                parameters.elec_dist_cutoff,
+                weights=(receptor.charges, ligand.charges),
+            )
+            * inverse_cutoff2
+        )
+
+        # Short range pairs, minus the parts already included in the step and the grid
+        pairs = ligand_tree.sparse_distance_matrix(
+            self.tree, parameters.grid_short_range_cutoff, output_type="ndarray"
+        )
+        lig_ids = pairs["i"]
+        rec_ids = pairs["j"]
+        distance2 = pairs["v"] ** 2
+
+        charges = receptor.charges[rec_ids] * ligand.charges[lig_ids]
+        elec += (
+            np.clip(charges / distance2, min_elec, max_elec)
+            - charges * inverse_cutoff2
+            - charges * switching(pairs["v"]) * (1.0 / distance2 - inverse_cutoff2)
+        ).sum()
+
+        # Long range electrostatics from the grid
+        elec += np.dot(ligand.charges, self.interpolate(ligand_coordinates))
+        elec *= parameters.electrostatics_factor / parameters.electrostatics_epsilon
+
+        # Van der Waals
+        in_vdw = distance2 <= parameters.vdw_dist_cutoff**2
+        vdw_energy = np.sqrt(
+            receptor.vdw_energy[rec_ids[in_vdw]] * ligand.vdw_energy[lig_ids[in_vdw]]
+        )
+        p6 = (
+            receptor.vdw_radii[rec_ids[in_vdw]] + ligand.vdw_radii[lig_ids[in_vdw]]
+        ) ** 6 / (distance2[in_vdw] ** 3)
+        vdw = np.minimum(
+            vdw_energy * (p6 * p6 - 2.0 * p6), parameters.default_vdw_cutoff
+        ).sum()
+
+        # Desolvation
+        # Only pairs of heavy atoms
+        solvation_pairs = (receptor.hydrogens[rec_ids] == 0) & (
+            ligand.hydrogens[lig_ids] == 0
+        )
+        solv_rec = self._solvation(
+            receptor, rec_ids[solvation_pairs], distance2[solvation_pairs]
+        )
+        solv_lig = self._solvation(
+            ligand, lig_ids[solvation_pairs], distance2[solvation_pairs]
+        )
+
+        in_interface = distance2 <= interface_cutoff**2
+        return (
+            elec,
+            vdw,
+            solv_rec,
+            solv_lig,
+            rec_ids[in_interface],
+            lig_ids[in_interface],
+        )
+
+    @staticmethod
+    def _solvation(model, atom_ids, distance2):
+        min_distance2 = np.full(len(model.sasa), np.inf)
+        np.minimum.at(min_distance2, atom_ids, distance2)
+        contact = (
+            (min_distance2 <= parameters.solvation_distance**2)
+            & (min_distance2 > 0.0)
+            & (model.sasa > 0)
+        )
+        solvation = np.zeros(len(model.sasa))
+        solvation[contact] = -10.0 * np.sqrt(min_distance2[contact]) + 65.0
+        solvation = np.minimum(solvation, model.sasa)
+        return np.dot(solvation, model.des_energy)
@@ -8,6 +8,21 @@ vdw_input_file = "vdw.in"
 default_max_electrostatics_cutoff = 1
 default_min_electrostatics_cutoff = -1
 default_vdw_cutoff = 1.0
+electrostatics_epsilon = 4.0
+electrostatics_factor = 332.0
+solvation_distance = 6.4
 
 # AMBER
 amber_elec_constant = 18.2223
+
+# Grid mode
+grid_input_file = "grid.in"
+default_grid_spacing = 0.75
+grid_cache_prefix = "cpydock_grid_"
+elec_dist_cutoff = 30.0
+vdw_dist_cutoff = 10.0
+# Pairs closer than grid_short_range_cutoff are calculated exactly, it must not be
+# shorter than vdw_dist_cutoff. The grid term is smoothly switched on from
+# grid_switch_distance to grid_short_range_cutoff
+grid_switch_distance = 4.0
+grid_short_range_cutoff = 12.0
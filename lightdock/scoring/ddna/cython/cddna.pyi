@@ -1,7 +1,9 @@
+import numpy as np
+from lightdock.structure.model import DockingModel
 from lightdock.structure.space import SpacePoints
 
 
-def calculate_ddna(receptor, receptor_coordinates: SpacePoints, ligand, ligand_coordinates: SpacePoints, ddna_potentials: list[float], ddna_map: list[int], interface_cutoff: float = 3.9) -> tuple[float, set[int], set[int]]:
+def calculate_ddna(receptor: DockingModel[int], receptor_coordinates: SpacePoints, ligand: DockingModel[int], ligand_coordinates: SpacePoints, ddna_potentials: np.ndarray, ddna_map: np.ndarray, interface_cutoff: float = 3.9) -> tuple[float, np.ndarray, np.ndarray]:
     """
     calculate_ddna Cython implementation.
 
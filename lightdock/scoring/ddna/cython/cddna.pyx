@@ -1,41 +1,115 @@
 #cython: boundscheck=False
 #cython: wraparound=False
+#cython: cdivision=True
 #cython: language_level=3
 
-import scipy.spatial
+from libc.math cimport sqrt, floor
 import numpy as np
+cimport numpy as np
 
-cpdef calculate_ddna(receptor, receptor_coordinates, ligand, ligand_coordinates, 
+np.import_array()
+
+cdef:
+    double max_distance = 12.
+    int num_atom_types = 20
+    int num_distance_bins = 20
+
+
+cpdef calculate_ddna(receptor, receptor_coordinates, ligand, ligand_coordinates,
                      ddna_potentials, ddna_map, interface_cutoff=3.9):
+    """Calculates the DDNA energy of the contacts between receptor and ligand.
+
+    Receptor atoms are sorted in a cell list of max_distance size, so only the
+    neighbour cells of each ligand atom are visited and no distance matrix is built.
+    As in the original implementation, distances are truncated to Angstroms.
+    Interface atoms are returned as arrays of indexes.
+    """
+    cdef:
+        double[:, ::1] rec = np.ascontiguousarray(
+            getattr(receptor_coordinates, "coordinates", receptor_coordinates), dtype=np.float64)
+        double[:, ::1] lig = np.ascontiguousarray(
+            getattr(ligand_coordinates, "coordinates", ligand_coordinates), dtype=np.float64)
+        int[::1] rec_types = np.ascontiguousarray(receptor.objects, dtype=np.intc)
+        int[::1] lig_types = np.ascontiguousarray(ligand.objects, dtype=np.intc)
+        const double[::1] potentials = np.ascontiguousarray(ddna_potentials, dtype=np.float64)
+        int[::1] distance_map = np.ascontiguousarray(ddna_map, dtype=np.intc)
+        double cutoff = interface_cutoff
+        int rec_len = rec.shape[0]
+        int lig_len = lig.shape[0]
+        np.ndarray[np.uint8_t, ndim=1] rec_interface = np.zeros(rec_len, dtype=np.uint8)
+        np.ndarray[np.uint8_t, ndim=1] lig_interface = np.zeros(lig_len, dtype=np.uint8)
+        double energy = 0.
+        double U
+        double origin[3]
+        int num_cells[3]
+        int cell[3]
+        int[::1] head
+        int[::1] next_atom
+        int i, j, d, cx, cy, cz, jj, index
+        unsigned int dist
+        double x, y, z, dist2
+        double max_distance2 = max_distance * max_distance
+
+    if rec_len == 0 or lig_len == 0:
+        return ((energy * 0.0021297 - 5.4738) * -1., np.flatnonzero(rec_interface),
+                np.flatnonzero(lig_interface))
+
+    # Receptor cell list
+    for d in range(3):
+        origin[d] = rec[0, d]
+        num_cells[d] = 1
+    for i in range(rec_len):
+        for d in range(3):
+            if rec[i, d] < origin[d]:
+                origin[d] = rec[i, d]
+    for i in range(rec_len):
+        for d in range(3):
+            index = <int>floor((rec[i, d] - origin[d]) / max_distance) + 1
+            if index > num_cells[d]:
+                num_cells[d] = index
+    head = np.full(num_cells[0] * num_cells[1] * num_cells[2], -1, dtype=np.intc)
+    next_atom = np.full(rec_len, -1, dtype=np.intc)
+    for i in range(rec_len):
+        for d in range(3):
+            cell[d] = <int>floor((rec[i, d] - origin[d]) / max_distance)
+        index = (cell[0] * num_cells[1] + cell[1]) * num_cells[2] + cell[2]
+        next_atom[i] = head[index]
+        head[index] = i
+
+    with nogil:
+        for j in range(lig_len):
+            for d in range(3):
+                cell[d] = <int>floor((lig[j, d] - origin[d]) / max_distance)
+            for cx in range(cell[0] - 1, cell[0] + 2):
+                if cx < 0 or cx >= num_cells[0]:
+                    continue
+                for cy in range(cell[1] - 1, cell[1] + 2):
+                    if cy < 0 or cy >= num_cells[1]:
+                        continue
+                    for cz in range(cell[2] - 1, cell[2] + 2):
+                        if cz < 0 or cz >= num_cells[2]:
+                            continue
+                        i = head[(cx * num_cells[1] + cy) * num_cells[2] + cz]
+                        while i >= 0:
+                            x = rec[i, 0] - lig[j, 0]
+                            y = rec[i, 1] - lig[j, 1]
+                            z = rec[i, 2] - lig[j, 2]
+                            dist2 = x*x + y*y + z*z
+                            if dist2 <= max_distance2:
+                                dist = <unsigned int>sqrt(dist2)
+                                if dist <= cutoff:
+                                    rec_interface[i] = 1
+                                    lig_interface[j] = 1
+                                jj = distance_map[dist * 2]
+                                if jj > 0 and jj <= num_distance_bins:
+                                    U = potentials[jj * num_atom_types * num_atom_types
+                                                   + rec_types[i] * num_atom_types
+                                                   + lig_types[j]]
+                                    if U < -5.0:
+                                        U = 0.0
+                                    energy += U
+                            i = next_atom[i]
 
-    # Calculate all atom distances
-    dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)
-    # Keep only atom indexes below 12A
-    atom_indexes = np.where(dist_matrix <= 12.)
-
-    energy = 0.
-    U = 0.
-    cdef unsigned int d
-    interface_receptor = []
-    interface_ligand = []
-    
-    for i,j in zip(atom_indexes[0], atom_indexes[1]):
-        # convert numpy.float64 to int
-        d = dist_matrix[i][j]
-        # Calculate interface
-        if d <= interface_cutoff:
-            interface_receptor.append(i)
-            interface_ligand.append(j)
-
-        rec_atom = receptor.objects[i]
-        lig_atom = ligand.objects[j]
-
-        jj = ddna_map[int(d * 2.0)]
-        if jj > 0 and jj <= 20:
-            U = ddna_potentials[jj * 20*20 + rec_atom * 20 + lig_atom];
-            if U < -5.0:
-                U = 0.0
-            energy += U
-    
     # Convert and change energy sign
-    return (energy * 0.0021297 - 5.4738) * -1., set(interface_receptor), set(interface_ligand)
+    return ((energy * 0.0021297 - 5.4738) * -1., np.flatnonzero(rec_interface),
+            np.flatnonzero(lig_interface))
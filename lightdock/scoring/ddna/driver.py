@@ -6,9 +6,11 @@ protein-DNA complexes', J. Med. Chem. 48, 2325-2335 (2005).
 """
 
 import os
+import numpy as np
 
 from lightdock.structure.model import DockingModel
 from lightdock.scoring.functions import ModelAdapter, ScoringFunction
+from lightdock.scoring.potentials import load_potentials
 from lightdock.scoring.ddna.cython.cddna import calculate_ddna
 from lightdock.util.logger import LoggingManager
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
@@ -417,15 +419,16 @@ class DDNAPotential(object):
 
     def __init__(self):
         data_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
-        self.potentials = DDNAPotential._read_potentials(
-            os.path.join(data_path, "fort.21_xscore_noH_Met")
+        self.potentials = load_potentials(
+            os.path.join(data_path, "fort.21_xscore_noH_Met"),
+            DDNAPotential._read_potentials,
         )
         self.map = DDNAPotential._createmap()
 
     @staticmethod
     def _read_potentials(data_file_name):
         """Reads DDNA data potentials"""
-        potentials = [0.0] * (21 * 20 * 20)
+        potentials = np.zeros(21 * 20 * 20)
         D1 = 20 * 20
         D2 = 20
         with open(data_file_name) as input_handle:
@@ -444,7 +447,7 @@ class DDNAPotential(object):
 
     @staticmethod
     def _createmap():
-        map = [-1] * 700
+        map = np.full(700, -1, dtype=np.intc)
         for i in range(1, 50):
             if i < 4:
                 map[i] = 1
@@ -488,16 +491,17 @@ class DDNAAdapter(ModelAdapter):
                     if in_restraint:
                         parsed_restraints[res_id].append(atom_index)
                     atom_index += 1
+        ddna_objects = np.array(ddna_objects, dtype=np.intc)
         try:
             return DockingModel(
                 ddna_objects,
-                molecule.copy_coordinates(),
+                molecule.atom_coordinates,
                 parsed_restraints,
                 n_modes=molecule.n_modes.copy(),
             )
         except AttributeError:
             return DockingModel(
-                ddna_objects, molecule.copy_coordinates(), parsed_restraints
+                ddna_objects, molecule.atom_coordinates, parsed_restraints
             )
 
 
@@ -521,10 +525,10 @@ class DDNA(ScoringFunction):
         )
 
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
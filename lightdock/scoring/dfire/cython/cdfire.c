@@ -738,8 +738,8 @@ static CYTHON_INLINE float __PYX_NAN() {
   #endif
 #endif
 
-#define __PYX_HAVE__cdfire
-#define __PYX_HAVE_API__cdfire
+#define __PYX_HAVE__lightdock__scoring__dfire__cython__cdfire
+#define __PYX_HAVE_API__lightdock__scoring__dfire__cython__cdfire
 /* Early includes */
 #ifdef _OPENMP
 #include <omp.h>
@@ -954,16 +954,16 @@ static const char *__pyx_f[] = {
 };
 
 /*--- Type declarations ---*/
-struct __pyx_opt_args_6cdfire_calculate_dfire;
+struct __pyx_opt_args_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire;
 
-/* "cdfire.pyx":8
+/* "lightdock/scoring/dfire/cython/cdfire.pyx":8
  * import numpy as np
  * 
  * cpdef calculate_dfire(receptor, receptor_coordinates, ligand, ligand_coordinates,             # <<<<<<<<<<<<<<
  *                         dfire_dist_to_bins, dfire_energy, interface_cutoff=3.9):
  *     dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)
  */
-struct __pyx_opt_args_6cdfire_calculate_dfire {
+struct __pyx_opt_args_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire {
   int __pyx_n;
   PyObject *interface_cutoff;
 };
@@ -1336,13 +1336,13 @@ static int __Pyx_check_binary_version(void);
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 
-/* Module declarations from 'cdfire' */
-static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_6cdfire_calculate_dfire *__pyx_optional_args); /*proto*/
-#define __Pyx_MODULE_NAME "cdfire"
-extern int __pyx_module_is_main_cdfire;
-int __pyx_module_is_main_cdfire = 0;
+/* Module declarations from 'lightdock.scoring.dfire.cython.cdfire' */
+static PyObject *__pyx_f_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire *__pyx_optional_args); /*proto*/
+#define __Pyx_MODULE_NAME "lightdock.scoring.dfire.cython.cdfire"
+extern int __pyx_module_is_main_lightdock__scoring__dfire__cython__cdfire;
+int __pyx_module_is_main_lightdock__scoring__dfire__cython__cdfire = 0;
 
-/* Implementation of 'cdfire' */
+/* Implementation of 'lightdock.scoring.dfire.cython.cdfire' */
 static PyObject *__pyx_builtin_zip;
 static const char __pyx_k_np[] = "np";
 static const char __pyx_k_zip[] = "zip";
@@ -1392,7 +1392,7 @@ static PyObject *__pyx_n_s_spatial;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_where;
 static PyObject *__pyx_n_s_zip;
-static PyObject *__pyx_pf_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_receptor, PyObject *__pyx_v_receptor_coordinates, PyObject *__pyx_v_ligand, PyObject *__pyx_v_ligand_coordinates, PyObject *__pyx_v_dfire_dist_to_bins, PyObject *__pyx_v_dfire_energy, PyObject *__pyx_v_interface_cutoff); /* proto */
+static PyObject *__pyx_pf_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_receptor, PyObject *__pyx_v_receptor_coordinates, PyObject *__pyx_v_ligand, PyObject *__pyx_v_ligand_coordinates, PyObject *__pyx_v_dfire_dist_to_bins, PyObject *__pyx_v_dfire_energy, PyObject *__pyx_v_interface_cutoff); /* proto */
 static PyObject *__pyx_float_0_;
 static PyObject *__pyx_float_1_0;
 static PyObject *__pyx_float_15_;
@@ -1404,7 +1404,7 @@ static PyObject *__pyx_float_neg_1_;
 static PyObject *__pyx_int_1;
 /* Late includes */
 
-/* "cdfire.pyx":8
+/* "lightdock/scoring/dfire/cython/cdfire.pyx":8
  * import numpy as np
  * 
  * cpdef calculate_dfire(receptor, receptor_coordinates, ligand, ligand_coordinates,             # <<<<<<<<<<<<<<
@@ -1412,8 +1412,8 @@ static PyObject *__pyx_int_1;
  *     dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)
  */
 
-static PyObject *__pyx_pw_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyObject *__pyx_v_receptor_coordinates, PyObject *__pyx_v_ligand, PyObject *__pyx_v_ligand_coordinates, PyObject *__pyx_v_dfire_dist_to_bins, PyObject *__pyx_v_dfire_energy, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_6cdfire_calculate_dfire *__pyx_optional_args) {
+static PyObject *__pyx_pw_9lightdock_7scoring_5dfire_6cython_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyObject *__pyx_v_receptor_coordinates, PyObject *__pyx_v_ligand, PyObject *__pyx_v_ligand_coordinates, PyObject *__pyx_v_dfire_dist_to_bins, PyObject *__pyx_v_dfire_energy, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire *__pyx_optional_args) {
   PyObject *__pyx_v_interface_cutoff = ((PyObject *)__pyx_float_3_9);
   PyObject *__pyx_v_dist_matrix = NULL;
   PyObject *__pyx_v_atom_indexes = NULL;
@@ -1454,7 +1454,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     }
   }
 
-  /* "cdfire.pyx":10
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":10
  * cpdef calculate_dfire(receptor, receptor_coordinates, ligand, ligand_coordinates,
  *                         dfire_dist_to_bins, dfire_energy, interface_cutoff=3.9):
  *     dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)             # <<<<<<<<<<<<<<
@@ -1520,7 +1520,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __pyx_v_dist_matrix = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":11
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":11
  *                         dfire_dist_to_bins, dfire_energy, interface_cutoff=3.9):
  *     dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)
  *     atom_indexes = np.where(dist_matrix <= 15.)             # <<<<<<<<<<<<<<
@@ -1552,7 +1552,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __pyx_v_atom_indexes = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":12
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":12
  *     dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)
  *     atom_indexes = np.where(dist_matrix <= 15.)
  *     dist_matrix *= 2.0             # <<<<<<<<<<<<<<
@@ -1564,7 +1564,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __Pyx_DECREF_SET(__pyx_v_dist_matrix, __pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":13
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":13
  *     atom_indexes = np.where(dist_matrix <= 15.)
  *     dist_matrix *= 2.0
  *     dist_matrix -= 1.0             # <<<<<<<<<<<<<<
@@ -1576,7 +1576,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __Pyx_DECREF_SET(__pyx_v_dist_matrix, __pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":14
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":14
  *     dist_matrix *= 2.0
  *     dist_matrix -= 1.0
  *     energy = 0.             # <<<<<<<<<<<<<<
@@ -1586,7 +1586,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __Pyx_INCREF(__pyx_float_0_);
   __pyx_v_energy = __pyx_float_0_;
 
-  /* "cdfire.pyx":16
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":16
  *     energy = 0.
  *     cdef unsigned int d
  *     interface_receptor = []             # <<<<<<<<<<<<<<
@@ -1598,7 +1598,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __pyx_v_interface_receptor = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":17
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":17
  *     cdef unsigned int d
  *     interface_receptor = []
  *     interface_ligand = []             # <<<<<<<<<<<<<<
@@ -1610,7 +1610,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __pyx_v_interface_ligand = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":19
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":19
  *     interface_ligand = []
  * 
  *     for i,j in zip(atom_indexes[0], atom_indexes[1]):             # <<<<<<<<<<<<<<
@@ -1723,7 +1723,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "cdfire.pyx":20
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":20
  * 
  *     for i,j in zip(atom_indexes[0], atom_indexes[1]):
  *         rec_atom = receptor.objects[i]             # <<<<<<<<<<<<<<
@@ -1738,7 +1738,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_rec_atom, __pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "cdfire.pyx":21
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":21
  *     for i,j in zip(atom_indexes[0], atom_indexes[1]):
  *         rec_atom = receptor.objects[i]
  *         lig_atom = ligand.objects[j]             # <<<<<<<<<<<<<<
@@ -1753,7 +1753,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_lig_atom, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "cdfire.pyx":22
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":22
  *         rec_atom = receptor.objects[i]
  *         lig_atom = ligand.objects[j]
  *         rnuma = rec_atom.dfire_residue_index             # <<<<<<<<<<<<<<
@@ -1765,7 +1765,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_rnuma, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "cdfire.pyx":23
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":23
  *         lig_atom = ligand.objects[j]
  *         rnuma = rec_atom.dfire_residue_index
  *         anuma = rec_atom.atom_index             # <<<<<<<<<<<<<<
@@ -1777,7 +1777,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_anuma, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "cdfire.pyx":24
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":24
  *         rnuma = rec_atom.dfire_residue_index
  *         anuma = rec_atom.atom_index
  *         rnumb = lig_atom.dfire_residue_index             # <<<<<<<<<<<<<<
@@ -1789,7 +1789,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_rnumb, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "cdfire.pyx":25
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":25
  *         anuma = rec_atom.atom_index
  *         rnumb = lig_atom.dfire_residue_index
  *         anumb = lig_atom.atom_index             # <<<<<<<<<<<<<<
@@ -1801,7 +1801,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_anumb, __pyx_t_5);
     __pyx_t_5 = 0;
 
-    /* "cdfire.pyx":27
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":27
  *         anumb = lig_atom.atom_index
  *         # convert numpy.float64 to int
  *         d = dist_matrix[i][j]             # <<<<<<<<<<<<<<
@@ -1817,7 +1817,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_v_d = __pyx_t_10;
 
-    /* "cdfire.pyx":28
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":28
  *         # convert numpy.float64 to int
  *         d = dist_matrix[i][j]
  *         if d <= interface_cutoff:             # <<<<<<<<<<<<<<
@@ -1832,7 +1832,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     if (__pyx_t_11) {
 
-      /* "cdfire.pyx":29
+      /* "lightdock/scoring/dfire/cython/cdfire.pyx":29
  *         d = dist_matrix[i][j]
  *         if d <= interface_cutoff:
  *             interface_receptor.append(i)             # <<<<<<<<<<<<<<
@@ -1841,16 +1841,16 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
  */
       __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_interface_receptor, __pyx_v_i); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 29, __pyx_L1_error)
 
-      /* "cdfire.pyx":30
+      /* "lightdock/scoring/dfire/cython/cdfire.pyx":30
  *         if d <= interface_cutoff:
  *             interface_receptor.append(i)
  *             interface_ligand.append(j)             # <<<<<<<<<<<<<<
  *         dfire_bin = dfire_dist_to_bins[d]-1
- *         energy += dfire_energy[rnuma][anuma][rnumb][anumb][dfire_bin]
+ *         energy += dfire_energy[rnuma, anuma, rnumb, anumb, dfire_bin]
  */
       __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_interface_ligand, __pyx_v_j); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 30, __pyx_L1_error)
 
-      /* "cdfire.pyx":28
+      /* "lightdock/scoring/dfire/cython/cdfire.pyx":28
  *         # convert numpy.float64 to int
  *         d = dist_matrix[i][j]
  *         if d <= interface_cutoff:             # <<<<<<<<<<<<<<
@@ -1859,11 +1859,11 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
  */
     }
 
-    /* "cdfire.pyx":31
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":31
  *             interface_receptor.append(i)
  *             interface_ligand.append(j)
  *         dfire_bin = dfire_dist_to_bins[d]-1             # <<<<<<<<<<<<<<
- *         energy += dfire_energy[rnuma][anuma][rnumb][anumb][dfire_bin]
+ *         energy += dfire_energy[rnuma, anuma, rnumb, anumb, dfire_bin]
  * 
  */
     __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_dfire_dist_to_bins, __pyx_v_d, unsigned int, 0, __Pyx_PyInt_From_unsigned_int, 0, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 31, __pyx_L1_error)
@@ -1874,34 +1874,40 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
     __Pyx_XDECREF_SET(__pyx_v_dfire_bin, __pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "cdfire.pyx":32
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":32
  *             interface_ligand.append(j)
  *         dfire_bin = dfire_dist_to_bins[d]-1
- *         energy += dfire_energy[rnuma][anuma][rnumb][anumb][dfire_bin]             # <<<<<<<<<<<<<<
+ *         energy += dfire_energy[rnuma, anuma, rnumb, anumb, dfire_bin]             # <<<<<<<<<<<<<<
  * 
  *     # Convert and change energy sign
  */
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_dfire_energy, __pyx_v_rnuma); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 32, __pyx_L1_error)
+    __pyx_t_2 = PyTuple_New(5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 32, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_2, __pyx_v_anuma); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_rnuma);
+    __Pyx_GIVEREF(__pyx_v_rnuma);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_rnuma);
+    __Pyx_INCREF(__pyx_v_anuma);
+    __Pyx_GIVEREF(__pyx_v_anuma);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_anuma);
+    __Pyx_INCREF(__pyx_v_rnumb);
+    __Pyx_GIVEREF(__pyx_v_rnumb);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_v_rnumb);
+    __Pyx_INCREF(__pyx_v_anumb);
+    __Pyx_GIVEREF(__pyx_v_anumb);
+    PyTuple_SET_ITEM(__pyx_t_2, 3, __pyx_v_anumb);
+    __Pyx_INCREF(__pyx_v_dfire_bin);
+    __Pyx_GIVEREF(__pyx_v_dfire_bin);
+    PyTuple_SET_ITEM(__pyx_t_2, 4, __pyx_v_dfire_bin);
+    __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_v_dfire_energy, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_5, __pyx_v_rnumb); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 32, __pyx_L1_error)
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_energy, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 32, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_2, __pyx_v_anumb); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_5, __pyx_v_dfire_bin); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_5 = PyNumber_InPlaceAdd(__pyx_v_energy, __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF_SET(__pyx_v_energy, __pyx_t_5);
-    __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_energy, __pyx_t_2);
+    __pyx_t_2 = 0;
 
-    /* "cdfire.pyx":19
+    /* "lightdock/scoring/dfire/cython/cdfire.pyx":19
  *     interface_ligand = []
  * 
  *     for i,j in zip(atom_indexes[0], atom_indexes[1]):             # <<<<<<<<<<<<<<
@@ -1911,7 +1917,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "cdfire.pyx":35
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":35
  * 
  *     # Convert and change energy sign
  *     return (energy * 0.0157 - 4.7) * -1., set(interface_receptor), set(interface_ligand)             # <<<<<<<<<<<<<<
@@ -1919,32 +1925,32 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __Pyx_XDECREF(__pyx_r);
   __pyx_t_3 = PyNumber_Multiply(__pyx_v_energy, __pyx_float_0_0157); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyFloat_SubtractObjC(__pyx_t_3, __pyx_float_4_7, 4.7, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 35, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyFloat_SubtractObjC(__pyx_t_3, __pyx_float_4_7, 4.7, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyNumber_Multiply(__pyx_t_5, __pyx_float_neg_1_); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_float_neg_1_); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = PySet_New(__pyx_v_interface_receptor); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 35, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_2 = PySet_New(__pyx_v_interface_ligand); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PySet_New(__pyx_v_interface_receptor); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = PySet_New(__pyx_v_interface_ligand); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_5);
-  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_t_5);
   __pyx_t_3 = 0;
-  __pyx_t_5 = 0;
   __pyx_t_2 = 0;
+  __pyx_t_5 = 0;
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "cdfire.pyx":8
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":8
  * import numpy as np
  * 
  * cpdef calculate_dfire(receptor, receptor_coordinates, ligand, ligand_coordinates,             # <<<<<<<<<<<<<<
@@ -1959,7 +1965,7 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("cdfire.calculate_dfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("lightdock.scoring.dfire.cython.cdfire.calculate_dfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_dist_matrix);
@@ -1982,8 +1988,8 @@ static PyObject *__pyx_f_6cdfire_calculate_dfire(PyObject *__pyx_v_receptor, PyO
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pw_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_9lightdock_7scoring_5dfire_6cython_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_9lightdock_7scoring_5dfire_6cython_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_receptor = 0;
   PyObject *__pyx_v_receptor_coordinates = 0;
   PyObject *__pyx_v_ligand = 0;
@@ -2093,22 +2099,22 @@ static PyObject *__pyx_pw_6cdfire_1calculate_dfire(PyObject *__pyx_self, PyObjec
   __pyx_L5_argtuple_error:;
   __Pyx_RaiseArgtupleInvalid("calculate_dfire", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 8, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("cdfire.calculate_dfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("lightdock.scoring.dfire.cython.cdfire.calculate_dfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_6cdfire_calculate_dfire(__pyx_self, __pyx_v_receptor, __pyx_v_receptor_coordinates, __pyx_v_ligand, __pyx_v_ligand_coordinates, __pyx_v_dfire_dist_to_bins, __pyx_v_dfire_energy, __pyx_v_interface_cutoff);
+  __pyx_r = __pyx_pf_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire(__pyx_self, __pyx_v_receptor, __pyx_v_receptor_coordinates, __pyx_v_ligand, __pyx_v_ligand_coordinates, __pyx_v_dfire_dist_to_bins, __pyx_v_dfire_energy, __pyx_v_interface_cutoff);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_receptor, PyObject *__pyx_v_receptor_coordinates, PyObject *__pyx_v_ligand, PyObject *__pyx_v_ligand_coordinates, PyObject *__pyx_v_dfire_dist_to_bins, PyObject *__pyx_v_dfire_energy, PyObject *__pyx_v_interface_cutoff) {
+static PyObject *__pyx_pf_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_receptor, PyObject *__pyx_v_receptor_coordinates, PyObject *__pyx_v_ligand, PyObject *__pyx_v_ligand_coordinates, PyObject *__pyx_v_dfire_dist_to_bins, PyObject *__pyx_v_dfire_energy, PyObject *__pyx_v_interface_cutoff) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_6cdfire_calculate_dfire __pyx_t_2;
+  struct __pyx_opt_args_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire __pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2116,7 +2122,7 @@ static PyObject *__pyx_pf_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_
   __Pyx_XDECREF(__pyx_r);
   __pyx_t_2.__pyx_n = 1;
   __pyx_t_2.interface_cutoff = __pyx_v_interface_cutoff;
-  __pyx_t_1 = __pyx_f_6cdfire_calculate_dfire(__pyx_v_receptor, __pyx_v_receptor_coordinates, __pyx_v_ligand, __pyx_v_ligand_coordinates, __pyx_v_dfire_dist_to_bins, __pyx_v_dfire_energy, 0, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_9lightdock_7scoring_5dfire_6cython_6cdfire_calculate_dfire(__pyx_v_receptor, __pyx_v_receptor_coordinates, __pyx_v_ligand, __pyx_v_ligand_coordinates, __pyx_v_dfire_dist_to_bins, __pyx_v_dfire_energy, 0, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2125,7 +2131,7 @@ static PyObject *__pyx_pf_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cdfire.calculate_dfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("lightdock.scoring.dfire.cython.cdfire.calculate_dfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2134,7 +2140,7 @@ static PyObject *__pyx_pf_6cdfire_calculate_dfire(CYTHON_UNUSED PyObject *__pyx_
 }
 
 static PyMethodDef __pyx_methods[] = {
-  {"calculate_dfire", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_6cdfire_1calculate_dfire, METH_VARARGS|METH_KEYWORDS, 0},
+  {"calculate_dfire", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_9lightdock_7scoring_5dfire_6cython_6cdfire_1calculate_dfire, METH_VARARGS|METH_KEYWORDS, 0},
   {0, 0, 0, 0}
 };
 
@@ -2472,14 +2478,14 @@ if (!__Pyx_RefNanny) {
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
   if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  if (__pyx_module_is_main_cdfire) {
+  if (__pyx_module_is_main_lightdock__scoring__dfire__cython__cdfire) {
     if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
     PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "cdfire")) {
-      if (unlikely(PyDict_SetItemString(modules, "cdfire", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "lightdock.scoring.dfire.cython.cdfire")) {
+      if (unlikely(PyDict_SetItemString(modules, "lightdock.scoring.dfire.cython.cdfire", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
   #endif
@@ -2500,7 +2506,7 @@ if (!__Pyx_RefNanny) {
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "cdfire.pyx":5
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":5
  * #cython: language_level=3
  * 
  * import scipy.spatial             # <<<<<<<<<<<<<<
@@ -2512,7 +2518,7 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_scipy, __pyx_t_1) < 0) __PYX_ERR(0, 5, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":6
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":6
  * 
  * import scipy.spatial
  * import numpy as np             # <<<<<<<<<<<<<<
@@ -2524,7 +2530,7 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "cdfire.pyx":1
+  /* "lightdock/scoring/dfire/cython/cdfire.pyx":1
  * #cython: boundscheck=False             # <<<<<<<<<<<<<<
  * #cython: wraparound=False
  * #cython: language_level=3
@@ -2541,11 +2547,11 @@ if (!__Pyx_RefNanny) {
   __Pyx_XDECREF(__pyx_t_1);
   if (__pyx_m) {
     if (__pyx_d) {
-      __Pyx_AddTraceback("init cdfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      __Pyx_AddTraceback("init lightdock.scoring.dfire.cython.cdfire", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
     Py_CLEAR(__pyx_m);
   } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init cdfire");
+    PyErr_SetString(PyExc_ImportError, "init lightdock.scoring.dfire.cython.cdfire");
   }
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
@@ -29,7 +29,7 @@ cpdef calculate_dfire(receptor, receptor_coordinates, ligand, ligand_coordinates
             interface_receptor.append(i)
             interface_ligand.append(j)
         dfire_bin = dfire_dist_to_bins[d]-1
-        energy += dfire_energy[rnuma][anuma][rnumb][anumb][dfire_bin]
+        energy += dfire_energy[rnuma, anuma, rnumb, anumb, dfire_bin]
     
     # Convert and change energy sign
     return (energy * 0.0157 - 4.7) * -1., set(interface_receptor), set(interface_ligand)
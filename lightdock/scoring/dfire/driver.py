@@ -5,9 +5,11 @@ potential of mean force for protein folding and binding. Proteins 56, 93-101 (20
 """
 
 import os
+import numpy as np
 
 from lightdock.structure.model import DockingModel
 from lightdock.scoring.functions import ModelAdapter, ScoringFunction
+from lightdock.scoring.potentials import load_potentials
 from lightdock.scoring.dfire.cython.cdfire import calculate_dfire
 from lightdock.util.logger import LoggingManager
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
@@ -346,42 +348,36 @@ class DFIREPotential(object):
                 )
                 self.atomnumber[name] = y
 
-        self.dfire_energy = self._read_potentials(data_path + "DCparams")
+        self.dfire_energy = load_potentials(
+            data_path + "DCparams", self._read_potentials
+        )
 
     def _read_potentials(self, data_file_name):
-        """Reads DFIRE data potentials"""
-        dfire_energy = []
-        for x in range(len(DFIREPotential.RES_3)):
-            dfire_energy.append([])
-            for y in range(
-                len(DFIREPotential.atoms_in_residues[DFIREPotential.RES_3[x]])
-            ):
-                dfire_energy[x].append([])
-                for a in range(len(DFIREPotential.RES_3)):
-                    dfire_energy[x][y].append([])
-                    for b in range(
-                        len(DFIREPotential.atoms_in_residues[DFIREPotential.RES_3[a]])
-                    ):
-                        dfire_energy[x][y][a].append([])
-                        for _ in range(20):
-                            dfire_energy[x][y][a][b].append(99999.9)
-
-        infile = open(data_file_name).readlines()
-        count = 0
-        for x in range(167):
-            residuea = DFIREPotential.dfire_atom_types[x][:3]
-            rnuma = self.r3_to_numerical[residuea]
-            anuma = self.atomnumber[DFIREPotential.dfire_atom_types[x]]
-            for y in range(167):
-                residueb = DFIREPotential.dfire_atom_types[y][:3]
-                rnumb = self.r3_to_numerical[residueb]
-                anumb = self.atomnumber[DFIREPotential.dfire_atom_types[y]]
-                for z in range(20):
-                    dfire_energy[rnuma][anuma][rnumb][anumb][z] = float(
-                        infile[count].strip()
-                    )
-                    count += 1
+        """Reads DFIRE data potentials.
+
+        Energies are indexed by residue, atom in residue, residue, atom in residue and
+        distance bin. Entries of atoms not present in a residue are left as 99999.9.
+        """
+        num_residues = len(DFIREPotential.RES_3)
+        max_atoms = max(
+            len(atoms) for atoms in DFIREPotential.atoms_in_residues.values()
+        )
+        dfire_energy = np.full(
+            (num_residues, max_atoms, num_residues, max_atoms, 20), 99999.9
+        )
 
+        residues = []
+        atoms = []
+        for atom_type in DFIREPotential.dfire_atom_types[:167]:
+            residues.append(self.r3_to_numerical[atom_type[:3]])
+            atoms.append(self.atomnumber[atom_type])
+        residues = np.array(residues)
+        atoms = np.array(atoms)
+
+        energies = np.loadtxt(data_file_name, max_rows=167 * 167 * 20)
+        dfire_energy[
+            residues[:, None], atoms[:, None], residues[None, :], atoms[None, :]
+        ] = energies.reshape(167, 167, 20)
         return dfire_energy
 
 
@@ -437,13 +433,13 @@ class DFIREAdapter(ModelAdapter):
         try:
             return DockingModel(
                 dfire_objects,
-                molecule.copy_coordinates(),
+                molecule.atom_coordinates,
                 parsed_restraints,
                 n_modes=molecule.n_modes.copy(),
             )
         except AttributeError:
             return DockingModel(
-                dfire_objects, molecule.copy_coordinates(), parsed_restraints
+                dfire_objects, molecule.atom_coordinates, parsed_restraints
             )
 
 
@@ -467,10 +463,10 @@ class DFIRE(ScoringFunction):
         )
 
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
@@ -284,10 +284,10 @@ class DFIRE2(ScoringFunction):
 
         # Code to consider contacts in the interface
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, set(interface_receptor)
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, set(interface_ligand)
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
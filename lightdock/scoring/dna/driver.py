@@ -6,12 +6,11 @@ custom VdW weight.
 
 import numpy as np
 from lightdock.scoring.functions import ScoringFunction, ModelAdapter
+from lightdock.scoring.amber import get_amber_parameters
 from lightdock.structure.model import DockingModel
 import lightdock.scoring.dna.energy.c.cdna as cdna
 import lightdock.scoring.dna.energy.parameters as parameters
 from lightdock.util.logger import LoggingManager
-import lightdock.scoring.dna.data.amber as amber
-import lightdock.scoring.dna.data.vdw as vdw
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 from lightdock.error.lightdock_errors import NotSupportedInScoringError
 
@@ -45,7 +44,7 @@ class DNAModel(DockingModel):
         """Creates a copy of the current model"""
         return DNAModel(
             self.objects,
-            self.coordinates.copy(),
+            self.coordinates,
             self.restraints,
             self.charges,
             self.vdw_energy,
@@ -60,8 +59,10 @@ class DNAAdapter(ModelAdapter):
     to_translate = {"HIS": "HID", "THY": "DT", "ADE": "DA", "CYT": "DC", "GUA": "DG"}
 
     def _get_docking_model(self, molecule, restraints):
+        amber = get_amber_parameters()
         atoms = molecule.atoms
         parsed_restraints = {}
+        indexes = []
         # Assign properties to atoms
         for atom_index, atom in enumerate(atoms):
             res_id = f"{atom.chain_id}.{atom.residue_name}.{atom.residue_number}{atom.residue_insertion}"
@@ -79,36 +80,24 @@ class DNAAdapter(ModelAdapter):
                     atom_name = amber.translate[atom.name]
 
                 atom_id = "%s-%s" % (res_name, atom_name)
-                try:
-                    atom.amber_type = amber.amber_types[atom_id]
-                except Exception as e:
-                    # Maybe H N-terminal?
-                    if atom_name in ["H1", "H2", "H3"]:
-                        atom_name = "H"
-                        atom_id = "%s-%s" % (res_name, atom_name)
-                        atom.amber_type = amber.amber_types[atom_id]
-                    else:
-                        raise e
+                # Maybe H N-terminal?
+                if atom_id not in amber and atom_name in ["H1", "H2", "H3"]:
+                    atom_name = "H"
+                    atom_id = "%s-%s" % (res_name, atom_name)
+                indexes.append(amber.atom_index[atom_id])
             except KeyError:
                 raise NotSupportedInScoringError(
                     "Residue {} or atom {} not supported. ".format(res_id, atom_name)
                     + "DNA scoring only supports AMBER94 types."
                 )
 
-            try:
-                atom.charge = amber.charges[atom_id]
-            except:
-                # Go for N-terminal
-                atom.charge = amber.nt_charges[atom_id]
-            atom.mass = amber.masses[atom.amber_type]
-            atom.vdw_energy = vdw.vdw_energy[atom.amber_type]
-            atom.vdw_radius = vdw.vdw_radii[atom.amber_type]
-
         # Prepare common model information
-        elec_charges = np.array([atom.charge for atom in atoms])
-        vdw_energies = np.array([atom.vdw_energy for atom in atoms])
-        vdw_radii = np.array([atom.vdw_radius for atom in atoms])
-        coordinates = molecule.copy_coordinates()
+        indexes = np.array(indexes, dtype=np.intp)
+        atom_types = amber.assign(atoms, indexes)
+        elec_charges = amber.charges[indexes]
+        vdw_energies = amber.vdw_energy[atom_types]
+        vdw_radii = amber.vdw_radii[atom_types]
+        coordinates = molecule.atom_coordinates
 
         reference_points = ModelAdapter.load_reference_points(molecule)
 
@@ -163,10 +152,10 @@ class DNA(ScoringFunction):
         )
         energy = (elec + parameters.scoring_vdw_weight * vdw) * -1.0
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, set(interface_receptor)
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, set(interface_ligand)
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
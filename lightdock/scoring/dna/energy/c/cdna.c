@@ -3,6 +3,7 @@
 #include <Python.h>
 #include "structmember.h"
 #include "numpy/arrayobject.h"
+#include "neighbors.h"
 
 
 #define EPSILON 4.0
@@ -22,66 +23,79 @@
  * calculate_energy pyDock C implementation
  *
  **/
+static CellList receptor_cells = {0};
+
 static PyObject * cdna_calculate_energy(PyObject *self, PyObject *args) {
     PyObject *receptor_coordinates, *ligand_coordinates = NULL;
     PyObject *tmp0, *tmp1 = NULL;
-    PyArrayObject *rec_charges, *lig_charges, *rec_vdw, *lig_vdw, *rec_vdw_radii, *lig_vdw_radii = NULL;
-    double atom_elec, total_elec, total_vdw, vdw_energy, vdw_radius, p6, k;
-    unsigned int rec_len, lig_len, i, j;
-    unsigned int interface_len, intf_array_size;
+    PyArrayObject *rec_coordinates_array, *lig_coordinates_array = NULL;
+    unsigned int rec_len, lig_len, j, interface_len, interface_size;
     unsigned int *interface_receptor = NULL, *interface_ligand = NULL;
-    double **rec_array, **lig_array, x, y, z, distance2, interface_cutoff, interface_cutoff2;
-    npy_intp dims[2];
+    int i, c, num_neighbors, neighbors[27];
+    double *rec_array, *lig_array, x, y, z, interface_cutoff, interface_cutoff2, cell_size;
+    npy_intp dims[1];
+    PyObject *result;
+    PyArrayObject *rec_charges, *lig_charges, *rec_vdw, *lig_vdw, *rec_vdw_radii, *lig_vdw_radii = NULL;
+    double atom_elec, total_elec, total_vdw, vdw_energy, vdw_radius, p6, k, distance2;
     double *rec_c_charges, *lig_c_charges, *rec_c_vdw, *lig_c_vdw, *rec_c_vdw_radii, *lig_c_vdw_radii = NULL;
-    PyObject *result = PyTuple_New(4);
 
     total_elec = 0.0;
     atom_elec = 0.0;
     total_vdw = 0.0;
     interface_len = 0;
-    intf_array_size = 1;
+    interface_size = 0;
     interface_cutoff = 3.9;
 
-    if (PyArg_ParseTuple(args, "OOOOOOOO|d",
+    if (!PyArg_ParseTuple(args, "OOOOOOOO|d",
             &receptor_coordinates, &ligand_coordinates, &rec_charges, &lig_charges,
             &rec_vdw, &lig_vdw, &rec_vdw_radii, &lig_vdw_radii, &interface_cutoff)) {
+        return NULL;
+    }
 
-        interface_cutoff2 = interface_cutoff*interface_cutoff;
-
-
-        tmp0 = PyObject_GetAttrString(receptor_coordinates, "coordinates");
-        tmp1 = PyObject_GetAttrString(ligand_coordinates, "coordinates");
-
-        rec_len = PySequence_Size(tmp0);
-        lig_len = PySequence_Size(tmp1);
-
-        dims[1] = 3;
-        dims[0] = rec_len;
-        PyArray_AsCArray((PyObject **)&tmp0, (void **)&rec_array, dims, 2, PyArray_DescrFromType(NPY_DOUBLE));
-
-        dims[0] = lig_len;
-        PyArray_AsCArray((PyObject **)&tmp1, (void **)&lig_array, dims, 2, PyArray_DescrFromType(NPY_DOUBLE));
-
-        // Get pointers to the Python array structures
-        rec_c_charges = PyArray_GETPTR1(rec_charges, 0);
-        lig_c_charges = PyArray_GETPTR1(lig_charges, 0);
-        rec_c_vdw = PyArray_GETPTR1(rec_vdw, 0);
-        lig_c_vdw = PyArray_GETPTR1(lig_vdw, 0);
-        rec_c_vdw_radii = PyArray_GETPTR1(rec_vdw_radii, 0);
-        lig_c_vdw_radii = PyArray_GETPTR1(lig_vdw_radii, 0);
+    interface_cutoff2 = interface_cutoff*interface_cutoff;
+    cell_size = (interface_cutoff > ELEC_DIST_CUTOFF) ? interface_cutoff : ELEC_DIST_CUTOFF;
 
-        // Store interface
-        interface_receptor = malloc(lig_len*sizeof(unsigned int));
-        interface_ligand  = malloc(lig_len*sizeof(unsigned int));
+    tmp0 = PyObject_GetAttrString(receptor_coordinates, "coordinates");
+    tmp1 = PyObject_GetAttrString(ligand_coordinates, "coordinates");
+    if (tmp0 == NULL || tmp1 == NULL) {
+        Py_XDECREF(tmp0);
+        Py_XDECREF(tmp1);
+        return NULL;
+    }
+    rec_coordinates_array = (PyArrayObject *)PyArray_FROM_OTF(tmp0, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    lig_coordinates_array = (PyArrayObject *)PyArray_FROM_OTF(tmp1, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    Py_DECREF(tmp0);
+    Py_DECREF(tmp1);
+    if (rec_coordinates_array == NULL || lig_coordinates_array == NULL) {
+        Py_XDECREF(rec_coordinates_array);
+        Py_XDECREF(lig_coordinates_array);
+        return NULL;
+    }
 
-        // For all atoms in receptor
-        for (i = 0; i < rec_len; i++) {
-            // For all atoms in ligand
-            for (j = 0; j < lig_len; j++) {
+    rec_len = PyArray_DIM(rec_coordinates_array, 0);
+    lig_len = PyArray_DIM(lig_coordinates_array, 0);
+    rec_array = PyArray_DATA(rec_coordinates_array);
+    lig_array = PyArray_DATA(lig_coordinates_array);
+
+    // Get pointers to the Python array structures
+    rec_c_charges = PyArray_GETPTR1(rec_charges, 0);
+    lig_c_charges = PyArray_GETPTR1(lig_charges, 0);
+    rec_c_vdw = PyArray_GETPTR1(rec_vdw, 0);
+    lig_c_vdw = PyArray_GETPTR1(lig_vdw, 0);
+    rec_c_vdw_radii = PyArray_GETPTR1(rec_vdw_radii, 0);
+    lig_c_vdw_radii = PyArray_GETPTR1(lig_vdw_radii, 0);
+
+    if (!cell_list_update(&receptor_cells, rec_array, rec_len, cell_size)) goto memory_error;
+
+    // For all atoms in ligand, only receptor atoms in the neighbour cells are visited
+    for (j = 0; j < lig_len; j++) {
+        num_neighbors = cell_list_neighbors(&receptor_cells, &lig_array[j*3], neighbors);
+        for (c = 0; c < num_neighbors; c++) {
+            for (i = receptor_cells.head[neighbors[c]]; i >= 0; i = receptor_cells.next[i]) {
                 // Euclidean^2 distance
-                x = rec_array[i][0] - lig_array[j][0];
-                y = rec_array[i][1] - lig_array[j][1];
-                z = rec_array[i][2] - lig_array[j][2];
+                x = rec_array[i*3] - lig_array[j*3];
+                y = rec_array[i*3+1] - lig_array[j*3+1];
+                z = rec_array[i*3+2] - lig_array[j*3+2];
                 distance2 = x*x + y*y + z*z;
 
                 // Electrostatics energy
@@ -103,40 +117,37 @@ static PyObject * cdna_calculate_energy(PyObject *self, PyObject *args) {
                 }
 
                 if (distance2 <= interface_cutoff2) {
-                   interface_receptor[interface_len] = i;
-                   interface_ligand[interface_len++] = j;
+                    if (!add_interface_pair(&interface_receptor, &interface_ligand,
+                                            &interface_len, &interface_size, i, j)) goto memory_error;
                 }
             }
-
-            if (((interface_len + lig_len - 1)/lig_len + 1) > intf_array_size) {
-                intf_array_size++;
-                interface_receptor = realloc(interface_receptor, intf_array_size*lig_len*sizeof(unsigned int));
-                interface_ligand = realloc(interface_ligand, intf_array_size*lig_len*sizeof(unsigned int));
-            }
-
         }
-        // Convert total electrostatics to Kcal/mol:
-        //      - coordinates are in Ang
-        //      - charges are in e (elementary charge units)
-        total_elec = total_elec * FACTOR / EPSILON;
-
-        // Free structures
-        PyArray_Free(tmp0, rec_array);
-        PyArray_Free(tmp1, lig_array);
-        Py_DECREF(tmp0);
-        Py_DECREF(tmp1);
     }
-    
-    interface_receptor = realloc(interface_receptor, interface_len*sizeof(unsigned int));
-    interface_ligand = realloc(interface_ligand, interface_len*sizeof(unsigned int));
+    // Convert total electrostatics to Kcal/mol:
+    //      - coordinates are in Ang
+    //      - charges are in e (elementary charge units)
+    total_elec = total_elec * FACTOR / EPSILON;
+
+    // Free structures
+    Py_DECREF(rec_coordinates_array);
+    Py_DECREF(lig_coordinates_array);
+
     dims[0] = interface_len;
 
     // Return a tuple with the following values for calculated energies:
+    result = PyTuple_New(4);
     PyTuple_SetItem(result, 0, PyFloat_FromDouble(total_elec));
     PyTuple_SetItem(result, 1, PyFloat_FromDouble(total_vdw));
     PyTuple_SetItem(result, 2, PyArray_SimpleNewFromData(1, dims, NPY_UINT, interface_receptor));
     PyTuple_SetItem(result, 3, PyArray_SimpleNewFromData(1, dims, NPY_UINT, interface_ligand));
     return result;
+
+memory_error:
+    free(interface_receptor);
+    free(interface_ligand);
+    Py_DECREF(rec_coordinates_array);
+    Py_DECREF(lig_coordinates_array);
+    return PyErr_NoMemory();
 }
 
 
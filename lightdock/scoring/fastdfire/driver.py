@@ -8,6 +8,7 @@ import numpy as np
 from pathlib import Path
 from lightdock.structure.model import DockingModel
 from lightdock.scoring.functions import ModelAdapter, ScoringFunction
+from lightdock.scoring.potentials import load_potentials
 from lightdock.scoring.fastdfire.c.cdfire import calculate_dfire
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 from lightdock.error.lightdock_errors import NotSupportedInScoringError
@@ -321,20 +322,17 @@ class DFIREPotential(object):
     def __init__(self):
         data_path = Path(__file__).absolute().parent / "data"
 
-        self.dfire_energy = self._read_potentials(data_path / "DCparams")
+        self.dfire_energy = load_potentials(
+            data_path / "DCparams", self._read_potentials
+        )
 
     def _read_potentials(self, data_file_name):
         """Reads DFIRE data potentials"""
-        dfire_energy = np.empty((168, 168, 20), dtype=np.double)
-        infile = open(data_file_name).readlines()
-        count = 0
-        for x in range(168):
-            for y in range(168):
-                for z in range(20):
-                    dfire_energy[x][y][z] = np.double(infile[count].strip())
-                    count += 1
-
-        return dfire_energy
+        shape = (168, 168, 20)
+        dfire_energy = np.loadtxt(
+            data_file_name, dtype=np.double, max_rows=np.prod(shape)
+        )
+        return dfire_energy.reshape(shape)
 
 
 class DFIREAdapter(ModelAdapter):
@@ -398,7 +396,7 @@ class DFIREAdapter(ModelAdapter):
         try:
             return DockingModel(
                 dfire_objects,
-                molecule.copy_coordinates(),
+                molecule.atom_coordinates,
                 restraints=parsed_restraints,
                 membrane=membrane,
                 n_modes=molecule.n_modes.copy(),
@@ -407,7 +405,7 @@ class DFIREAdapter(ModelAdapter):
         except AttributeError:
             return DockingModel(
                 dfire_objects,
-                molecule.copy_coordinates(),
+                molecule.atom_coordinates,
                 restraints=parsed_restraints,
                 membrane=membrane,
                 nm_mask=molecule.nm_mask,
@@ -430,20 +428,18 @@ class DFIRE(ScoringFunction):
             ligand_coordinates,
             DEFAULT_CONTACT_RESTRAINTS_CUTOFF,
         )
-        interface_receptor = set(interface_receptor)
-        interface_ligand = set(interface_ligand)
 
         # Code to consider contacts in the interface
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
 
         # Calculate membrane interaction
         membrane_intersection = ScoringFunction.restraints_satisfied(
-            receptor.membrane, interface_receptor
+            receptor.compiled_membrane, interface_receptor
         )
         membrane_penalty = 0.0
         if membrane_intersection > 0.0:
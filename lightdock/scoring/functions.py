@@ -1,18 +1,25 @@
 import numpy as np
+from scipy.spatial import cKDTree
 from lightdock.constants import (
     DEFAULT_LIGHTDOCK_PREFIX,
     DEFAULT_ELLIPSOID_DATA_EXTENSION,
     NUMPY_FILE_SAVE_EXTENSION,
 )
 from lightdock.gso.searchspace.ofunction import ObjectiveFunction
+from lightdock.structure.model import CompiledRestraints
 
 
 class ScoringFunction(ObjectiveFunction):
     """Scoring Functions interface"""
 
-    def __init__(self, weight=1.0, anm_support=True):
+    # Distance up to which the function uses receptor and ligand atom pairs, if they
+    # can be given to it. None if the function finds its own contacts
+    pair_cutoff = None
+
+    def __init__(self, weight=1.0, anm_support=True, anm_rec_support=True):
         self.weight = float(weight)
         self.anm_support = anm_support
+        self.anm_rec_support = anm_rec_support
 
     def __call__(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
         """Calculates the value of the scoring function.
@@ -22,19 +29,33 @@ class ScoringFunction(ObjectiveFunction):
         """
         raise NotImplementedError()
 
+    @staticmethod
+    def get_pairs(receptor_coordinates, ligand_coordinates, cutoff, pairs=None):
+        """Receptor and ligand atom pairs closer than cutoff, as the structured array of
+        cKDTree.sparse_distance_matrix: receptor index i, ligand index j and distance v.
+
+        pairs calculated for a longer cutoff are filtered instead of calculated again.
+        """
+        if pairs is not None:
+            return pairs[pairs["v"] <= cutoff]
+        return cKDTree(
+            getattr(receptor_coordinates, "coordinates", receptor_coordinates)
+        ).sparse_distance_matrix(
+            cKDTree(getattr(ligand_coordinates, "coordinates", ligand_coordinates)),
+            cutoff,
+            output_type="ndarray",
+        )
+
     @staticmethod
     def restraints_satisfied(restraints, interface):
-        """Calculates the percentage of satisfied restraints"""
-        if not restraints:
-            return 0.0
-
-        total = len(restraints)
-        satisfied = 0
-        for residue in restraints:
-            intersection = set(restraints[residue]) & interface
-            if len(intersection) > 0:
-                satisfied += 1
-        return float(satisfied) / total
+        """Calculates the percentage of satisfied restraints.
+
+        restraints can be a dictionary of residues and their atom indexes or its
+        CompiledRestraints version, interface a set or an array of atom indexes.
+        """
+        if not isinstance(restraints, CompiledRestraints):
+            restraints = CompiledRestraints(restraints)
+        return restraints.satisfied(interface)
 
 
 class ModelAdapter(object):
@@ -9,6 +9,8 @@ equilibrium mixture approximation of residues. Proteins 1999;34:49-68.
 """
 
 import os
+import numpy as np
+from scipy.spatial.distance import cdist
 from lightdock.error.lightdock_errors import PotentialsParsingError
 from lightdock.structure.model import DockingModel
 from lightdock.structure.space import SpacePoints
@@ -82,6 +84,14 @@ class MJPotential(object):
         return potentials
 
 
+class MJ3hModel(DockingModel):
+    """DockingModel of residues with their MJ potential types precomputed"""
+
+    def __init__(self, objects, coordinates, restraints, residue_types):
+        super(MJ3hModel, self).__init__(objects, coordinates, restraints)
+        self.residue_types = residue_types
+
+
 class MJ3hAdapter(ModelAdapter):
     """Adapts a given Complex to a DockingModel object suitable for this
     MJ3h scoring function.
@@ -129,7 +139,18 @@ class MJ3hAdapter(ModelAdapter):
 
             list_of_coordinates.append(SpacePoints(coordinates))
 
-        return DockingModel(residues, list_of_coordinates, parsed_restraints)
+        # Residues not found in the potentials are assigned to the last type,
+        # which has no energy
+        residue_types = np.array(
+            [
+                MJPotential.residues.get(residue.name, len(MJPotential.residues))
+                for residue in residues
+            ],
+            dtype=int,
+        )
+        return MJ3hModel(
+            residues, list_of_coordinates, parsed_restraints, residue_types
+        )
 
 
 class MJ3h(ScoringFunction):
@@ -166,6 +187,10 @@ class MJ3h(ScoringFunction):
         self.penalization = penalization
         self.potential = MJPotential()
         self.potentials = self.potential.potentials["MJ3h"]
+        # Extra row and column for residues without potential
+        num_types = len(MJ3h.potentials_dict)
+        self.potentials_matrix = np.zeros((num_types + 1, num_types + 1))
+        self.potentials_matrix[:num_types, :num_types] = self.potentials
         self.cutoff = (
             DEFAULT_CONTACT_RESTRAINTS_CUTOFF * DEFAULT_CONTACT_RESTRAINTS_CUTOFF
         )
@@ -174,35 +199,28 @@ class MJ3h(ScoringFunction):
         """Calculates the MJ3h potential taking into account the contacts between receptor
         and ligand. Receptor and ligand are DockingModel objects.
         """
-        energy = 0.0
-        interface_receptor = []
-        interface_ligand = []
-        for index_rec, res1 in enumerate(receptor.objects):
-            for index_lig, res2 in enumerate(ligand.objects):
-                [x1, y1, z1] = receptor_coordinates[index_rec]
-                [x2, y2, z2] = ligand_coordinates[index_lig]
-                distance = (x1 - x2) ** 2 + (y1 - y2) ** 2 + (z1 - z2) ** 2
-                if distance < MJ3h.max_distance_cutoff:
-                    if distance < MJ3h.min_distance_cutoff:
-                        energy += self.penalization
-                    else:
-                        try:
-                            i_rec = MJ3h.potentials_dict[res1.name]
-                            i_lig = MJ3h.potentials_dict[res2.name]
-                            energy += self.potentials[i_rec][i_lig]
-                        except:
-                            pass
-                    if distance <= self.cutoff:
-                        interface_receptor.append(index_rec)
-                        interface_ligand.append(index_lig)
-        interface_receptor = set(interface_receptor)
-        interface_ligand = set(interface_ligand)
+        distances = cdist(
+            receptor_coordinates.coordinates,
+            ligand_coordinates.coordinates,
+            "sqeuclidean",
+        )
+        index_rec, index_lig = np.nonzero(distances < MJ3h.max_distance_cutoff)
+        distances = distances[index_rec, index_lig]
+        clashes = distances < MJ3h.min_distance_cutoff
+        energy = self.penalization * np.count_nonzero(clashes)
+        energy += self.potentials_matrix[
+            receptor.residue_types[index_rec[~clashes]],
+            ligand.residue_types[index_lig[~clashes]],
+        ].sum()
+        in_interface = distances <= self.cutoff
+        interface_receptor = index_rec[in_interface]
+        interface_ligand = index_lig[in_interface]
         energy *= -1.0
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
@@ -1,4 +1,6 @@
 import os
+import numpy as np
+from lightdock.scoring.functions import ScoringFunction
 
 
 class ScoringConfiguration(object):
@@ -20,3 +22,117 @@ class ScoringConfiguration(object):
                 except ValueError:
                     pass
         return functions
+
+
+class CompositeScoringFunction(ScoringFunction):
+    """Sum of several weighted scoring functions evaluated on the same pose.
+
+    Adapters of all the functions must share the coordinates of their docking models, so
+    the ligand pose calculated for the first one is valid for the rest. Each function is
+    called with the docking models of its own adapter. Functions with a pair_cutoff
+    share a single list of receptor and ligand atom pairs per pose.
+    """
+
+    def __init__(self, scoring_functions, adapters):
+        super(CompositeScoringFunction, self).__init__(
+            weight=1.0,
+            anm_support=all(function.anm_support for function in scoring_functions),
+            anm_rec_support=all(
+                function.anm_rec_support for function in scoring_functions
+            ),
+        )
+        self.scoring_functions = scoring_functions
+        self.adapters = adapters
+        pair_cutoffs = [
+            function.pair_cutoff
+            for function in scoring_functions
+            if function.pair_cutoff is not None
+        ]
+        # Pairs are only shared if more than one function uses them
+        self.shared_pair_cutoff = max(pair_cutoffs) if len(pair_cutoffs) > 1 else None
+
+    def __call__(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
+        pairs = None
+        if self.shared_pair_cutoff is not None:
+            pairs = ScoringFunction.get_pairs(
+                receptor_coordinates, ligand_coordinates, self.shared_pair_cutoff
+            )
+        energy = 0.0
+        for function, adapter in zip(self.scoring_functions, self.adapters):
+            arguments = (
+                adapter.receptor_model,
+                receptor_coordinates,
+                adapter.ligand_model,
+                ligand_coordinates,
+            )
+            if pairs is not None and function.pair_cutoff is not None:
+                energy += function(*arguments, pairs=pairs)
+            else:
+                energy += function(*arguments)
+        return energy
+
+    @staticmethod
+    def _same_array(array, other):
+        if array is None or other is None:
+            return array is None and other is None
+        return np.array_equal(np.asarray(array), np.asarray(other))
+
+    @staticmethod
+    def share_coordinates(adapter, other):
+        """Checks if the docking models of both adapters are moved the same way"""
+        for model, other_model in (
+            (adapter.receptor_model, other.receptor_model),
+            (adapter.ligand_model, other.ligand_model),
+        ):
+            if len(model) != len(other_model):
+                return False
+            for coordinates, other_coordinates in zip(
+                model.coordinates, other_model.coordinates
+            ):
+                if not CompositeScoringFunction._same_array(
+                    coordinates.coordinates, other_coordinates.coordinates
+                ):
+                    return False
+            if not (
+                CompositeScoringFunction._same_array(
+                    model.reference_points.coordinates,
+                    other_model.reference_points.coordinates,
+                )
+                and CompositeScoringFunction._same_array(
+                    model.n_modes, other_model.n_modes
+                )
+                and CompositeScoringFunction._same_array(
+                    model.nm_mask, other_model.nm_mask
+                )
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def group(scoring_functions, adapters):
+        """Joins the scoring functions whose adapters share coordinates.
+
+        Returns the new list of scoring functions and adapters, one per group, so the
+        pose of the ligand is only calculated once for all the functions of a group.
+        """
+        groups = []
+        for function, adapter in zip(scoring_functions, adapters):
+            for group in groups:
+                if CompositeScoringFunction.share_coordinates(group[1][0], adapter):
+                    group[0].append(function)
+                    group[1].append(adapter)
+                    break
+            else:
+                groups.append(([function], [adapter]))
+
+        grouped_functions = []
+        grouped_adapters = []
+        for functions, group_adapters in groups:
+            if len(functions) == 1:
+                grouped_functions.append(functions[0])
+            else:
+                grouped_functions.append(
+                    CompositeScoringFunction(functions, group_adapters)
+                )
+            grouped_adapters.append(group_adapters[0])
+        return grouped_functions, grouped_adapters
@@ -1,11 +1,16 @@
 """calculate_pisa Cython implementation."""
 
-from lightdock.structure.atom import Atom
+import numpy as np
 from lightdock.structure.model import DockingModel
 from lightdock.structure.space import SpacePoints
 
 
-def calculate_pisa(receptor: DockingModel[Atom], receptor_coordinates: SpacePoints, ligand: DockingModel[Atom], ligand_coordinates: SpacePoints, pisa_energy: list[list[list[float]]], interface_cutoff: float) -> tuple[float, set[int], set[int]]:
+def get_distance_to_bin(dist: float) -> int:
+    """Spline bin of the given distance, -1 if out of range."""
+    ...
+
+
+def calculate_pisa(receptor: DockingModel[int], receptor_coordinates: SpacePoints, ligand: DockingModel[int], ligand_coordinates: SpacePoints, pisa_energy: np.ndarray, interface_cutoff: float) -> tuple[float, np.ndarray, np.ndarray]:
     """
     calculate_pisa Cython implementation.
 
@@ -1,30 +1,30 @@
 #cython: boundscheck=False
 #cython: wraparound=False
+#cython: cdivision=True
 #cython: language_level=3
 
-from libc.math cimport sqrt, pow
+from libc.math cimport sqrt, floor
 import numpy as np
-import scipy.spatial
+cimport numpy as np
+
+np.import_array()
 
 cdef:
-    unsigned int num_bins = 3
-    unsigned int num_bins_spline = 5
-    unsigned int num_atom_types = 32
-    int r = -1
-    float max_distance = 8.
-    float min_distance = 2.
+    int num_bins = 3
+    int num_bins_spline = 5
+    int num_atom_types = 32
+    double max_distance = 8.
+    double min_distance = 2.
 
-    r1Spline = [2.0, 3.0, 4.0, 4.5, 6.0]
-    r2Spline = [3.0, 4.0, 4.5, 6.0, 8.0]
+    double r1Spline[5]
+    double r2Spline[5]
 
-    r1 = [2.0, 3.5, 5.0]
-    r2 = [3.5, 5.0, 8.0]
+r1Spline[:] = [2.0, 3.0, 4.0, 4.5, 6.0]
+r2Spline[:] = [3.0, 4.0, 4.5, 6.0, 8.0]
 
-    float dist = 0.
-    unsigned int itype = 0
-    unsigned int jtype = 0
 
-cpdef get_distance_to_bin(float dist):
+cdef inline int distance_to_bin(float dist) noexcept nogil:
+    cdef int i
     if dist >= max_distance or dist < min_distance:
         return -1
     i = num_bins_spline - 1
@@ -32,44 +32,147 @@ cpdef get_distance_to_bin(float dist):
         i -= 1
     return i
 
+
+cpdef get_distance_to_bin(float dist):
+    return distance_to_bin(dist)
+
+
+cdef inline void add_contact(double[:, :, ::1] num_contacts, int itype, int jtype,
+                             double dist) noexcept nogil:
+    """Spline interpolation of a contact between atom types into the PISA bins"""
+    # Bins are calculated in single precision as in the original implementation
+    cdef int r = distance_to_bin(<float>dist)
+    if jtype < itype:
+        itype, jtype = jtype, itype
+    if r == 0:
+        num_contacts[itype, jtype, 0] += 1.
+    elif r == 1:
+        num_contacts[itype, jtype, 0] += (4. - dist)
+        num_contacts[itype, jtype, 1] += (dist - 3.)
+    elif r == 2:
+        num_contacts[itype, jtype, 1] += 1.
+    elif r == 3:
+        num_contacts[itype, jtype, 1] += (4. - (dist / 3.))
+        num_contacts[itype, jtype, 2] += (dist / 3.) - 3.
+    elif r == 4:
+        num_contacts[itype, jtype, 2] += 1.
+
+
 cpdef calculate_pisa(receptor, receptor_coordinates, ligand, ligand_coordinates, pisa_energy, interface_cutoff):
-    num_contacts = np.zeros((num_atom_types, num_atom_types, num_bins), dtype=np.float64)
-    energy = 0.
-    dist_matrix = scipy.spatial.distance.cdist(receptor_coordinates, ligand_coordinates)
-    atom_indexes = np.where((dist_matrix >= min_distance) & (dist_matrix <= max_distance))
-    interface_receptor = []
-    interface_ligand = []
-
-    for i,j in zip(atom_indexes[0], atom_indexes[1]):
-        dist = dist_matrix[i][j]
-        if dist <= interface_cutoff:
-            interface_receptor.append(i)
-            interface_ligand.append(j)
-        r = get_distance_to_bin(dist)
-        itype = receptor.objects[i].pisa_type
-        jtype = ligand.objects[j].pisa_type
-        # swap types, so that itype is always <= jtype
-        if jtype < itype:
-            jtype, itype = itype, jtype
-
-        if r == 0:
-            num_contacts[itype-1][jtype-1][0] += 1.
-        elif r == 1:
-            num_contacts[itype-1][jtype-1][0] += (4. - dist)
-            num_contacts[itype-1][jtype-1][1] += (dist - 3.)
-        elif r == 2:
-            num_contacts[itype-1][jtype-1][1] += 1.
-        elif r == 3:
-            num_contacts[itype-1][jtype-1][1] += (4. - (dist/3.))
-            num_contacts[itype-1][jtype-1][2] += (dist/3.)-3.
-        elif r == 4:
-            num_contacts[itype-1][jtype-1][2] += 1.
-        else:
-            pass
-
-    for i in range(num_atom_types):
-        for j in range(num_atom_types):
-            for r in range(num_bins):
-                energy += num_contacts[i][j][r] * pisa_energy[i][j][r]
-
-    return energy * -1., set(interface_receptor), set(interface_ligand)
+    """Calculates the PISA energy of the contacts between receptor and ligand.
+
+    Atom types are taken from the objects of the docking models (1 to num_atom_types,
+    -1 for atoms without type). Ligand atoms are sorted in a cell list of max_distance
+    size, so only the neighbour cells of each receptor atom are visited. Contacts are
+    accumulated by receptor and then ligand atom index, so the floating point sums are
+    done in the same order as in the dense implementation.
+    Interface atoms are returned as arrays of indexes.
+    """
+    cdef:
+        double[:, ::1] rec = np.ascontiguousarray(
+            getattr(receptor_coordinates, "coordinates", receptor_coordinates), dtype=np.float64)
+        double[:, ::1] lig = np.ascontiguousarray(
+            getattr(ligand_coordinates, "coordinates", ligand_coordinates), dtype=np.float64)
+        int[::1] rec_types = np.ascontiguousarray(receptor.objects, dtype=np.intc)
+        int[::1] lig_types = np.ascontiguousarray(ligand.objects, dtype=np.intc)
+        const double[:, :, ::1] potential = np.ascontiguousarray(pisa_energy, dtype=np.float64)
+        double[:, :, ::1] num_contacts = np.zeros(
+            (num_atom_types, num_atom_types, num_bins), dtype=np.float64)
+        double cutoff = interface_cutoff
+        int rec_len = rec.shape[0]
+        int lig_len = lig.shape[0]
+        np.ndarray[np.uint8_t, ndim=1] rec_interface = np.zeros(rec_len, dtype=np.uint8)
+        np.ndarray[np.uint8_t, ndim=1] lig_interface = np.zeros(lig_len, dtype=np.uint8)
+        double energy = 0.
+        double origin[3]
+        int num_cells[3]
+        int cell[3]
+        int[::1] head
+        int[::1] next_atom
+        int[::1] neighbours
+        double[::1] neighbour_distances
+        int num_neighbours
+        int i, j, k, n, d, cx, cy, cz, itype, jtype, index
+        double x, y, z, dist2, dist
+        double min_distance2 = min_distance * min_distance
+        double max_distance2 = max_distance * max_distance
+
+    if rec_len == 0 or lig_len == 0:
+        return 0., np.flatnonzero(rec_interface), np.flatnonzero(lig_interface)
+
+    # Ligand cell list
+    for d in range(3):
+        origin[d] = lig[0, d]
+    for j in range(lig_len):
+        for d in range(3):
+            if lig[j, d] < origin[d]:
+                origin[d] = lig[j, d]
+    for d in range(3):
+        num_cells[d] = 1
+    for j in range(lig_len):
+        for d in range(3):
+            index = <int>floor((lig[j, d] - origin[d]) / max_distance) + 1
+            if index > num_cells[d]:
+                num_cells[d] = index
+    head = np.full(num_cells[0] * num_cells[1] * num_cells[2], -1, dtype=np.intc)
+    next_atom = np.full(lig_len, -1, dtype=np.intc)
+    for j in range(lig_len):
+        if lig_types[j] < 1:
+            continue
+        for d in range(3):
+            cell[d] = <int>floor((lig[j, d] - origin[d]) / max_distance)
+        index = (cell[0] * num_cells[1] + cell[1]) * num_cells[2] + cell[2]
+        next_atom[j] = head[index]
+        head[index] = j
+    neighbours = np.empty(lig_len, dtype=np.intc)
+    neighbour_distances = np.empty(lig_len, dtype=np.float64)
+
+    with nogil:
+        for i in range(rec_len):
+            itype = rec_types[i] - 1
+            if itype < 0:
+                continue
+            for d in range(3):
+                cell[d] = <int>floor((rec[i, d] - origin[d]) / max_distance)
+            num_neighbours = 0
+            for cx in range(cell[0] - 1, cell[0] + 2):
+                if cx < 0 or cx >= num_cells[0]:
+                    continue
+                for cy in range(cell[1] - 1, cell[1] + 2):
+                    if cy < 0 or cy >= num_cells[1]:
+                        continue
+                    for cz in range(cell[2] - 1, cell[2] + 2):
+                        if cz < 0 or cz >= num_cells[2]:
+                            continue
+                        j = head[(cx * num_cells[1] + cy) * num_cells[2] + cz]
+                        while j >= 0:
+                            x = rec[i, 0] - lig[j, 0]
+                            y = rec[i, 1] - lig[j, 1]
+                            z = rec[i, 2] - lig[j, 2]
+                            dist2 = x*x + y*y + z*z
+                            if dist2 >= min_distance2 and dist2 <= max_distance2:
+                                # Insertion by ligand atom index
+                                k = num_neighbours
+                                while k > 0 and neighbours[k - 1] > j:
+                                    neighbours[k] = neighbours[k - 1]
+                                    neighbour_distances[k] = neighbour_distances[k - 1]
+                                    k -= 1
+                                neighbours[k] = j
+                                neighbour_distances[k] = sqrt(dist2)
+                                num_neighbours += 1
+                            j = next_atom[j]
+            for n in range(num_neighbours):
+                j = neighbours[n]
+                dist = neighbour_distances[n]
+                if dist <= cutoff:
+                    rec_interface[i] = 1
+                    lig_interface[j] = 1
+                add_contact(num_contacts, itype, lig_types[j] - 1, dist)
+
+        for itype in range(num_atom_types):
+            for jtype in range(num_atom_types):
+                for n in range(num_bins):
+                    energy += num_contacts[itype, jtype, n] * potential[itype, jtype, n]
+
+    return (energy * -1., np.flatnonzero(rec_interface),
+            np.flatnonzero(lig_interface))
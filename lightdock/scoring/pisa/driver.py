@@ -7,8 +7,10 @@ Original binary downloaded from http://clsb.ices.utexas.edu/web/dock_details.htm
 """
 
 import os
+import numpy as np
 from lightdock.structure.model import DockingModel
 from lightdock.scoring.functions import ModelAdapter, ScoringFunction
+from lightdock.scoring.potentials import load_potentials
 from lightdock.scoring.pisa.cython.cpisa import calculate_pisa
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 
@@ -24,18 +26,20 @@ class PISAPotential(object):
 
     def __init__(self):
         data_path = os.path.dirname(os.path.realpath(__file__)) + "/data/"
-        self.pisa_energy = PISAPotential._read_parameters(data_path + "pisa.params")
+        self.pisa_energy = load_potentials(
+            data_path + "pisa.params", PISAPotential._read_parameters
+        )
 
     @staticmethod
     def _read_parameters(data_file_name):
         """Reads PISA beans"""
-        params_atom_potentials = [
-            [
-                [0 for k in range(PISAPotential.num_bins)]
-                for j in range(PISAPotential.num_atom_types)
-            ]
-            for i in range(PISAPotential.num_atom_types)
-        ]
+        params_atom_potentials = np.zeros(
+            (
+                PISAPotential.num_atom_types,
+                PISAPotential.num_atom_types,
+                PISAPotential.num_bins,
+            )
+        )
         params_file = open(data_file_name)
         lines = params_file.readlines()
         params_file.close()
@@ -224,32 +228,34 @@ class PISAAdapter(ModelAdapter):
     """
 
     def _get_docking_model(self, molecule, restraints):
-        """Builds a suitable docking model for this scoring function"""
-        pisa_objects = []
-        coordinates = []
+        """Builds a suitable docking model for this scoring function.
+
+        Objects of the model are the PISA atom types of each atom, -1 if the atom
+        has no type and it is not taken into account.
+        """
+        pisa_types = []
         parsed_restraints = {}
         for atom_index, atom in enumerate(molecule.atoms):
             atom_type = PISAPotential.get_atom_type(atom.name, atom.residue_name)
+            pisa_types.append(atom_type)
             if atom_type != -1:
-                atom.pisa_type = atom_type
-                pisa_objects.append(atom)
-                coordinates.append([atom.x, atom.y, atom.z])
                 res_id = f"{atom.chain_id}.{atom.residue_name}.{atom.residue_number}{atom.residue_insertion}"
                 if restraints and res_id in restraints:
                     try:
                         parsed_restraints[res_id].append(atom_index)
                     except:
                         parsed_restraints[res_id] = [atom_index]
+        pisa_types = np.array(pisa_types, dtype=np.intc)
         try:
             return DockingModel(
-                pisa_objects,
-                molecule.copy_coordinates(),
+                pisa_types,
+                molecule.atom_coordinates,
                 parsed_restraints,
                 n_modes=molecule.n_modes.copy(),
             )
         except AttributeError:
             return DockingModel(
-                pisa_objects, molecule.copy_coordinates(), parsed_restraints
+                pisa_types, molecule.atom_coordinates, parsed_restraints
             )
 
 
@@ -270,10 +276,10 @@ class PISA(ScoringFunction):
             DEFAULT_CONTACT_RESTRAINTS_CUTOFF,
         )
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
@@ -0,0 +1,86 @@
+"""Binary cache of the potential tables of the knowledge-based scoring functions.
+
+Tables are parsed from their original text files the first time they are needed and
+stored as .npy files, which are then memory-mapped read-only, so the processes of a
+simulation share the same pages and building a scoring function does not parse text.
+"""
+
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+import numpy as np
+from lightdock.util.logger import LoggingManager
+
+
+log = LoggingManager.get_logger("potentials")
+
+# Bump it when the layout of any of the cached tables changes
+POTENTIALS_VERSION = 1
+USER_CACHE_FOLDER = Path.home() / ".cache" / "lightdock" / "potentials"
+
+
+def get_cache_files(data_file_name):
+    """Candidate cache files of data_file_name, by order of preference.
+
+    The cache is stored next to the data file or, if that folder is not writable, in the
+    user cache folder. The name of the latter includes a hash of the data file path, so
+    different installations do not share it.
+    """
+    data_file_name = Path(data_file_name).absolute()
+    cache_name = f"{data_file_name.name}.v{POTENTIALS_VERSION}.npy"
+    path_hash = hashlib.sha256(str(data_file_name).encode()).hexdigest()[:16]
+    return [
+        data_file_name.parent / cache_name,
+        USER_CACHE_FOLDER / f"{path_hash}_{cache_name}",
+    ]
+
+
+def is_up_to_date(cache_file, data_file_name):
+    """A cache file is valid if it is not older than its data file. Prebuilt cache
+    files can be shipped without the original data file.
+    """
+    if not cache_file.is_file():
+        return False
+    if not data_file_name.is_file():
+        return True
+    return cache_file.stat().st_mtime >= data_file_name.stat().st_mtime
+
+
+def save_potentials(table, cache_file):
+    """Saves table to cache_file. Several processes may convert the same table at the
+    same time, so the file is replaced atomically.
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    handle, temp_file = tempfile.mkstemp(dir=cache_file.parent, suffix=".npy")
+    try:
+        with os.fdopen(handle, "wb") as output_file:
+            np.save(output_file, table)
+        os.replace(temp_file, cache_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def load_potentials(data_file_name, parser):
+    """Loads the table of data_file_name as a read-only memory-mapped array.
+
+    parser is called with data_file_name to build the table when there is no up to date
+    cache file. If the table can not be cached, the parsed array is returned.
+    """
+    data_file_name = Path(data_file_name)
+    cache_files = get_cache_files(data_file_name)
+    for cache_file in cache_files:
+        if is_up_to_date(cache_file, data_file_name):
+            return np.load(cache_file, mmap_mode="r")
+
+    table = np.ascontiguousarray(parser(data_file_name))
+    for cache_file in cache_files:
+        try:
+            save_potentials(table, cache_file)
+            log.info(f"Potentials of {data_file_name.name} cached in {cache_file}")
+            return np.load(cache_file, mmap_mode="r")
+        except OSError:
+            continue
+    log.warning(f"Potentials of {data_file_name} could not be cached")
+    return table
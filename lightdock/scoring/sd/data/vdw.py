@@ -1,115 +0,0 @@
-"""Van der Waals parameters"""
-
-vdw_energy = {
-    "IP": 0.00277,
-    "HS": 0.0157,
-    "HP": 0.0157,
-    "Na": 0.00277,
-    "N*": 0.17,
-    "Li": 0.0183,
-    "HO": 0.0,
-    "Rb": 0.00017,
-    "HC": 0.0157,
-    "HA": 0.015,
-    "O3": 0.21,
-    "CQ": 0.086,
-    "C*": 0.086,
-    "NA": 0.17,
-    "NB": 0.17,
-    "NC": 0.17,
-    "O2": 0.21,
-    "I": 0.4,
-    "Br": 0.32,
-    "H": 0.0157,
-    "HW": 0.0,
-    "C0": 0.459789,
-    "K": 0.000328,
-    "CK": 0.086,
-    "Cs": 8.06e-05,
-    "C": 0.086,
-    "Cl": 0.1,
-    "CN": 0.086,
-    "CM": 0.086,
-    "F": 0.061,
-    "CC": 0.086,
-    "CB": 0.086,
-    "CA": 0.086,
-    "Zn": 0.0125,
-    "O": 0.21,
-    "N": 0.17,
-    "P": 0.2,
-    "S": 0.25,
-    "CR": 0.086,
-    "N2": 0.17,
-    "N3": 0.17,
-    "CW": 0.086,
-    "CV": 0.086,
-    "CT": 0.1094,
-    "MG": 0.8947,
-    "OH": 0.2104,
-    "H2": 0.0157,
-    "H3": 0.0157,
-    "H1": 0.0157,
-    "H4": 0.015,
-    "H5": 0.015,
-    "SH": 0.25,
-    "OW": 0.152,
-    "OS": 0.17,
-}
-
-vdw_radii = {
-    "IP": 1.868,
-    "HS": 0.6,
-    "HP": 1.1,
-    "Na": 1.868,
-    "N*": 1.824,
-    "Li": 1.137,
-    "HO": 0.0001,
-    "Rb": 2.956,
-    "HC": 1.487,
-    "HA": 1.459,
-    "O3": 1.6612,
-    "CQ": 1.908,
-    "C*": 1.908,
-    "NA": 1.824,
-    "NB": 1.824,
-    "NC": 1.824,
-    "O2": 1.6612,
-    "I": 2.35,
-    "Br": 2.22,
-    "H": 0.6,
-    "HW": 0.0001,
-    "C0": 1.7131,
-    "K": 2.658,
-    "CK": 1.908,
-    "Cs": 3.395,
-    "C": 1.908,
-    "Cl": 2.47,
-    "CN": 1.908,
-    "CM": 1.908,
-    "F": 1.75,
-    "CC": 1.908,
-    "CB": 1.908,
-    "CA": 1.908,
-    "Zn": 1.1,
-    "O": 1.6612,
-    "N": 1.824,
-    "P": 2.1,
-    "S": 2.0,
-    "CR": 1.908,
-    "N2": 1.824,
-    "N3": 1.875,
-    "CW": 1.908,
-    "CV": 1.908,
-    "CT": 1.908,
-    "MG": 0.7926,
-    "OH": 1.721,
-    "H2": 1.287,
-    "H3": 1.187,
-    "H1": 1.387,
-    "H4": 1.409,
-    "H5": 1.359,
-    "SH": 2.0,
-    "OW": 1.7683,
-    "OS": 1.6837,
-}
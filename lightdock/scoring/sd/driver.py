@@ -10,8 +10,7 @@ from lightdock.scoring.functions import ScoringFunction, ModelAdapter
 from lightdock.structure.model import DockingModel
 import lightdock.scoring.sd.energy.c.sd as sd
 from lightdock.util.logger import LoggingManager
-from lightdock.scoring.sd.data.amber import amber_types, masses, charges
-import lightdock.scoring.sd.data.vdw as vdw
+from lightdock.scoring.amber import get_amber_parameters
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 
 
@@ -44,7 +43,7 @@ class SDModel(DockingModel):
         """Creates a copy of the current model"""
         return SDModel(
             self.objects,
-            self.coordinates.copy(),
+            self.coordinates,
             self.restraints,
             self.charges.copy(),
             self.vdw_energy.copy(),
@@ -57,8 +56,10 @@ class SDAdapter(ModelAdapter):
     """Adapts a given Complex to a DockingModel object suitable for this scoring function."""
 
     def _get_docking_model(self, molecule, restraints):
+        amber = get_amber_parameters()
         atoms = molecule.atoms
         parsed_restraints = {}
+        indexes = []
         # Assign properties to atoms
         for atom_index, atom in enumerate(atoms):
             res_name = atom.residue_name
@@ -71,17 +72,15 @@ class SDAdapter(ModelAdapter):
                 except:
                     parsed_restraints[res_id] = [atom_index]
             atom_id = "%s-%s" % (res_name, atom.name)
-            atom.amber_type = amber_types[atom_id]
-            atom.charge = charges[atom_id]
-            atom.mass = masses[atom.amber_type]
-            atom.vdw_energy = vdw.vdw_energy[atom.amber_type]
-            atom.vdw_radius = vdw.vdw_radii[atom.amber_type]
+            indexes.append(amber.atom_index[atom_id])
 
         # Prepare common model information
-        elec_charges = np.array([atom.charge for atom in atoms])
-        vdw_energies = np.array([atom.vdw_energy for atom in atoms])
-        vdw_radii = np.array([atom.vdw_radius for atom in atoms])
-        coordinates = molecule.copy_coordinates()
+        indexes = np.array(indexes, dtype=np.intp)
+        atom_types = amber.assign(atoms, indexes)
+        elec_charges = amber.charges[indexes]
+        vdw_energies = amber.vdw_energy[atom_types]
+        vdw_radii = amber.vdw_radii[atom_types]
+        coordinates = molecule.atom_coordinates
         reference_points = ModelAdapter.load_reference_points(molecule)
         try:
             return SDModel(
@@ -127,10 +126,10 @@ class SD(ScoringFunction):
         )
 
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, set(interface_receptor)
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, set(interface_ligand)
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
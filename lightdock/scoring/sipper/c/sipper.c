@@ -3,10 +3,57 @@
 #include <Python.h>
 #include <numpy/arrayobject.h>
 #include "structmember.h"
+#include <math.h>
+#include <stdlib.h>
 
 #define DISTANCE2_CUTOFF 25.0
 
 
+/**
+ *
+ * Residue level cell list. Residues are represented by the centroid of their atoms and
+ * the radius of the sphere around it containing them, so two residues can only have
+ * atoms closer than reach if their spheres are closer than reach.
+ *
+ **/
+static void residue_spheres(double **coordinates, int *res_atoms, unsigned int res_len,
+                            double *centers, double *radii, double *max_radius) {
+    unsigned int i, atom, init;
+    int d;
+    double r2, delta;
+
+    *max_radius = 0.0;
+    init = 0;
+    for (i = 0; i < res_len; i++) {
+        for (d = 0; d < 3; d++) centers[i*3+d] = 0.0;
+        for (atom = init; atom < init + res_atoms[i]; atom++) {
+            for (d = 0; d < 3; d++) centers[i*3+d] += coordinates[atom][d];
+        }
+        if (res_atoms[i] > 0) {
+            for (d = 0; d < 3; d++) centers[i*3+d] /= res_atoms[i];
+        }
+        radii[i] = 0.0;
+        for (atom = init; atom < init + res_atoms[i]; atom++) {
+            r2 = 0.0;
+            for (d = 0; d < 3; d++) {
+                delta = coordinates[atom][d] - centers[i*3+d];
+                r2 += delta*delta;
+            }
+            if (r2 > radii[i]) radii[i] = r2;
+        }
+        radii[i] = sqrt(radii[i]);
+        if (radii[i] > *max_radius) *max_radius = radii[i];
+        init += res_atoms[i];
+    }
+}
+
+
+static int compare_unsigned(const void *a, const void *b) {
+    unsigned int x = *(const unsigned int *)a, y = *(const unsigned int *)b;
+    return (x > y) - (x < y);
+}
+
+
 /**
  *
  * calculate_sipper C implementation
@@ -17,15 +64,19 @@ static PyObject * calculate_sipper(PyObject *self, PyObject *args) {
     PyObject *tmp0, *tmp1 = NULL;
     PyArrayObject *sipper_energy, *receptor_indexes, *ligand_indexes, *rec_res_atoms, *lig_res_atoms = NULL;
     PyArrayObject *receptor_oda, *ligand_oda = NULL;
-    double total_sipper, total_oda, total_energy, interface_cutoff, interface_cutoff2;;
-    unsigned int rec_len, lig_len, i, j, rec_res_len, lig_res_len, atom_i, atom_j;
+    double total_sipper, total_oda, total_energy, interface_cutoff, interface_cutoff2;
+    unsigned int rec_len, lig_len, i, j, k, rec_res_len, lig_res_len, atom_i, atom_j;
     unsigned int interface_len, intf_array_size, *interface_receptor = NULL, *interface_ligand = NULL;
     double **rec_array, **lig_array, x, y, z;
     npy_intp dims[2];
     PyArray_Descr *descr;
     int *receptor_c_indexes, *ligand_c_indexes, *rec_c_res_atoms, *lig_c_res_atoms = NULL;
     double *receptor_c_oda, *ligand_c_oda = NULL;
-    unsigned int receptor_init, ligand_init = 0;
+    unsigned int receptor_init = 0;
+    unsigned int *ligand_init, *candidates, num_candidates;
+    double *rec_centers, *rec_radii, *lig_centers, *lig_radii;
+    double rec_max_radius, lig_max_radius, reach, cell_size, max_distance, origin[3];
+    int num_cells[3], cell[3], d, cx, cy, cz, index, *head, *next_residue;
     PyObject *result = PyTuple_New(3);
 
     total_sipper = 0.0;
@@ -67,14 +118,86 @@ static PyObject * calculate_sipper(PyObject *self, PyObject *args) {
         interface_receptor = malloc(lig_len*sizeof(unsigned int));
         interface_ligand  = malloc(lig_len*sizeof(unsigned int));
 
+        // Residue spheres and first atom of each ligand residue
+        rec_centers = malloc(3*rec_res_len*sizeof(double));
+        rec_radii = malloc(rec_res_len*sizeof(double));
+        lig_centers = malloc(3*lig_res_len*sizeof(double));
+        lig_radii = malloc(lig_res_len*sizeof(double));
+        ligand_init = malloc(lig_res_len*sizeof(unsigned int));
+        candidates = malloc(lig_res_len*sizeof(unsigned int));
+        residue_spheres(rec_array, rec_c_res_atoms, rec_res_len, rec_centers, rec_radii, &rec_max_radius);
+        residue_spheres(lig_array, lig_c_res_atoms, lig_res_len, lig_centers, lig_radii, &lig_max_radius);
+        for (j = 0; j < lig_res_len; j++) {
+            ligand_init[j] = (j == 0) ? 0 : ligand_init[j-1] + lig_c_res_atoms[j-1];
+        }
+
+        // Atoms further than reach neither contribute to energy nor to the interface
+        reach = sqrt(DISTANCE2_CUTOFF);
+        if (interface_cutoff > reach) reach = interface_cutoff;
+        cell_size = rec_max_radius + lig_max_radius + reach;
+
+        // Ligand residues cell list
+        for (d = 0; d < 3; d++) {
+            origin[d] = 0.0;
+            num_cells[d] = 1;
+        }
+        for (j = 0; j < lig_res_len; j++) {
+            for (d = 0; d < 3; d++) {
+                if (j == 0 || lig_centers[j*3+d] < origin[d]) origin[d] = lig_centers[j*3+d];
+            }
+        }
+        for (j = 0; j < lig_res_len; j++) {
+            for (d = 0; d < 3; d++) {
+                index = (int)floor((lig_centers[j*3+d] - origin[d]) / cell_size) + 1;
+                if (index > num_cells[d]) num_cells[d] = index;
+            }
+        }
+        head = malloc(num_cells[0]*num_cells[1]*num_cells[2]*sizeof(int));
+        next_residue = malloc(lig_res_len*sizeof(int));
+        for (index = 0; index < num_cells[0]*num_cells[1]*num_cells[2]; index++) head[index] = -1;
+        for (j = 0; j < lig_res_len; j++) {
+            for (d = 0; d < 3; d++) {
+                cell[d] = (int)floor((lig_centers[j*3+d] - origin[d]) / cell_size);
+            }
+            index = (cell[0]*num_cells[1] + cell[1])*num_cells[2] + cell[2];
+            next_residue[j] = head[index];
+            head[index] = j;
+        }
+
         // For all residues in receptor
-        receptor_init = 0;
         for (i = 0; i < rec_res_len; i++) {
-            // For all residues in ligand
-            ligand_init = 0;
-            for (j = 0; j < lig_res_len; j++) {
+            // Ligand residues whose sphere is within reach, visited in the original order
+            num_candidates = 0;
+            for (d = 0; d < 3; d++) {
+                cell[d] = (int)floor((rec_centers[i*3+d] - origin[d]) / cell_size);
+            }
+            for (cx = cell[0] - 1; cx <= cell[0] + 1; cx++) {
+                if (cx < 0 || cx >= num_cells[0]) continue;
+                for (cy = cell[1] - 1; cy <= cell[1] + 1; cy++) {
+                    if (cy < 0 || cy >= num_cells[1]) continue;
+                    for (cz = cell[2] - 1; cz <= cell[2] + 1; cz++) {
+                        if (cz < 0 || cz >= num_cells[2]) continue;
+                        index = head[(cx*num_cells[1] + cy)*num_cells[2] + cz];
+                        while (index >= 0) {
+                            x = rec_centers[i*3] - lig_centers[index*3];
+                            y = rec_centers[i*3+1] - lig_centers[index*3+1];
+                            z = rec_centers[i*3+2] - lig_centers[index*3+2];
+                            max_distance = rec_radii[i] + lig_radii[index] + reach;
+                            if (x*x + y*y + z*z <= max_distance*max_distance) {
+                                candidates[num_candidates++] = index;
+                            }
+                            index = next_residue[index];
+                        }
+                    }
+                }
+            }
+            qsort(candidates, num_candidates, sizeof(unsigned int), compare_unsigned);
+
+            // For the ligand residues close to this one
+            for (k = 0; k < num_candidates; k++) {
+                j = candidates[k];
                 for(atom_i=receptor_init; atom_i<(receptor_init+rec_c_res_atoms[i]); atom_i++) {
-                    for(atom_j=ligand_init; atom_j<(ligand_init+lig_c_res_atoms[j]); atom_j++) {
+                    for(atom_j=ligand_init[j]; atom_j<(ligand_init[j]+lig_c_res_atoms[j]); atom_j++) {
                         x = rec_array[atom_i][0] - lig_array[atom_j][0];
                         x *= x;
                         if (x > DISTANCE2_CUTOFF) continue;
@@ -104,12 +227,19 @@ static PyObject * calculate_sipper(PyObject *self, PyObject *args) {
                         interface_ligand = realloc(interface_ligand, intf_array_size*lig_len*sizeof(unsigned int));
                     }
                 }
-                ligand_init += lig_c_res_atoms[j];
             }
             receptor_init += rec_c_res_atoms[i];
         }
 
         // Free structures
+        free(rec_centers);
+        free(rec_radii);
+        free(lig_centers);
+        free(lig_radii);
+        free(ligand_init);
+        free(candidates);
+        free(head);
+        free(next_residue);
         PyArray_Free(tmp0, rec_array);
         PyArray_Free(tmp1, lig_array);
     }
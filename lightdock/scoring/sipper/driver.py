@@ -6,7 +6,7 @@ C-implementation of the SIPPER (https://dx.doi.org/10.1021/ci100353e) scoring fu
 
 import numpy as np
 import os
-from lightdock.constants import DEFAULT_LIGHTDOCK_PREFIX
+from lightdock.constants import DEFAULT_LIGHTDOCK_PREFIX, DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 from lightdock.scoring.functions import ScoringFunction, ModelAdapter
 from lightdock.structure.model import DockingModel
 from lightdock.scoring.sipper.data.energy import sipper_energy, res_to_index
@@ -47,7 +47,7 @@ class SIPPERModel(DockingModel):
         """Creates a copy of the current model"""
         return SIPPERModel(
             self.objects,
-            self.coordinates.copy(),
+            self.coordinates,
             self.restraints,
             self.energy,
             self.indexes,
@@ -66,12 +66,14 @@ class SIPPERAdapter(ModelAdapter):
         atoms = molecule.atoms
         energy = sipper_energy
         parsed_restraints = {}
+        # The C-implementation reads both arrays as C int
         indexes = np.array(
-            [res_to_index[residue.name] for residue in molecule.residues]
+            [res_to_index[residue.name] for residue in molecule.residues],
+            dtype=np.intc,
         )
-        coordinates = molecule.copy_coordinates()
+        coordinates = molecule.atom_coordinates
         atoms_per_residue = np.array(
-            [len(residue.atoms) for residue in molecule.residues]
+            [len(residue.atoms) for residue in molecule.residues], dtype=np.intc
         )
 
         for atom_index, atom in enumerate(atoms):
@@ -164,10 +166,10 @@ class SIPPER(ScoringFunction):
             DEFAULT_CONTACT_RESTRAINTS_CUTOFF
         )
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, set(interface_receptor)
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, set(interface_ligand)
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
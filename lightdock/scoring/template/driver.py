@@ -20,12 +20,12 @@ class TemplateAdapter(ModelAdapter):
         try:
             return DockingModel(
                 model_objects,
-                molecule.copy_coordinates(),
+                molecule.atom_coordinates,
                 restraints,
                 n_modes=molecule.n_modes.copy(),
             )
         except AttributeError:
-            return DockingModel(model_objects, molecule.copy_coordinates(), restraints)
+            return DockingModel(model_objects, molecule.atom_coordinates, restraints)
 
 
 class TemplateScoringFunction(ScoringFunction):
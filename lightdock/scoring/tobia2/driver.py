@@ -7,10 +7,11 @@ BMC Struct Biol 10, 40 (2010). https://doi.org/10.1186/1472-6807-10-40
 
 from pathlib import Path
 import numpy as np
-import scipy.spatial
+from scipy.spatial import cKDTree
 
 from lightdock.structure.model import DockingModel
 from lightdock.scoring.functions import ModelAdapter, ScoringFunction
+from lightdock.scoring.potentials import load_potentials
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 
 
@@ -114,14 +115,38 @@ class TOBIA2Potential(object):
 
     def __init__(self):
         data_path = Path(__file__).parent.resolve() / "data"
-        self.tobi_a_1 = self._read_potentials(data_path / "TOBI_A2_step1")
-        self.tobi_a_2 = self._read_potentials(data_path / "TOBI_A2_step2")
+        self.tobi_a_1 = load_potentials(
+            data_path / "TOBI_A2_step1", self._read_potentials
+        )
+        self.tobi_a_2 = load_potentials(
+            data_path / "TOBI_A2_step2", self._read_potentials
+        )
 
     def _read_potentials(self, data_file_name):
         """Reads TOBIA2 data potentials"""
         return np.loadtxt(data_file_name, dtype=float)
 
 
+class TOBIA2Model(DockingModel):
+    """DockingModel with the TOBI type of each atom and the residue each atom belongs to"""
+
+    def __init__(self, objects, coordinates, restraints, atom_types, atom_residues):
+        super(TOBIA2Model, self).__init__(objects, coordinates, restraints)
+        self.atom_types = atom_types
+        self.atom_residues = atom_residues
+        self.residue_sizes = np.bincount(atom_residues)
+
+    def get_residue_centers(self, coordinates):
+        """Center of coordinates of each residue for the given atom coordinates"""
+        return np.column_stack(
+            [
+                np.bincount(self.atom_residues, weights=coordinates[:, axis])
+                / self.residue_sizes
+                for axis in range(3)
+            ]
+        )
+
+
 class TOBIA2Adapter(ModelAdapter):
     """Adapts a given Complex to a DockingModel object suitable for this
     TOBIA2 scoring function.
@@ -131,83 +156,85 @@ class TOBIA2Adapter(ModelAdapter):
         """Builds a suitable docking model for this scoring function"""
         list_of_coordinates = molecule.atom_coordinates
         parsed_restraints = {}
+        atom_types = []
+        atom_residues = []
+        residue_index = 0
         for chain in molecule.chains:
             for residue in chain.residues:
                 for atom in residue.atoms:
-                    atom.index = TOBIA2Potential.atom_indice[
-                        f"{atom.residue_name}{atom.name}"
-                    ]
+                    atom_types.append(
+                        TOBIA2Potential.atom_indice[f"{atom.residue_name}{atom.name}"]
+                    )
+                    atom_residues.append(residue_index)
                 res_id = (
                     f"{chain.cid}.{residue.name}.{residue.number}{residue.insertion}"
                 )
                 if restraints and res_id in restraints:
-                    parsed_restraints[res_id] = []
-
-        return DockingModel(molecule, list_of_coordinates, parsed_restraints)
+                    parsed_restraints[res_id] = [residue_index]
+                residue_index += 1
+
+        return TOBIA2Model(
+            molecule,
+            list_of_coordinates,
+            parsed_restraints,
+            np.array(atom_types, dtype=int),
+            np.array(atom_residues, dtype=int),
+        )
 
 
 class TOBIA2(ScoringFunction):
     """Implements TOBIA2 potential"""
 
+    pair_cutoff = 6.0
+
     def __init__(self, weight=1.0):
         super(TOBIA2, self).__init__(weight, anm_support=False)
         self.function = self._default
         self.potential = TOBIA2Potential()
         self.cutoff = DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 
-    def __call__(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
-        return self.function(receptor, receptor_coordinates, ligand, ligand_coordinates)
-
-    def _default(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
-        energy = 0.0
-
-        dist_matrix_atom = scipy.spatial.distance.cdist(
-            receptor_coordinates, ligand_coordinates
-        )  # shape:len(rec.atoms)*len(lig.atoms)
-        rec_tobi_atom_types = np.array(
-            [atom.index for atom in receptor.objects.atoms]
-        )  # shape:len(rec.atoms)*1,aij in [0,17]
-        lig_tobi_atom_types = np.array(
-            [atom.index for atom in ligand.objects.atoms]
-        )  # shape:len(lig.atoms)*1,aij in [0,17]
-        searched_indice = tuple(
-            np.array(
-                np.meshgrid(rec_tobi_atom_types, lig_tobi_atom_types, indexing="ij")
-            ).reshape((2, -1))
-        )  # generate (array[idxx],array[idxy]) for fancy indexing
-        tobi_pot1_matrix = self.potential.tobi_a_1[searched_indice].reshape(
-            dist_matrix_atom.shape
-        )
-        tobi_pot2_matrix = self.potential.tobi_a_2[searched_indice].reshape(
-            dist_matrix_atom.shape
+    def __call__(
+        self, receptor, receptor_coordinates, ligand, ligand_coordinates, pairs=None
+    ):
+        return self.function(
+            receptor, receptor_coordinates, ligand, ligand_coordinates, pairs
         )
-        mask1 = dist_matrix_atom <= 4.0
-        mask2 = np.logical_and(dist_matrix_atom <= 6.0, dist_matrix_atom > 4.0)
-        energy = np.sum(tobi_pot1_matrix, where=mask1) + np.sum(
-            tobi_pot2_matrix, where=mask2
+
+    def _default(
+        self, receptor, receptor_coordinates, ligand, ligand_coordinates, pairs=None
+    ):
+        receptor_coordinates = receptor_coordinates.coordinates
+        ligand_coordinates = ligand_coordinates.coordinates
+
+        # Only pairs of atoms closer than 6A contribute
+        pairs = ScoringFunction.get_pairs(
+            receptor_coordinates, ligand_coordinates, self.pair_cutoff, pairs
         )
-        rec_coms = np.array(
-            [res.get_central_coordinate() for res in receptor.objects.residues]
+        rec_types = receptor.atom_types[pairs["i"]]
+        lig_types = ligand.atom_types[pairs["j"]]
+        step1 = pairs["v"] <= 4.0
+        step2 = ~step1
+        energy = (
+            self.potential.tobi_a_1[rec_types[step1], lig_types[step1]].sum()
+            + self.potential.tobi_a_2[rec_types[step2], lig_types[step2]].sum()
         )
-        lig_coms = np.array(
-            [lig.get_central_coordinate() for lig in ligand.objects.residues]
+
+        # Interface is calculated at residue level
+        residue_pairs = cKDTree(
+            receptor.get_residue_centers(receptor_coordinates)
+        ).sparse_distance_matrix(
+            cKDTree(ligand.get_residue_centers(ligand_coordinates)),
+            self.cutoff,
+            output_type="ndarray",
         )
-        dist_matrix_residue = scipy.spatial.distance.cdist(rec_coms, lig_coms)
-        res_cutoff_indice = dist_matrix_residue[
-            dist_matrix_residue <= self.cutoff
-        ].nonzero()
-        interface_receptor = set(res_cutoff_indice[0])
-        # nonzero returns ([],) if res_cutoff_indice only contains 0,
-        # else returns (idxx,idxy) for 2D-matrix
-        interface_ligand = set()
-        if len(res_cutoff_indice) == 2:
-            interface_ligand = set(res_cutoff_indice[1])
+        interface_receptor = residue_pairs["i"]
+        interface_ligand = residue_pairs["j"]
         energy *= -1.0
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
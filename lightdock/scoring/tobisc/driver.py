@@ -6,12 +6,13 @@ BMC Struct Biol 10, 40 (2010). https://doi.org/10.1186/1472-6807-10-40
 """
 
 from pathlib import Path
-import scipy.spatial
+import numpy as np
 
 from lightdock.error.lightdock_errors import PotentialsParsingError
 from lightdock.structure.model import DockingModel
 from lightdock.structure.space import SpacePoints
 from lightdock.scoring.functions import ModelAdapter, ScoringFunction
+from lightdock.scoring.potentials import load_potentials
 from lightdock.constants import DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 
 
@@ -116,15 +117,19 @@ class TOBISCPotential(object):
 
     def __init__(self):
         data_path = Path(__file__).parent.resolve() / "data"
-        self.tobi_sc_1 = self._read_potentials(data_path / "TOBI_SC_step1.dat")
-        self.tobi_sc_2 = self._read_potentials(data_path / "TOBI_SC_step2.dat")
+        self.tobi_sc_1 = load_potentials(
+            data_path / "TOBI_SC_step1.dat", self._read_potentials
+        )
+        self.tobi_sc_2 = load_potentials(
+            data_path / "TOBI_SC_step2.dat", self._read_potentials
+        )
 
     def _read_potentials(self, data_file_name):
         """Reads TOBISC data potentials"""
         data_file = open(data_file_name)
         data = data_file.readlines()
         data_file.close()
-        potentials = [[None for i in range(22)] for j in range(22)]  # @UnusedVariable
+        potentials = np.zeros((22, 22))
         try:
             for x in range(22):
                 for y in range(22):
@@ -201,73 +206,60 @@ class TOBISCAdapter(ModelAdapter):
                     continue
             list_of_coordinates.append(SpacePoints(coordinates))
 
-        return DockingModel(tobi_residues, list_of_coordinates, parsed_restraints)
+        return DockingModel(
+            np.array(tobi_residues, dtype=int), list_of_coordinates, parsed_restraints
+        )
 
 
 class TOBISC(ScoringFunction):
     """Implements TOBISC potential"""
 
+    max_distance = 8.0
+    pair_cutoff = max_distance
+    # Sidechain-sidechain, backbone-sidechain and backbone-backbone cutoffs
+    step1_cutoffs = np.array([6.5, 5.5, 4.5])
+    step2_cutoffs = np.array([8.0, 7.0, 6.0])
+
     def __init__(self, weight=1.0):
         super(TOBISC, self).__init__(weight, anm_support=False)
         self.function = self._default
         self.potential = TOBISCPotential()
         self.cutoff = DEFAULT_CONTACT_RESTRAINTS_CUTOFF
 
-    def __call__(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
-        return self.function(receptor, receptor_coordinates, ligand, ligand_coordinates)
-
-    def _default(self, receptor, receptor_coordinates, ligand, ligand_coordinates):
-        energy = 0.0
-
-        dist_matrix = scipy.spatial.distance.cdist(
-            receptor_coordinates, ligand_coordinates
+    def __call__(
+        self, receptor, receptor_coordinates, ligand, ligand_coordinates, pairs=None
+    ):
+        return self.function(
+            receptor, receptor_coordinates, ligand, ligand_coordinates, pairs
         )
 
-        interface_receptor = []
-        interface_ligand = []
-        for rec_index, rec_tobi in enumerate(receptor.objects):
-            for lig_index, lig_tobi in enumerate(ligand.objects):
-                d = dist_matrix[rec_index][lig_index]
-
-                if d <= 8.0:
-                    if rec_tobi >= 20 and lig_tobi >= 20:
-                        # Small distance, backbone-backbone
-                        if d <= 4.5:
-                            energy += self.potential.tobi_sc_1[rec_tobi][lig_tobi]
-                        else:
-                            if d <= 6.0:
-                                energy += self.potential.tobi_sc_2[rec_tobi][lig_tobi]
-                    else:
-                        # Medium distance, backbone-sidechain
-                        if rec_tobi >= 20 or lig_tobi >= 20:
-                            if d <= 5.5:
-                                energy += self.potential.tobi_sc_1[rec_tobi][lig_tobi]
-                            else:
-                                if d <= 7.0:
-                                    energy += self.potential.tobi_sc_2[rec_tobi][
-                                        lig_tobi
-                                    ]
-                        else:
-                            # Large distance, sidechain-sidechain
-                            if d <= 6.5:
-                                energy += self.potential.tobi_sc_1[rec_tobi][lig_tobi]
-                            else:
-                                if d <= 8.0:
-                                    energy += self.potential.tobi_sc_2[rec_tobi][
-                                        lig_tobi
-                                    ]
-                if d <= self.cutoff:
-                    interface_receptor.append(rec_index)
-                    interface_ligand.append(lig_index)
+    def _default(
+        self, receptor, receptor_coordinates, ligand, ligand_coordinates, pairs=None
+    ):
+        pairs = ScoringFunction.get_pairs(
+            receptor_coordinates, ligand_coordinates, TOBISC.max_distance, pairs
+        )
+        rec_tobi = receptor.objects[pairs["i"]]
+        lig_tobi = ligand.objects[pairs["j"]]
+        distances = pairs["v"]
+        # 0 for sidechain-sidechain, 1 for backbone-sidechain, 2 for backbone-backbone
+        num_backbone = (rec_tobi >= 20).astype(int) + (lig_tobi >= 20)
+        step1 = distances <= TOBISC.step1_cutoffs[num_backbone]
+        step2 = ~step1 & (distances <= TOBISC.step2_cutoffs[num_backbone])
+        energy = (
+            self.potential.tobi_sc_1[rec_tobi[step1], lig_tobi[step1]].sum()
+            + self.potential.tobi_sc_2[rec_tobi[step2], lig_tobi[step2]].sum()
+        )
 
-        interface_receptor = set(interface_receptor)
-        interface_ligand = set(interface_ligand)
+        in_interface = distances <= self.cutoff
+        interface_receptor = pairs["i"][in_interface]
+        interface_ligand = pairs["j"][in_interface]
         energy *= -1.0
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, interface_receptor
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, interface_ligand
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
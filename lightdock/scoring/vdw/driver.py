@@ -3,8 +3,7 @@
 import numpy as np
 
 from lightdock.scoring.functions import ScoringFunction, ModelAdapter
-from lightdock.scoring.vdw.data import amber
-from lightdock.scoring.vdw.data import vdw
+from lightdock.scoring.amber import get_amber_parameters
 from lightdock.structure.model import DockingModel
 import lightdock.scoring.vdw.energy.c.cvdw as cvdw
 from lightdock.util.logger import LoggingManager
@@ -38,7 +37,7 @@ class VdWModel(DockingModel):
         """Creates a copy of the current model"""
         return VdWModel(
             self.objects,
-            self.coordinates.copy(),
+            self.coordinates,
             self.restraints,
             self.vdw_energy,
             self.vdw_radii,
@@ -50,8 +49,10 @@ class VdWAdapter(ModelAdapter):
     """Adapts a given Complex to a DockingModel object suitable for this scoring function."""
 
     def _get_docking_model(self, molecule, restraints):
+        amber = get_amber_parameters()
         atoms = molecule.atoms
         parsed_restraints = {}
+        indexes = []
         # Assign properties to atoms
         for atom_index, atom in enumerate(atoms):
             res_name = atom.residue_name
@@ -67,16 +68,13 @@ class VdWAdapter(ModelAdapter):
                 except:
                     parsed_restraints[res_id] = [atom_index]
             atom_id = "%s-%s" % (res_name, atom_name)
-            atom.amber_type = amber.amber_types[atom_id]
-            atom.charge = amber.charges[atom_id]
-            atom.mass = amber.masses[atom.amber_type]
-            atom.vdw_energy = vdw.vdw_energy[atom.amber_type]
-            atom.vdw_radius = vdw.vdw_radii[atom.amber_type]
+            indexes.append(amber.atom_index[atom_id])
 
         # Prepare common model information
-        vdw_energies = np.array([atom.vdw_energy for atom in atoms])
-        vdw_radii = np.array([atom.vdw_radius for atom in atoms])
-        coordinates = molecule.copy_coordinates()
+        atom_types = amber.assign(atoms, np.array(indexes, dtype=np.intp))
+        vdw_energies = amber.vdw_energy[atom_types]
+        vdw_radii = amber.vdw_radii[atom_types]
+        coordinates = molecule.atom_coordinates
 
         reference_points = ModelAdapter.load_reference_points(molecule)
 
@@ -118,10 +116,10 @@ class VdW(ScoringFunction):
         )
         energy = vdw_energy * -1.0
         perc_receptor_restraints = ScoringFunction.restraints_satisfied(
-            receptor.restraints, set(interface_receptor)
+            receptor.compiled_restraints, interface_receptor
         )
         perc_ligand_restraints = ScoringFunction.restraints_satisfied(
-            ligand.restraints, set(interface_ligand)
+            ligand.compiled_restraints, interface_ligand
         )
         return (
             energy + perc_receptor_restraints * energy + perc_ligand_restraints * energy
@@ -1,4 +1,4 @@
 from distutils.core import setup, Extension
 import numpy as np
 
-setup(ext_modules=[Extension("cvdw", ["cvdw.c"])], include_dirs=[np.get_include()])
+setup(ext_modules=[Extension("cvdw", ["cvdw.c"])], include_dirs=[np.get_include(), "../../../c"])
@@ -7,6 +7,7 @@ from mpi4py import MPI
 
 from lightdock.util.logger import LoggingManager
 from lightdock.util.parser import CommandLineParser
+from lightdock.util.profiling import startup_profile
 from lightdock.prep.simulation import (
     get_setup_from_file,
     create_simulation_info_file,
@@ -15,6 +16,9 @@ from lightdock.prep.simulation import (
     get_default_box,
 )
 from lightdock.gso.algorithm import LightdockGSOBuilder
+from lightdock.gso.minimizer import PatternSearch
+from lightdock.gso.convergence import ConvergenceMonitor
+from lightdock.gso.conformers import ConformerSwap
 from lightdock.mathutil.lrandom import MTGenerator
 from lightdock.gso.parameters import GSOParameters
 from lightdock.constants import (
@@ -25,10 +29,18 @@ from lightdock.constants import (
     NUMPY_FILE_SAVE_EXTENSION,
     DEFAULT_NMODES_REC,
     DEFAULT_NMODES_LIG,
+    DEFAULT_MINIMIZER,
+    DEFAULT_MINIMIZATION_TOP,
+    DEFAULT_MINIMIZATION_BUDGET,
+    DEFAULT_CONVERGENCE_PATIENCE,
+    DEFAULT_CONVERGENCE_SCORING,
+    DEFAULT_CONVERGENCE_LUCIFERIN,
+    DEFAULT_CONVERGENCE_MOVING,
+    DEFAULT_SWAP_RATE,
     DEFAULT_LIGHTDOCK_PREFIX,
 )
 from lightdock.parallel.util import GSOClusterTask
-from lightdock.scoring.multiple import ScoringConfiguration
+from lightdock.scoring.multiple import ScoringConfiguration, CompositeScoringFunction
 from lightdock.structure.nm import read_nmodes
 from lightdock.error.lightdock_errors import NotSupportedInScoringError, SwarmNumError
 
@@ -50,6 +62,14 @@ def set_gso(
     anm_rec=DEFAULT_NMODES_REC,
     anm_lig=DEFAULT_NMODES_LIG,
     local_minimization=False,
+    minimizer=DEFAULT_MINIMIZER,
+    minimization_top=DEFAULT_MINIMIZATION_TOP,
+    minimization_budget=DEFAULT_MINIMIZATION_BUDGET,
+    convergence_patience=DEFAULT_CONVERGENCE_PATIENCE,
+    convergence_scoring=DEFAULT_CONVERGENCE_SCORING,
+    convergence_luciferin=DEFAULT_CONVERGENCE_LUCIFERIN,
+    convergence_moving=DEFAULT_CONVERGENCE_MOVING,
+    swap_rate=DEFAULT_SWAP_RATE,
 ):
     """Creates a lightdock GSO simulation object"""
 
@@ -63,6 +83,24 @@ def set_gso(
     builder = LightdockGSOBuilder()
     if not use_anm:
         anm_rec = anm_lig = 0
+    # Powell minimization of the best glowworm is done by the GSO itself
+    if local_minimization and minimizer == "pattern":
+        local_minimization = PatternSearch(minimization_top, minimization_budget)
+    convergence = None
+    if convergence_patience:
+        convergence = ConvergenceMonitor(
+            convergence_patience,
+            convergence_scoring,
+            convergence_luciferin,
+            convergence_moving,
+        )
+    # Conformers are only swapped if there is any ensemble
+    conformer_swap = None
+    if swap_rate > 0.0 and any(
+        len(adapter.receptor_model) > 1 or len(adapter.ligand_model) > 1
+        for adapter in adapters
+    ):
+        conformer_swap = ConformerSwap(swap_rate)
     gso = builder.create_from_file(
         number_of_glowworms,
         random_number_generator,
@@ -77,6 +115,8 @@ def set_gso(
         local_minimization,
         anm_rec,
         anm_lig,
+        convergence,
+        conformer_swap,
     )
     return gso
 
@@ -142,7 +182,10 @@ def run_simulation(parser):
         if minion_id == 0:
             info_file = create_simulation_info_file(args)
             log.info("simulation parameters saved to %s" % info_file)
+            if args.prune_steps:
+                log.warning("Pruning of swarms is not supported with MPI, ignored")
         comm.Barrier()
+        startup_profile.mark("Setup")
 
         # Read input structures (use parsed ones)
         parsed_lightdock_receptor = os.path.join(
@@ -183,10 +226,12 @@ def run_simulation(parser):
             except:
                 log.warning("No ANM found for ligand molecule")
                 ligand.n_modes = None
+        startup_profile.mark("Structures")
 
         starting_points_files = load_starting_positions(
             args.swarms, args.glowworms, args.use_anm, args.anm_rec, args.anm_lig
         )
+        startup_profile.mark("Starting positions")
 
         comm.Barrier()
 
@@ -197,6 +242,9 @@ def run_simulation(parser):
                 scoring_functions, adapters = set_scoring_function(
                     parser, receptor, ligand, minion_id
                 )
+                startup_profile.mark("Scoring functions")
+                if args.startup_profile:
+                    log.info(f"Minion {minion_id} " + startup_profile.report())
 
                 # Check if scoring functions are compatible with ANM if activated
                 if args.use_anm and minion_id == 0:
@@ -205,6 +253,17 @@ def run_simulation(parser):
                             raise NotSupportedInScoringError(
                                 f"ANM is activated while {type(s).__name__} has no support for it"
                             )
+                        if args.anm_rec > 0 and not s.anm_rec_support:
+                            raise NotSupportedInScoringError(
+                                f"Receptor ANM is activated while {type(s).__name__} "
+                                "has no support for it"
+                            )
+
+                # Functions sharing coordinates are evaluated on the same pose
+                if args.composite_scoring:
+                    scoring_functions, adapters = CompositeScoringFunction.group(
+                        scoring_functions, adapters
+                    )
 
                 # Prepare tasks depending on swarms to simulate
                 if parser.args.swarm_list:
@@ -231,6 +290,14 @@ def run_simulation(parser):
                             parser.args.anm_rec,
                             parser.args.anm_lig,
                             parser.args.local_minimization,
+                            parser.args.minimizer,
+                            parser.args.minimization_top,
+                            parser.args.minimization_budget,
+                            parser.args.convergence_patience,
+                            parser.args.convergence_scoring,
+                            parser.args.convergence_luciferin,
+                            parser.args.convergence_moving,
+                            parser.args.swap_rate,
                         )
                         saving_path = "%s%d" % (DEFAULT_SWARM_FOLDER, id_swarm)
                         task = GSOClusterTask(
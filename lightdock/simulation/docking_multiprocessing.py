@@ -5,6 +5,7 @@ import importlib
 
 from lightdock.util.logger import LoggingManager
 from lightdock.util.parser import CommandLineParser
+from lightdock.util.profiling import startup_profile
 from lightdock.prep.simulation import (
     get_setup_from_file,
     create_simulation_info_file,
@@ -13,6 +14,9 @@ from lightdock.prep.simulation import (
     get_default_box,
 )
 from lightdock.gso.algorithm import LightdockGSOBuilder
+from lightdock.gso.minimizer import PatternSearch
+from lightdock.gso.convergence import ConvergenceMonitor
+from lightdock.gso.conformers import ConformerSwap
 from lightdock.mathutil.lrandom import MTGenerator
 from lightdock.gso.parameters import GSOParameters
 from lightdock.constants import (
@@ -23,11 +27,19 @@ from lightdock.constants import (
     NUMPY_FILE_SAVE_EXTENSION,
     DEFAULT_NMODES_REC,
     DEFAULT_NMODES_LIG,
+    DEFAULT_MINIMIZER,
+    DEFAULT_MINIMIZATION_TOP,
+    DEFAULT_MINIMIZATION_BUDGET,
+    DEFAULT_CONVERGENCE_PATIENCE,
+    DEFAULT_CONVERGENCE_SCORING,
+    DEFAULT_CONVERGENCE_LUCIFERIN,
+    DEFAULT_CONVERGENCE_MOVING,
+    DEFAULT_SWAP_RATE,
     DEFAULT_LIGHTDOCK_PREFIX,
 )
-from lightdock.parallel.kraken import Kraken
+from lightdock.parallel.kraken import Kraken, HalvingKraken
 from lightdock.parallel.util import GSOClusterTask
-from lightdock.scoring.multiple import ScoringConfiguration
+from lightdock.scoring.multiple import ScoringConfiguration, CompositeScoringFunction
 from lightdock.structure.nm import read_nmodes
 from lightdock.error.lightdock_errors import NotSupportedInScoringError, SwarmNumError
 
@@ -49,6 +61,14 @@ def set_gso(
     anm_rec=DEFAULT_NMODES_REC,
     anm_lig=DEFAULT_NMODES_LIG,
     local_minimization=False,
+    minimizer=DEFAULT_MINIMIZER,
+    minimization_top=DEFAULT_MINIMIZATION_TOP,
+    minimization_budget=DEFAULT_MINIMIZATION_BUDGET,
+    convergence_patience=DEFAULT_CONVERGENCE_PATIENCE,
+    convergence_scoring=DEFAULT_CONVERGENCE_SCORING,
+    convergence_luciferin=DEFAULT_CONVERGENCE_LUCIFERIN,
+    convergence_moving=DEFAULT_CONVERGENCE_MOVING,
+    swap_rate=DEFAULT_SWAP_RATE,
 ):
     """Creates a lightdock GSO simulation object"""
 
@@ -62,6 +82,24 @@ def set_gso(
     builder = LightdockGSOBuilder()
     if not use_anm:
         anm_rec = anm_lig = 0
+    # Powell minimization of the best glowworm is done by the GSO itself
+    if local_minimization and minimizer == "pattern":
+        local_minimization = PatternSearch(minimization_top, minimization_budget)
+    convergence = None
+    if convergence_patience:
+        convergence = ConvergenceMonitor(
+            convergence_patience,
+            convergence_scoring,
+            convergence_luciferin,
+            convergence_moving,
+        )
+    # Conformers are only swapped if there is any ensemble
+    conformer_swap = None
+    if swap_rate > 0.0 and any(
+        len(adapter.receptor_model) > 1 or len(adapter.ligand_model) > 1
+        for adapter in adapters
+    ):
+        conformer_swap = ConformerSwap(swap_rate)
     gso = builder.create_from_file(
         number_of_glowworms,
         random_number_generator,
@@ -76,6 +114,8 @@ def set_gso(
         local_minimization,
         anm_rec,
         anm_lig,
+        convergence,
+        conformer_swap,
     )
     return gso
 
@@ -120,113 +160,172 @@ def set_scoring_function(parser, receptor, ligand):
     return scoring_functions, adapters
 
 
-def prepare_gso_tasks(parser, adapters, scoring_functions, starting_points_files):
-    """Creates the parallel GSOTasks objects to be executed by the scheduler"""
-    tasks = []
-    # Prepare tasks depending on swarms to simulate
+def get_swarm_ids(parser):
+    """IDs of the swarms to simulate"""
     if parser.args.swarm_list:
         swarm_ids = parser.args.swarm_list
         if min(swarm_ids) < 0 or max(swarm_ids) >= parser.args.swarms:
             raise SwarmNumError("Wrong list of swarms")
-    else:
-        swarm_ids = list(range(parser.args.swarms))
-
-    for id_swarm in swarm_ids:
-        gso = set_gso(
-            parser.args.glowworms,
-            adapters,
-            scoring_functions,
-            starting_points_files[id_swarm],
-            parser.args.gso_seed,
-            parser.args.translation_step,
-            parser.args.rotation_step,
-            parser.args.configuration_file,
-            parser.args.use_anm,
-            parser.args.nmodes_step,
-            parser.args.anm_rec,
-            parser.args.anm_lig,
-            parser.args.local_minimization,
+        return swarm_ids
+    return list(range(parser.args.swarms))
+
+
+def create_gso_task(
+    parser, adapters, scoring_functions, starting_points_files, id_swarm
+):
+    """Creates the GSOTask object of the swarm id_swarm"""
+    gso = set_gso(
+        parser.args.glowworms,
+        adapters,
+        scoring_functions,
+        starting_points_files[id_swarm],
+        parser.args.gso_seed,
+        parser.args.translation_step,
+        parser.args.rotation_step,
+        parser.args.configuration_file,
+        parser.args.use_anm,
+        parser.args.nmodes_step,
+        parser.args.anm_rec,
+        parser.args.anm_lig,
+        parser.args.local_minimization,
+        parser.args.minimizer,
+        parser.args.minimization_top,
+        parser.args.minimization_budget,
+        parser.args.convergence_patience,
+        parser.args.convergence_scoring,
+        parser.args.convergence_luciferin,
+        parser.args.convergence_moving,
+        parser.args.swap_rate,
+    )
+    saving_path = "%s%d" % (DEFAULT_SWARM_FOLDER, id_swarm)
+    return GSOClusterTask(id_swarm, gso, parser.args.steps, saving_path)
+
+
+def prepare_gso_tasks(parser, adapters, scoring_functions, starting_points_files):
+    """Creates the parallel GSOTasks objects to be executed by the scheduler"""
+    return [
+        create_gso_task(
+            parser, adapters, scoring_functions, starting_points_files, id_swarm
         )
-        saving_path = "%s%d" % (DEFAULT_SWARM_FOLDER, id_swarm)
-        task = GSOClusterTask(id_swarm, gso, parser.args.steps, saving_path)
-        tasks.append(task)
-    return tasks
+        for id_swarm in get_swarm_ids(parser)
+    ]
 
 
-def run_simulation(parser):
-    """Main program"""
-    try:
-        parser = CommandLineParser()
-        args = parser.args
+def read_setup(args):
+    """Reads setup and adds it to the actual args object"""
+    setup = get_setup_from_file(args.setup_file)
+    for k, v in setup.items():
+        setattr(args, k, v)
 
-        # Read setup and add it to the actual args object
-        setup = get_setup_from_file(args.setup_file)
-        for k, v in setup.items():
-            setattr(args, k, v)
 
-        info_file = create_simulation_info_file(args)
-        log.info("simulation parameters saved to %s" % info_file)
+def prepare_simulation(parser):
+    """Reads the structures, the starting positions and the scoring functions"""
+    args = parser.args
 
-        # Read input structures (use parsed ones)
-        parsed_lightdock_receptor = os.path.join(
-            os.path.dirname(args.receptor_pdb),
-            DEFAULT_LIGHTDOCK_PREFIX % os.path.basename(args.receptor_pdb),
-        )
-        receptor = read_input_structure(
-            parsed_lightdock_receptor,
-            args.noxt,
-            args.noh,
-            args.now,
-            args.verbose_parser,
-        )
-        parsed_lightdock_ligand = os.path.join(
-            os.path.dirname(args.ligand_pdb),
-            DEFAULT_LIGHTDOCK_PREFIX % os.path.basename(args.ligand_pdb),
-        )
-        ligand = read_input_structure(
-            parsed_lightdock_ligand, args.noxt, args.noh, args.now, args.verbose_parser
-        )
+    # Read input structures (use parsed ones)
+    parsed_lightdock_receptor = os.path.join(
+        os.path.dirname(args.receptor_pdb),
+        DEFAULT_LIGHTDOCK_PREFIX % os.path.basename(args.receptor_pdb),
+    )
+    receptor = read_input_structure(
+        parsed_lightdock_receptor,
+        args.noxt,
+        args.noh,
+        args.now,
+        args.verbose_parser,
+    )
+    parsed_lightdock_ligand = os.path.join(
+        os.path.dirname(args.ligand_pdb),
+        DEFAULT_LIGHTDOCK_PREFIX % os.path.basename(args.ligand_pdb),
+    )
+    ligand = read_input_structure(
+        parsed_lightdock_ligand, args.noxt, args.noh, args.now, args.verbose_parser
+    )
+
+    # CRITICAL to not break compatibility with previous results
+    receptor.move_to_origin()
+    ligand.move_to_origin()
 
-        # CRITICAL to not break compatibility with previous results
-        receptor.move_to_origin()
-        ligand.move_to_origin()
+    if args.use_anm:
+        try:
+            receptor.n_modes = read_nmodes(
+                "%s%s" % (DEFAULT_REC_NM_FILE, NUMPY_FILE_SAVE_EXTENSION)
+            )
+        except:
+            log.warning("No ANM found for receptor molecule")
+            receptor.n_modes = None
+        try:
+            ligand.n_modes = read_nmodes(
+                "%s%s" % (DEFAULT_LIG_NM_FILE, NUMPY_FILE_SAVE_EXTENSION)
+            )
+        except:
+            log.warning("No ANM found for ligand molecule")
+            ligand.n_modes = None
+    startup_profile.mark("Structures")
+
+    starting_points_files = load_starting_positions(
+        args.swarms, args.glowworms, args.use_anm, args.anm_rec, args.anm_lig
+    )
+    startup_profile.mark("Starting positions")
 
-        if args.use_anm:
-            try:
-                receptor.n_modes = read_nmodes(
-                    "%s%s" % (DEFAULT_REC_NM_FILE, NUMPY_FILE_SAVE_EXTENSION)
+    scoring_functions, adapters = set_scoring_function(parser, receptor, ligand)
+    startup_profile.mark("Scoring functions")
+
+    # Check if scoring functions are compatible with ANM if activated
+    if args.use_anm:
+        for s in scoring_functions:
+            if not s.anm_support:
+                raise NotSupportedInScoringError(
+                    f"ANM is activated while {type(s).__name__} has no support for it"
                 )
-            except:
-                log.warning("No ANM found for receptor molecule")
-                receptor.n_modes = None
-            try:
-                ligand.n_modes = read_nmodes(
-                    "%s%s" % (DEFAULT_LIG_NM_FILE, NUMPY_FILE_SAVE_EXTENSION)
+            if args.anm_rec > 0 and not s.anm_rec_support:
+                raise NotSupportedInScoringError(
+                    f"Receptor ANM is activated while {type(s).__name__} has no "
+                    "support for it"
                 )
-            except:
-                log.warning("No ANM found for ligand molecule")
-                ligand.n_modes = None
 
-        starting_points_files = load_starting_positions(
-            args.swarms, args.glowworms, args.use_anm, args.anm_rec, args.anm_lig
+    # Functions sharing coordinates are evaluated on the same pose
+    if args.composite_scoring:
+        scoring_functions, adapters = CompositeScoringFunction.group(
+            scoring_functions, adapters
         )
 
-        scoring_functions, adapters = set_scoring_function(parser, receptor, ligand)
+    return scoring_functions, adapters, starting_points_files
 
-        # Check if scoring functions are compatible with ANM if activated
-        if args.use_anm:
-            for s in scoring_functions:
-                if not s.anm_support:
-                    raise NotSupportedInScoringError(
-                        f"ANM is activated while {type(s).__name__} has no support for it"
-                    )
 
+def run_simulation(parser):
+    """Main program"""
+    try:
+        parser = CommandLineParser()
+        args = parser.args
+        read_setup(args)
+
+        info_file = create_simulation_info_file(args)
+        log.info("simulation parameters saved to %s" % info_file)
+        startup_profile.mark("Setup")
+
+        scoring_functions, adapters, starting_points_files = prepare_simulation(
+            parser
+        )
         tasks = prepare_gso_tasks(
             parser, adapters, scoring_functions, starting_points_files
         )
+        startup_profile.mark("GSO tasks")
+        if args.startup_profile:
+            log.info(startup_profile.report())
 
         # Preparing the parallel execution
-        kraken = Kraken(tasks, parser.args.cores, parser.args.profiling)
+        if args.prune_steps:
+            kraken = HalvingKraken(
+                tasks,
+                parser.args.cores,
+                parser.args.profiling,
+                args.prune_steps,
+                args.prune_fraction,
+                args.prune_by,
+            )
+        else:
+            kraken = Kraken(tasks, parser.args.cores, parser.args.profiling)
         log.info("Monster spotted")
         _ = kraken.release()
         log.info("Finished.")
@@ -0,0 +1,94 @@
+"""LightDock simulation distributed to workers connected through TCP"""
+
+import os
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+from lightdock.util.logger import LoggingManager
+from lightdock.util.parser import CommandLineParser
+from lightdock.prep.simulation import create_simulation_info_file
+from lightdock.constants import DEFAULT_SWARM_FOLDER, GSO_OUTPUT_FILE
+from lightdock.parallel.network import SwarmCoordinator, SwarmWorker
+from lightdock.simulation.docking_multiprocessing import (
+    read_setup,
+    prepare_simulation,
+    get_swarm_ids,
+    create_gso_task,
+)
+
+
+log = LoggingManager.get_logger("lgd_run")
+
+
+def get_output_file(steps, id_swarm):
+    return Path("%s%d" % (DEFAULT_SWARM_FOLDER, id_swarm)) / (GSO_OUTPUT_FILE % steps)
+
+
+def save_swarm_output(steps, id_swarm, result):
+    """Writes the final output sent by a worker, which may not share this folder"""
+    output_file = get_output_file(steps, id_swarm)
+    output_file.parent.mkdir(exist_ok=True)
+    handle, temp_file = tempfile.mkstemp(dir=output_file.parent, suffix=".out")
+    try:
+        with os.fdopen(handle, "w") as output:
+            output.write(result["output"])
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
+def run_coordinator(parser, arguments=None):
+    """Serves the swarms of the simulation to the workers until all are simulated.
+
+    arguments is the command line sent to the workers, the one of this process by
+    default.
+    """
+    args = parser.args
+    read_setup(args)
+    info_file = create_simulation_info_file(args)
+    log.info("simulation parameters saved to %s" % info_file)
+    if args.prune_steps:
+        log.warning("Pruning of swarms is not supported by workers, ignored")
+
+    host, port = args.coordinator
+    coordinator = SwarmCoordinator(
+        get_swarm_ids(parser),
+        sys.argv[1:] if arguments is None else arguments,
+        host,
+        port,
+        args.worker_timeout,
+        on_completed=partial(save_swarm_output, args.steps),
+    )
+    results = coordinator.serve()
+    log.info(
+        "%d swarms simulated by %d workers" % (len(results), coordinator.num_workers)
+    )
+    log.info("Finished.")
+
+
+def run_worker(address):
+    """Simulates swarms served by the coordinator at address"""
+    host, port = address
+    worker = SwarmWorker(host or "localhost", port)
+    arguments = worker.connect()
+    log.info("Worker %d connected to %s:%d" % (worker.id, worker.host, port))
+    try:
+        parser = CommandLineParser(arguments)
+        read_setup(parser.args)
+        scoring_functions, adapters, starting_points_files = prepare_simulation(parser)
+    except BaseException:
+        worker.close()
+        raise
+
+    def run_swarm(id_swarm):
+        task = create_gso_task(
+            parser, adapters, scoring_functions, starting_points_files, id_swarm
+        )
+        task.run()
+        output_file = get_output_file(task.steps, id_swarm)
+        return {"output": output_file.read_text(), "last_step": task.gso.last_step}
+
+    num_swarms = worker.run(run_swarm)
+    log.info("Worker %d finished after %d swarms" % (worker.id, num_swarms))
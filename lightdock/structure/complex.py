@@ -1,6 +1,7 @@
 """Module to package a protein complex"""
 import numpy as np
-from lightdock.structure.space import SpacePoints
+from lightdock.structure.space import Ensemble
+from lightdock.error.lightdock_errors import StructureError
 
 
 class Complex(object):
@@ -41,20 +42,26 @@ class Complex(object):
             residue.index = residue_index
 
         if structures:
+            if len(set(len(structure["atoms"]) for structure in structures)) > 1:
+                raise StructureError(
+                    "All the structures of an ensemble must have the same atoms"
+                )
             self.num_structures = len(structures)
             self.structure_file_names = [
                 structure["file_name"] for structure in structures
             ]
-            self.atom_coordinates = [
-                SpacePoints([[atom.x, atom.y, atom.z] for atom in structure["atoms"]])
-                for structure in structures
-            ]
+            self.atom_coordinates = Ensemble(
+                [
+                    [[atom.x, atom.y, atom.z] for atom in structure["atoms"]]
+                    for structure in structures
+                ]
+            )
         else:
             self.num_structures = 1
             self.structure_file_names = [str(structure_file_name)]
-            self.atom_coordinates = [
-                SpacePoints([[atom.x, atom.y, atom.z] for atom in self.atoms])
-            ]
+            self.atom_coordinates = Ensemble(
+                [[[atom.x, atom.y, atom.z] for atom in self.atoms]]
+            )
 
         self.num_atoms = len(self.atoms)
         self.protein_num_atoms = sum(
@@ -88,7 +95,7 @@ class Complex(object):
 
     def copy_coordinates(self):
         """Deep copy of atom coordinates"""
-        return [coordinates.clone() for coordinates in self.atom_coordinates]
+        return self.atom_coordinates.copy()
 
     def get_nm_mask(self):
         """Calculates the mask on atoms to apply ANM"""
@@ -122,10 +129,11 @@ class Complex(object):
             total_y = 0.0
             total_z = 0.0
             total_mass = 0.0
+            coordinates = self.atom_coordinates[structure]
             for atom in self.atoms:
-                total_x += self.atom_coordinates[structure][atom.index][0] * atom.mass
-                total_y += self.atom_coordinates[structure][atom.index][1] * atom.mass
-                total_z += self.atom_coordinates[structure][atom.index][2] * atom.mass
+                total_x += coordinates[atom.index][0] * atom.mass
+                total_y += coordinates[atom.index][1] * atom.mass
+                total_z += coordinates[atom.index][2] * atom.mass
                 total_mass += atom.mass
             return [total_x / total_mass, total_y / total_mass, total_z / total_mass]
         else:
@@ -141,23 +149,22 @@ class Complex(object):
             total_x = 0.0
             total_y = 0.0
             total_z = 0.0
+            coordinates = self.atom_coordinates[structure]
             for atom in atoms:
-                total_x += self.atom_coordinates[structure][atom.index][0]
-                total_y += self.atom_coordinates[structure][atom.index][1]
-                total_z += self.atom_coordinates[structure][atom.index][2]
+                total_x += coordinates[atom.index][0]
+                total_y += coordinates[atom.index][1]
+                total_z += coordinates[atom.index][2]
             return [total_x / dimension, total_y / dimension, total_z / dimension]
         else:
             return [0.0, 0.0, 0.0]
 
     def translate(self, vector):
         """Translates atom coordinates based on vector"""
-        for coordinates in self.atom_coordinates:
-            coordinates.translate(vector)
+        self.atom_coordinates.translate(vector)
 
     def rotate(self, q):
         """Rotates this complex using a quaternion q"""
-        for coordinates in self.atom_coordinates:
-            coordinates.rotate(q)
+        self.atom_coordinates.rotate(q)
 
     def move_to_origin(self):
         """Moves the structure to the origin of coordinates"""
@@ -184,11 +191,10 @@ class Complex(object):
         self.atom_coordinates[index] = item
 
     def __iter__(self):
-        for coordinates in self.atom_coordinates:
-            yield coordinates
+        return iter(self.atom_coordinates)
 
     def __len__(self) -> int:
-        return self.atom_coordinates[0].shape()[0]
+        return self.atom_coordinates.shape()[1]
 
     def representative(self, is_membrane=False):
         coordinates = self.atom_coordinates[self.representative_id]
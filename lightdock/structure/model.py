@@ -1,9 +1,48 @@
 import numpy as np
 from lightdock.mathutil.ellipsoid import MinimumVolumeEllipsoid
-from lightdock.structure.space import SpacePoints
+from lightdock.structure.space import SpacePoints, Ensemble
 from lightdock.error.lightdock_errors import MinimumVolumeEllipsoidError
 
 
+class CompiledRestraints(object):
+    """Restraints compiled into arrays of atom indexes and restraint ids.
+
+    Restraints are given as a dictionary of residue identifiers and the indexes of
+    their atoms, a restraint is satisfied if any of its atoms is in the interface.
+    """
+
+    def __init__(self, restraints=None):
+        restraints = restraints if restraints else {}
+        self.num_restraints = len(restraints)
+        atom_lists = [list(atoms) for atoms in restraints.values()]
+        self.atoms = np.fromiter(
+            (atom for atoms in atom_lists for atom in atoms), dtype=np.intp
+        )
+        self.ids = np.repeat(
+            np.arange(self.num_restraints, dtype=np.intp),
+            [len(atoms) for atoms in atom_lists],
+        )
+        self.mask_size = self.atoms.max() + 1 if len(self.atoms) else 0
+
+    def satisfied(self, interface):
+        """Calculates the percentage of restraints with atoms in interface"""
+        if not self.num_restraints:
+            return 0.0
+        if isinstance(interface, (set, frozenset)):
+            interface = np.fromiter(interface, dtype=np.intp, count=len(interface))
+        else:
+            interface = np.asarray(interface, dtype=np.intp)
+        in_interface = np.zeros(self.mask_size, dtype=bool)
+        in_interface[interface[interface < self.mask_size]] = True
+        satisfied = np.bincount(
+            self.ids[in_interface[self.atoms]], minlength=self.num_restraints
+        )
+        return float(np.count_nonzero(satisfied)) / self.num_restraints
+
+    def __len__(self):
+        return self.num_restraints
+
+
 class DockingModel(object):
     """Represents a docking model of a protein molecule"""
 
@@ -18,10 +57,13 @@ class DockingModel(object):
         nm_mask=None,
     ):
         self.objects = objects
-        if type(coordinates) is list:
+        # Ensembles are shared with the molecule, they are copied before being moved
+        if isinstance(coordinates, Ensemble):
             self.coordinates = coordinates
+        elif type(coordinates) is list:
+            self.coordinates = Ensemble.from_points(coordinates)
         else:
-            self.coordinates = [coordinates]
+            self.coordinates = Ensemble.from_points([coordinates])
         # TODO: Calculate only one set of reference points
         if reference_points is None:
             # Reference points calculation. If single matrix error is found, calculate centroid
@@ -37,18 +79,21 @@ class DockingModel(object):
         self.n_modes = n_modes
         self.restraints = restraints
         self.membrane = membrane
+        # Restraints are compiled once, as they are evaluated for every pose
+        self.compiled_restraints = CompiledRestraints(restraints)
+        self.compiled_membrane = CompiledRestraints(membrane)
         self.nm_mask = nm_mask
 
     def translate(self, vector):
         """Translates coordinates based on vector"""
-        for coordinates in self.coordinates:
-            coordinates.translate(vector)
+        self.coordinates = self.coordinates.copy()
+        self.coordinates.translate(vector)
         self.reference_points.translate(vector)
 
     def rotate(self, q):
         """Rotates coordinates using a quaternion q"""
-        for coordinates in self.coordinates:
-            coordinates.rotate(q)
+        self.coordinates = self.coordinates.copy()
+        self.coordinates.rotate(q)
         self.reference_points.rotate(q)
 
     def __len__(self):
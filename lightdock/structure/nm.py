@@ -1,10 +1,10 @@
 """Module to calculate normal modes of a given protein.
 
-It uses the awesome Prody library
+It uses the awesome Prody library, which is only imported when normal modes are
+calculated, so reading them at simulation time does not load it.
 """
 
 import numpy as np
-from prody import parsePDB, ANM, extendModel, confProDy
 from lightdock.error.lightdock_errors import NormalModesCalculationError
 from lightdock.util.logger import LoggingManager
 from lightdock.constants import (
@@ -14,14 +14,16 @@ from lightdock.constants import (
     DEFAULT_EXTENT_SIGMA,
 )
 
-# Disable ProDy output
-confProDy(verbosity="none")
-
 log = LoggingManager.get_logger("ANM")
 
 
 def calculate_nmodes(pdb_file_name, n_modes, rmsd, seed, molecule):
     """Calculates Normal modes for a given molecule"""
+    from prody import parsePDB, ANM, extendModel, confProDy
+
+    # Disable ProDy output
+    confProDy(verbosity="none")
+
     prody_molecule = parsePDB(str(pdb_file_name))
     if not prody_molecule:
         raise NormalModesCalculationError(f"ProDy is not capable of reading {pdb_file_name}. Please try renaming any input PDB file which extension is not .pdb")
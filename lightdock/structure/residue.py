@@ -1,7 +1,6 @@
 """Module to package a complex residue representation and operations"""
 
 import numpy as np
-from scipy.spatial import cKDTree
 from lightdock.error.lightdock_errors import (
     ResidueNonStandardError,
     SideChainError,
@@ -199,7 +198,7 @@ class Residue(object):
         """Calculates center of coordiantes of residue and returns closest atom"""
         coordinates = np.array([[atom.x, atom.y, atom.z] for atom in self.atoms])
         centroid = coordinates.mean(axis=0)
-        min_dist, min_dist_idx = cKDTree(coordinates).query(centroid, 1)
+        min_dist_idx = np.argmin(((coordinates - centroid) ** 2).sum(axis=1))
         return self.atoms[min_dist_idx]
 
     def get_non_hydrogen_atoms(self):
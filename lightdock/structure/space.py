@@ -1,4 +1,6 @@
+import tempfile
 import numpy as np
+from lightdock.constants import DEFAULT_ENSEMBLE_MMAP_SIZE
 
 
 class SpacePoints(object):
@@ -7,6 +9,13 @@ class SpacePoints(object):
     def __init__(self, coordinates):
         self.coordinates = np.array(coordinates)
 
+    @classmethod
+    def from_array(cls, coordinates):
+        """Points backed by the coordinates array, without copying it"""
+        points = cls.__new__(cls)
+        points.coordinates = coordinates
+        return points
+
     def clone(self):
         return SpacePoints(self.coordinates.copy())
 
@@ -46,3 +55,75 @@ class SpacePoints(object):
 
     def shape(self):
         return self.coordinates.shape
+
+
+class Ensemble(object):
+    """Coordinates of the atoms of the structures of a molecule.
+
+    Coordinates are stored in a single (structures, atoms, 3) array, memory mapped to
+    a temporary file when bigger than mmap_size bytes. Selecting a structure returns
+    SpacePoints backed by a view of this array, so the coordinates are not copied.
+    """
+
+    def __init__(self, coordinates, mmap_size=DEFAULT_ENSEMBLE_MMAP_SIZE):
+        coordinates = np.asarray(coordinates, dtype=float)
+        coordinates = coordinates.reshape(len(coordinates), -1, 3)
+        self.mmap_size = mmap_size
+        if mmap_size is not None and coordinates.nbytes > mmap_size:
+            # The temporary file is removed once the array is released
+            with tempfile.TemporaryFile() as mapped_file:
+                self.coordinates = np.memmap(
+                    mapped_file, dtype=float, mode="w+", shape=coordinates.shape
+                )
+            self.coordinates[:] = coordinates
+        else:
+            self.coordinates = np.array(coordinates)
+
+    @classmethod
+    def from_points(cls, points, mmap_size=DEFAULT_ENSEMBLE_MMAP_SIZE):
+        """Ensemble from a list of SpacePoints or coordinates arrays"""
+        return cls(
+            [np.asarray(getattr(p, "coordinates", p), dtype=float) for p in points],
+            mmap_size,
+        )
+
+    @property
+    def is_mapped(self):
+        return isinstance(self.coordinates, np.memmap)
+
+    def copy(self):
+        return Ensemble(self.coordinates, self.mmap_size)
+
+    def translate(self, vector):
+        """Translates the coordinates of all the structures based on vector"""
+        self.coordinates += vector
+
+    def rotate(self, q):
+        """Rotates the coordinates of all the structures using a quaternion q"""
+        for structure in self:
+            structure.rotate(q)
+
+    def __getitem__(self, item):
+        return SpacePoints.from_array(self.coordinates[item])
+
+    def __setitem__(self, index, item):
+        self.coordinates[index] = getattr(item, "coordinates", item)
+
+    def __iter__(self):
+        for coordinates in self.coordinates:
+            yield SpacePoints.from_array(coordinates)
+
+    def __len__(self):
+        return self.coordinates.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.coordinates, dtype=dtype)
+
+    def __eq__(self, other):
+        return np.allclose(self.coordinates, np.asarray(other))
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def shape(self):
+        return self.coordinates.shape
@@ -66,3 +66,80 @@ class TestGenerateRankingWithoutClusters:
             self.golden_data_path / "rank_by_scoring_noclust.list",
             tmp_path / "rank_by_scoring.list",
         )
+
+
+class TestGenerateRankingTop:
+    def setup_class(self):
+        self.path = Path(__file__).absolute().parent
+        self.golden_data_path = self.path / "golden_data" / "4IZ7"
+
+    def test_rank_top(self, tmp_path):
+        num_swarms = 4
+        num_steps = 10
+        top = 5
+
+        os.chdir(tmp_path)
+        for i in range(num_swarms):
+            swarm_dir = f"swarm_{i}"
+            os.mkdir(swarm_dir)
+            shutil.copyfile(
+                self.golden_data_path / swarm_dir / f"gso_{num_steps}.out",
+                tmp_path / swarm_dir / f"gso_{num_steps}.out",
+            )
+
+        command = f"lgd_rank.py {num_swarms} {num_steps} --top {top} --cores 2"
+        command += " > test.out"
+        os.system(command)
+
+        with open(self.golden_data_path / "rank_by_scoring_noclust.list") as fin:
+            expected = fin.readlines()[: top + 1]
+        with open(tmp_path / "rank_by_scoring.list") as fin:
+            lines = fin.readlines()
+        assert lines == expected
+
+
+class TestGenerateRankingCores:
+    def setup_class(self):
+        self.path = Path(__file__).absolute().parent
+        self.golden_data_path = self.path / "golden_data" / "4IZ7"
+
+    def test_rank_cores(self, tmp_path):
+        num_swarms = 4
+        num_steps = 10
+        rankings = [
+            "solutions.list",
+            "rank_by_luciferin.list",
+            "rank_by_rmsd.list",
+            "rank_by_scoring.list",
+        ]
+
+        for cores in [1, 2]:
+            run_path = tmp_path / f"cores_{cores}"
+            run_path.mkdir()
+            os.chdir(run_path)
+            for i in range(num_swarms):
+                swarm_dir = f"swarm_{i}"
+                os.mkdir(swarm_dir)
+                shutil.copyfile(
+                    self.golden_data_path / swarm_dir / f"gso_{num_steps}.out",
+                    run_path / swarm_dir / f"gso_{num_steps}.out",
+                )
+                shutil.copyfile(
+                    self.golden_data_path / swarm_dir / "cluster.repr",
+                    run_path / swarm_dir / "cluster.repr",
+                )
+
+            command = f"lgd_rank.py {num_swarms} {num_steps} --cores {cores} > test.out"
+            os.system(command)
+
+        for ranking in rankings:
+            assert (tmp_path / "cores_1" / ranking).is_file()
+            assert filecmp.cmp(
+                tmp_path / "cores_1" / ranking,
+                tmp_path / "cores_2" / ranking,
+                shallow=False,
+            )
+        assert filecmp.cmp(
+            self.golden_data_path / "rank_by_scoring.list",
+            tmp_path / "cores_2" / "rank_by_scoring.list",
+        )
@@ -301,3 +301,97 @@ class TestDockingLandscapePosition:
         assert expected_rotation == landscape_position1.rotation
         assert np.allclose(expected_anm, landscape_position1.rec_extent)
         assert np.allclose(expected_anm, landscape_position1.lig_extent)
+
+    def test_poses_share_structures(self):
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPElig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        adapter = MJ3hAdapter(self.receptor, ligand)
+        scoring_function = MJ3h()
+        coordinates = Coordinates([10.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+        landscape_position = DockingLandscapePosition(
+            scoring_function, coordinates, adapter.receptor_model, adapter.ligand_model
+        )
+        receptor_structures = adapter.receptor_model.coordinates.coordinates
+        ligand_structures = adapter.ligand_model.coordinates.coordinates
+
+        assert np.shares_memory(
+            landscape_position.receptor_pose.coordinates, receptor_structures
+        )
+
+        landscape_position.evaluate_objective_function()
+
+        # The receptor is not moved, but the ligand pose is a moved copy
+        assert np.shares_memory(
+            landscape_position.receptor_pose.coordinates, receptor_structures
+        )
+        assert not np.shares_memory(
+            landscape_position.ligand_pose.coordinates, ligand_structures
+        )
+        assert np.allclose(
+            landscape_position.ligand_pose.coordinates,
+            ligand_structures[0] + [10.0, 0.0, 0.0],
+        )
+
+    def test_score_vectors(self):
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPElig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        adapter = MJ3hAdapter(self.receptor, ligand)
+        scoring_function = MJ3h()
+        vectors = np.array(
+            [
+                [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0],
+                [10.0, -2.0, 3.0, 0.5, 0.5, -0.5, 0.5],
+            ]
+        )
+        landscape_position = DockingLandscapePosition(
+            scoring_function,
+            Coordinates(list(vectors[0])),
+            adapter.receptor_model,
+            adapter.ligand_model,
+        )
+
+        scores = landscape_position.score_vectors(vectors)
+
+        expected = []
+        for vector in vectors:
+            landscape_position.update_landscape_position(vector)
+            expected.append(landscape_position.evaluate_objective_function())
+        assert np.allclose(expected, scores)
+        assert 2.02 == pytest.approx(scores[0])
+
+    def test_score_vectors_with_anm(self):
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPElig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        adapter = MJ3hAdapter(self.receptor, ligand)
+        rng = np.random.default_rng(324324)
+        for model in [adapter.receptor_model, adapter.ligand_model]:
+            model.n_modes = rng.normal(size=(2, len(model.coordinates[0]), 3))
+        vectors = np.array(
+            [
+                [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, -1.0, 0.5, 0.5],
+                [5.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 2.0, -1.0, 0.0],
+            ]
+        )
+        landscape_position = DockingLandscapePosition(
+            MJ3h(),
+            Coordinates(list(vectors[0])),
+            adapter.receptor_model,
+            adapter.ligand_model,
+            num_rec_nmodes=2,
+            num_lig_nmodes=2,
+        )
+
+        scores = landscape_position.score_vectors(vectors)
+
+        expected = []
+        for vector in vectors:
+            landscape_position.update_landscape_position(vector)
+            expected.append(landscape_position.evaluate_objective_function())
+        assert np.allclose(expected, scores)
@@ -0,0 +1,124 @@
+"""Tests for the swaps of conformers of glowworms"""
+
+import pytest
+from pathlib import Path
+from lightdock.gso.conformers import ConformerSwap
+from lightdock.gso.glowworm import Glowworm
+from lightdock.gso.parameters import GSOParameters
+from lightdock.gso.searchspace.landscape import DockingLandscapePosition
+from lightdock.gso.coordinates import Coordinates
+from lightdock.mathutil.lrandom import MTGenerator
+from lightdock.pdbutil.PDBIO import parse_complex_from_file
+from lightdock.structure.complex import Complex
+from lightdock.scoring.mj3h.driver import MJ3h, MJ3hAdapter
+
+
+class TestConformerSwap:
+    def setup_class(self):
+        self.golden_data_path = Path(__file__).absolute().parent / "golden_data"
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPErec.pdb"
+        )
+        receptor = Complex(chains, atoms)
+        # Ligand ensemble: the bound structure and a copy away from the receptor
+        structures = []
+        for shift in [0.0, 30.0]:
+            atoms, residues, chains = parse_complex_from_file(
+                self.golden_data_path / "1PPElig.pdb"
+            )
+            for atom in atoms:
+                atom.x += shift
+            structures.append(
+                {
+                    "atoms": atoms,
+                    "residues": residues,
+                    "chains": chains,
+                    "file_name": "1PPElig.pdb",
+                }
+            )
+        ligand = Complex.from_structures(structures)
+        self.adapter = MJ3hAdapter(receptor, ligand)
+        self.scoring_function = MJ3h()
+        self.gso_parameters = GSOParameters()
+
+    def create_position(self, ligand_id):
+        return DockingLandscapePosition(
+            self.scoring_function,
+            Coordinates([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]),
+            self.adapter.receptor_model,
+            self.adapter.ligand_model,
+            ligand_id=ligand_id,
+        )
+
+    def test_propose(self):
+        position = self.create_position(ligand_id=1)
+        rnd_generator = MTGenerator(1234)
+        expected = MTGenerator(1234)
+        # Receptor and ligand conformers and the probability of the trial
+        numbers = expected.take(3)
+
+        ConformerSwap(rate=1.0).propose(position, rnd_generator)
+
+        assert position.trial_conformers == (0, int(numbers[1] * 2))
+        assert rnd_generator() == expected()
+
+    def test_propose_rate(self):
+        position = self.create_position(ligand_id=1)
+
+        ConformerSwap(rate=0.0).propose(position, MTGenerator(1234))
+
+        assert position.trial_conformers is None
+
+    def test_swap_accepted(self):
+        conformer_swap = ConformerSwap(rate=1.0)
+        position = self.create_position(ligand_id=1)
+        position.trial_conformers = (0, 0)
+        expected = self.create_position(ligand_id=0).evaluate_objective_function()
+
+        scoring = conformer_swap.evaluate(position)
+
+        assert scoring == pytest.approx(expected)
+        assert position.ligand_id == 0
+        assert position.trial_conformers is None
+        # The pose is the one of the new conformer
+        assert position.evaluate_objective_function() == pytest.approx(expected)
+        assert conformer_swap.trials == 1
+        assert conformer_swap.accepted == 1
+        assert conformer_swap.acceptance == 1.0
+
+    def test_swap_rejected(self):
+        conformer_swap = ConformerSwap(rate=1.0)
+        position = self.create_position(ligand_id=0)
+        position.trial_conformers = (0, 1)
+        expected = position.evaluate_objective_function()
+
+        scoring = conformer_swap.evaluate(position)
+
+        assert scoring == pytest.approx(expected)
+        assert position.ligand_id == 0
+        assert conformer_swap.trials == 1
+        assert conformer_swap.accepted == 0
+        assert "1 trials, 0 accepted (0.0%)" in conformer_swap.report()
+
+    def test_no_trial(self):
+        conformer_swap = ConformerSwap(rate=1.0)
+        position = self.create_position(ligand_id=1)
+
+        conformer_swap.evaluate(position)
+
+        assert position.ligand_id == 1
+        assert conformer_swap.trials == 0
+
+    def test_glowworm(self):
+        conformer_swap = ConformerSwap(rate=1.0)
+        glowworm = Glowworm([self.create_position(ligand_id=1)], self.gso_parameters)
+        glowworm.compute_luciferin()
+        away_scoring = glowworm.scoring
+        glowworm.landscape_positions[0].trial_conformers = (0, 0)
+        glowworm.moved = True
+
+        glowworm.compute_luciferin(conformer_swap)
+
+        assert glowworm.landscape_positions[0].ligand_id == 0
+        assert glowworm.scoring > away_scoring
+        assert conformer_swap.accepted == 1
@@ -0,0 +1,99 @@
+"""Tests for the convergence of swarms"""
+
+from lightdock.gso.convergence import ConvergenceMonitor
+from lightdock.gso.parameters import GSOParameters
+from lightdock.gso.searchspace.benchmark_ofunctions import J1
+from lightdock.gso.algorithm import GSOBuilder
+from lightdock.gso.boundaries import Boundary, BoundingBox
+from lightdock.gso.glowworm import Glowworm
+from lightdock.mathutil.lrandom import MTGenerator
+
+
+class FakeSwarm:
+    def __init__(self, glowworms):
+        self.glowworms = glowworms
+
+    def get_size(self):
+        return len(self.glowworms)
+
+
+class TestConvergenceMonitor:
+    def setup_method(self):
+        gso_parameters = GSOParameters()
+        self.glowworms = [Glowworm([None], gso_parameters) for _ in range(10)]
+        self.swarm = FakeSwarm(self.glowworms)
+
+    def test_patience(self):
+        monitor = ConvergenceMonitor(3)
+
+        converged = [monitor.update(self.swarm) for _ in range(4)]
+
+        assert converged == [False, False, False, True]
+
+    def test_scoring_changes(self):
+        monitor = ConvergenceMonitor(2, scoring_tolerance=0.1)
+        monitor.update(self.swarm)
+        monitor.update(self.swarm)
+        self.glowworms[0].scoring = 1.0
+
+        assert not monitor.update(self.swarm)
+        assert monitor.stalled_steps == 0
+        assert not monitor.update(self.swarm)
+        assert monitor.update(self.swarm)
+
+    def test_luciferin_changes(self):
+        monitor = ConvergenceMonitor(1, luciferin_tolerance=0.1)
+        monitor.update(self.swarm)
+        self.glowworms[0].luciferin += 2.0
+
+        assert not monitor.update(self.swarm)
+        assert monitor.update(self.swarm)
+
+    def test_moving_glowworms(self):
+        monitor = ConvergenceMonitor(1, max_moving=0.1)
+        monitor.update(self.swarm)
+        self.glowworms[0].moved = True
+
+        assert monitor.update(self.swarm)
+        self.glowworms[1].moved = True
+        assert not monitor.update(self.swarm)
+
+
+class TestGSOConvergence:
+    def create_gso(self, convergence=None):
+        gso_parameters = GSOParameters()
+        gso_parameters.initial_vision_range = 3.0
+        gso_parameters.max_vision_range = 3.0
+        gso = GSOBuilder().create(
+            20,
+            MTGenerator(324324),
+            gso_parameters,
+            J1(),
+            BoundingBox([Boundary(-3.0, 3.0), Boundary(-3.0, 3.0)]),
+        )
+        gso.convergence = convergence
+        return gso
+
+    def test_early_stop(self, tmp_path):
+        gso = self.create_gso(
+            ConvergenceMonitor(
+                5, scoring_tolerance=0.1, luciferin_tolerance=0.1, max_moving=1.0
+            )
+        )
+
+        gso.run(100, saving_path=tmp_path, save_intermediary=True)
+
+        assert gso.last_step < 100
+        final_file = tmp_path / "gso_100.out"
+        assert final_file.is_file()
+        lines = final_file.read_text().splitlines()
+        assert lines[-1] == f"#Converged at step {gso.last_step}"
+        assert len([line for line in lines if line[0] != "#"]) == 20
+
+    def test_no_convergence(self, tmp_path):
+        gso = self.create_gso()
+
+        gso.run(20, saving_path=tmp_path, save_intermediary=True)
+
+        assert gso.last_step == 20
+        assert "Converged" not in (tmp_path / "gso_20.out").read_text()
@@ -0,0 +1,131 @@
+"""Tests for the local minimization of glowworms"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+from lightdock.gso.minimizer import PatternSearch
+from lightdock.gso.algorithm import GSO
+from lightdock.gso.swarm import Swarm
+from lightdock.gso.glowworm import Glowworm
+from lightdock.gso.parameters import GSOParameters
+from lightdock.gso.searchspace.landscape import DockingLandscapePosition
+from lightdock.gso.coordinates import Coordinates
+from lightdock.mathutil.cython.quaternion import Quaternion
+from lightdock.mathutil.lrandom import MTGenerator
+from lightdock.pdbutil.PDBIO import parse_complex_from_file
+from lightdock.structure.complex import Complex
+from lightdock.scoring.mj3h.driver import MJ3h, MJ3hAdapter
+
+
+class TestPatternSearch:
+    def setup_class(self):
+        self.golden_data_path = Path(__file__).absolute().parent / "golden_data"
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPErec.pdb"
+        )
+        receptor = Complex(chains, atoms)
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPElig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        self.adapter = MJ3hAdapter(receptor, ligand)
+        self.scoring_function = MJ3h()
+        self.gso_parameters = GSOParameters()
+
+    def create_glowworm(self, coordinates):
+        landscape_position = DockingLandscapePosition(
+            self.scoring_function,
+            Coordinates(coordinates),
+            self.adapter.receptor_model,
+            self.adapter.ligand_model,
+        )
+        glowworm = Glowworm([landscape_position], self.gso_parameters)
+        glowworm.compute_luciferin()
+        return glowworm
+
+    def test_candidates(self):
+        minimizer = PatternSearch(translation_step=2.0, rotation_step=np.pi)
+        vector = np.array([1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.5])
+
+        candidates = minimizer.get_candidates(vector, 0.5)
+
+        assert candidates.shape == (14, 8)
+        assert np.allclose(candidates[0, :3], [2.0, 0.0, 0.0])
+        assert np.allclose(candidates[1, :3], [0.0, 0.0, 0.0])
+        # 90 degrees around the z axis
+        assert Quaternion(*candidates[10, 3:7]) == Quaternion(
+            np.sqrt(0.5), 0.0, 0.0, np.sqrt(0.5)
+        )
+        assert np.allclose(candidates[12:, 7], [0.5 + 0.125, 0.5 - 0.125])
+        assert np.allclose(candidates[:12, 7], 0.5)
+
+    def test_minimize_improves(self):
+        glowworm = self.create_glowworm([10.0, 5.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+        initial_scoring = glowworm.scoring
+        minimizer = PatternSearch(budget=100)
+
+        minimizer.minimize([glowworm])
+
+        assert glowworm.scoring > initial_scoring
+        position = glowworm.landscape_positions[0]
+        assert glowworm.scoring == pytest.approx(
+            position.evaluate_objective_function()
+        )
+        assert minimizer.refined == 1
+        assert minimizer.improved == 1
+        assert 0 < minimizer.evaluations <= 100
+        assert minimizer.elapsed > 0.0
+
+    def test_minimize_top(self):
+        glowworms = [
+            self.create_glowworm([float(x), 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+            for x in [0.0, 5.0, 10.0, 20.0]
+        ]
+        scorings = [glowworm.scoring for glowworm in glowworms]
+        best = np.argsort(scorings)[::-1][:2]
+        minimizer = PatternSearch(top=2, budget=60)
+
+        minimizer.minimize(glowworms)
+
+        assert minimizer.refined == 2
+        assert minimizer.evaluations <= 60
+        for i, glowworm in enumerate(glowworms):
+            if i in best:
+                assert glowworm.scoring >= scorings[i]
+            else:
+                assert glowworm.scoring == scorings[i]
+
+    def test_no_budget(self):
+        glowworm = self.create_glowworm([10.0, 5.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+        initial_scoring = glowworm.scoring
+        minimizer = PatternSearch(budget=5)
+
+        minimizer.minimize([glowworm])
+
+        assert glowworm.scoring == initial_scoring
+        assert minimizer.evaluations == 0
+        assert "0 evaluations" in minimizer.report()
+
+    def test_gso_minimizer(self):
+        position = DockingLandscapePosition(
+            self.scoring_function,
+            Coordinates([10.0, 5.0, 0.0, 1.0, 0.0, 0.0, 0.0]),
+            self.adapter.receptor_model,
+            self.adapter.ligand_model,
+        )
+        swarm = Swarm([[position]], self.gso_parameters)
+        minimizer = PatternSearch()
+
+        # Powell on the best glowworm by default
+        powell = GSO(
+            swarm, self.gso_parameters, MTGenerator(1), local_minimization=True
+        )
+        pattern = GSO(
+            swarm, self.gso_parameters, MTGenerator(1), local_minimization=minimizer
+        )
+        disabled = GSO(swarm, self.gso_parameters, MTGenerator(1))
+
+        assert powell.local_minimization and powell.minimizer is None
+        assert pattern.local_minimization and pattern.minimizer is minimizer
+        assert "Local minimization" in str(pattern)
+        assert not disabled.local_minimization and disabled.minimizer is None
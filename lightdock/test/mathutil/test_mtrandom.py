@@ -1,5 +1,7 @@
 """Tests for MTGenerator class"""
 
+import pickle
+import random
 import pytest
 from lightdock.mathutil.lrandom import MTGenerator
 
@@ -63,3 +65,32 @@ class TestMTGenerator:
         gen = MTGenerator(25)
         for i in range(50):
             assert self.generated[i] == pytest.approx(gen())
+
+    def test_same_sequence_as_python_random(self):
+        python_random = random.Random()
+        python_random.seed(324324, version=1)
+        # Small blocks to cross several block boundaries
+        gen = MTGenerator(324324, block_size=7)
+        for _ in range(100):
+            assert gen(-2.0, 3.0) == python_random.uniform(-2.0, 3.0)
+        assert gen.randint(upper_limit=9) == int(python_random.random() * 10)
+
+    def test_take_and_skip(self):
+        gen = MTGenerator(25, block_size=7)
+        other = MTGenerator(25)
+
+        numbers = gen.take(20, 1.0, 2.0)
+        gen.skip(9)
+
+        assert numbers.shape == (20,)
+        assert numbers.tolist() == [other(1.0, 2.0) for _ in range(20)]
+        for _ in range(9):
+            other()
+        assert gen() == other()
+
+    def test_pickle(self):
+        gen = MTGenerator(25, block_size=7)
+        gen.take(10)
+        copy = pickle.loads(pickle.dumps(gen))
+
+        assert copy.take(20).tolist() == gen.take(20).tolist()
@@ -0,0 +1,120 @@
+"""Tests for the parallel execution of swarms"""
+
+import os
+import pytest
+from lightdock.gso.parameters import GSOParameters
+from lightdock.gso.searchspace.benchmark_ofunctions import J1
+from lightdock.gso.algorithm import GSOBuilder
+from lightdock.gso.boundaries import Boundary, BoundingBox
+from lightdock.mathutil.lrandom import MTGenerator
+from lightdock.parallel.kraken import HalvingKraken
+from lightdock.parallel.util import GSOClusterTask, SwarmSummary
+from lightdock.error.lightdock_errors import TentacleError
+
+
+class FailingTask(GSOClusterTask):
+    def run(self, stop_step=None):
+        raise ValueError("Swarm %d failed" % self.id)
+
+
+class DyingTask(GSOClusterTask):
+    def run(self, stop_step=None):
+        os._exit(1)
+
+
+def create_tasks(path, num_swarms, steps):
+    gso_parameters = GSOParameters()
+    tasks = []
+    for id_swarm in range(num_swarms):
+        gso = GSOBuilder().create(
+            10,
+            MTGenerator(id_swarm),
+            gso_parameters,
+            J1(),
+            BoundingBox([Boundary(-3.0, 3.0), Boundary(-3.0, 3.0)]),
+        )
+        saving_path = path / f"swarm_{id_swarm}"
+        saving_path.mkdir()
+        tasks.append(GSOClusterTask(id_swarm, gso, steps, saving_path))
+    return tasks
+
+
+class TestGSOClusterTask:
+    def test_run_in_rounds(self, tmp_path):
+        task = create_tasks(tmp_path, 1, 20)[0]
+
+        task.run(5)
+        assert task.gso.last_step == 5
+        assert not task.finished
+        task.run(20)
+
+        assert task.finished
+        assert (tmp_path / "swarm_0" / "gso_20.out").is_file()
+
+    def test_prune(self, tmp_path):
+        task = create_tasks(tmp_path, 1, 20)[0]
+        task.run(5)
+
+        task.prune()
+
+        assert task.finished
+        output = (tmp_path / "swarm_0" / "gso_20.out").read_text()
+        assert output.splitlines()[-1] == "#Pruned at step 5"
+        assert task.summary().finished
+
+
+class TestHalvingKraken:
+    def test_select(self, tmp_path):
+        kraken = HalvingKraken(
+            create_tasks(tmp_path, 1, 10), num_cpus=1, fraction=0.5, criterion="median"
+        )
+        summaries = {
+            0: SwarmSummary(False, 5.0, 1.0),
+            1: SwarmSummary(False, 1.0, 4.0),
+            2: SwarmSummary(False, 4.0, 3.0),
+            3: SwarmSummary(False, 3.0, 2.0),
+            4: SwarmSummary(False, 2.0, 0.0),
+        }
+
+        assert kraken.select(summaries) == {1, 2, 3}
+        kraken.criterion = "best"
+        assert kraken.select(summaries) == {0, 2, 3}
+        assert kraken.select({4: summaries[4]}) == {4}
+
+    def test_release(self, tmp_path):
+        tasks = create_tasks(tmp_path, 4, 30)
+        kraken = HalvingKraken(tasks, num_cpus=2, round_steps=10, fraction=0.5)
+
+        kraken.release()
+
+        last_lines = [
+            (tmp_path / f"swarm_{i}" / "gso_30.out").read_text().splitlines()[-1]
+            for i in range(4)
+        ]
+        pruned = sorted(line for line in last_lines if line.startswith("#"))
+        assert pruned == [
+            "#Pruned at step 10",
+            "#Pruned at step 10",
+            "#Pruned at step 20",
+        ]
+        for i in range(4):
+            assert (tmp_path / f"swarm_{i}" / "gso_10.out").is_file()
+
+    def test_release_failing_swarm(self, tmp_path):
+        tasks = create_tasks(tmp_path, 4, 30)
+        tasks[3] = FailingTask(3, tasks[3].gso, 30, tmp_path / "swarm_3")
+        kraken = HalvingKraken(tasks, num_cpus=2, round_steps=10)
+
+        with pytest.raises(TentacleError, match="Swarm 3 failed"):
+            kraken.release()
+
+        for tentacle in kraken.tentacles:
+            tentacle.join()
+
+    def test_release_dead_tentacle(self, tmp_path):
+        tasks = create_tasks(tmp_path, 2, 30)
+        tasks[1] = DyingTask(1, tasks[1].gso, 30, tmp_path / "swarm_1")
+        kraken = HalvingKraken(tasks, num_cpus=2, round_steps=10)
+
+        with pytest.raises(TentacleError, match="died"):
+            kraken.release()
@@ -0,0 +1,139 @@
+"""Tests for the distributed execution of swarms on localhost"""
+
+import socket
+import threading
+import time
+import pytest
+from lightdock.parallel.network import (
+    SwarmCoordinator,
+    SwarmWorker,
+    send_message,
+    receive_message,
+)
+from lightdock.util.parser import valid_address, get_worker_address
+
+
+def start_coordinator(coordinator):
+    results = {}
+    thread = threading.Thread(
+        target=lambda: results.update(coordinator.serve()), daemon=True
+    )
+    thread.start()
+    return thread, results
+
+
+def start_worker(port, run_swarm, heartbeat=0.05):
+    worker = SwarmWorker("localhost", port, heartbeat=heartbeat)
+    completed = []
+    worker_arguments = []
+
+    def work():
+        worker_arguments.extend(worker.connect())
+        completed.append(worker.run(run_swarm))
+
+    thread = threading.Thread(target=work, daemon=True)
+    thread.start()
+    return thread, completed, worker_arguments
+
+
+class TestMessages:
+    def test_send_receive(self):
+        left, right = socket.socketpair()
+        message = {"type": "completed", "swarm": 3, "result": {"output": "x" * 100000}}
+
+        send_message(left, message)
+        left.close()
+
+        assert receive_message(right) == message
+        assert receive_message(right) is None
+
+    def test_truncated_message(self):
+        left, right = socket.socketpair()
+        left.sendall(b"\x00\x00\x00\x10{}")
+        left.close()
+
+        with pytest.raises(ConnectionError):
+            receive_message(right)
+
+
+class TestSwarmCoordinator:
+    def test_several_workers(self):
+        completed_swarms = []
+        coordinator = SwarmCoordinator(
+            range(10),
+            ["setup.json", "10"],
+            "localhost",
+            0,
+            timeout=2.0,
+            on_completed=lambda swarm_id, result: completed_swarms.append(swarm_id),
+        )
+        port = coordinator.address[1]
+        thread, results = start_coordinator(coordinator)
+
+        def run_swarm(swarm_id):
+            time.sleep(0.01)
+            return {"square": swarm_id**2}
+
+        workers = [start_worker(port, run_swarm) for _ in range(3)]
+        thread.join(10.0)
+
+        assert not thread.is_alive()
+        assert results == {i: {"square": i**2} for i in range(10)}
+        assert sorted(completed_swarms) == list(range(10))
+        for worker_thread, completed, arguments in workers:
+            worker_thread.join(5.0)
+            assert arguments == ["setup.json", "10"]
+        assert sum(completed[0] for _, completed, _ in workers) == 10
+
+    def test_disconnected_worker(self):
+        coordinator = SwarmCoordinator(range(3), [], "localhost", 0, timeout=2.0)
+        port = coordinator.address[1]
+        thread, results = start_coordinator(coordinator)
+
+        # Takes a swarm and disconnects
+        connection = socket.create_connection(("localhost", port))
+        send_message(connection, {"type": "hello"})
+        receive_message(connection)
+        send_message(connection, {"type": "request"})
+        lost_swarm = receive_message(connection)["swarm"]
+        connection.close()
+
+        _, completed, _ = start_worker(port, lambda swarm_id: swarm_id)
+        thread.join(10.0)
+
+        assert not thread.is_alive()
+        assert results[lost_swarm] == lost_swarm
+        assert sorted(results) == [0, 1, 2]
+
+    def test_dead_worker(self):
+        coordinator = SwarmCoordinator(range(2), [], "localhost", 0, timeout=0.5)
+        port = coordinator.address[1]
+        thread, results = start_coordinator(coordinator)
+
+        # Takes a swarm and does not send heartbeats
+        connection = socket.create_connection(("localhost", port))
+        send_message(connection, {"type": "hello"})
+        receive_message(connection)
+        send_message(connection, {"type": "request"})
+        lost_swarm = receive_message(connection)["swarm"]
+
+        _, completed, _ = start_worker(port, lambda swarm_id: swarm_id, heartbeat=0.1)
+        thread.join(10.0)
+
+        assert not thread.is_alive()
+        assert sorted(results) == [0, 1]
+        assert results[lost_swarm] == lost_swarm
+        assert completed == [2]
+        # The connection of the dead worker has been closed
+        assert receive_message(connection) is None
+        connection.close()
+
+
+class TestAddresses:
+    def test_valid_address(self):
+        assert valid_address("9999") == ("", 9999)
+        assert valid_address("node1:9999") == ("node1", 9999)
+
+    def test_worker_address(self):
+        assert get_worker_address(["--worker", "node1:9999"]) == ("node1", 9999)
+        assert get_worker_address(["setup.json", "10"]) is None
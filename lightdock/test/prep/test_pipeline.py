@@ -0,0 +1,97 @@
+"""Tests for the setup pipeline module"""
+
+import os
+import pytest
+from pathlib import Path
+from lightdock.error.lightdock_errors import SetupError
+from lightdock.prep.pipeline import SetupPipeline, SetupStage, file_hash
+
+
+def write_file(file_name, content):
+    with open(file_name, "w") as output:
+        output.write(content)
+    return content
+
+
+def square(value):
+    return value * value
+
+
+class TestSetupPipeline:
+    def test_file_hash(self, tmp_path):
+        write_file(tmp_path / "a.txt", "lightdock")
+        write_file(tmp_path / "b.txt", "lightdock")
+        write_file(tmp_path / "c.txt", "lightdock!")
+
+        assert file_hash(tmp_path / "a.txt") == file_hash(tmp_path / "b.txt")
+        assert file_hash(tmp_path / "a.txt") != file_hash(tmp_path / "c.txt")
+
+    def test_run_with_dependencies(self, tmp_path):
+        os.chdir(tmp_path)
+        pipeline = SetupPipeline()
+        pipeline.add_stage(SetupStage("a", square, args=(3,), parallel=True))
+        pipeline.add_stage(SetupStage("b", square, args=(4,), parallel=True))
+        pipeline.add_stage(
+            SetupStage(
+                "c",
+                lambda: pipeline.results["a"] + pipeline.results["b"],
+                depends_on=["a", "b"],
+            )
+        )
+
+        results = pipeline.run()
+
+        assert {"a": 9, "b": 16, "c": 25} == results
+        assert Path(tmp_path / ".setup_cache.json").is_file()
+
+    def test_unknown_dependency(self, tmp_path):
+        pipeline = SetupPipeline(tmp_path / "cache.json")
+
+        with pytest.raises(SetupError):
+            pipeline.add_stage(SetupStage("a", square, args=(3,), depends_on=["b"]))
+
+    def test_cached_stages(self, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        input_file = tmp_path / "input.txt"
+        output_file = tmp_path / "output.txt"
+        write_file(input_file, "1")
+        calls = []
+
+        def create_pipeline(parameter):
+            pipeline = SetupPipeline(cache_file)
+            pipeline.add_stage(
+                SetupStage(
+                    "first",
+                    lambda: calls.append("first") or write_file(output_file, "first"),
+                    parameters={"value": 1},
+                    input_files=[input_file],
+                    outputs=[output_file],
+                )
+            )
+            pipeline.add_stage(
+                SetupStage(
+                    "second",
+                    lambda: calls.append("second") or parameter,
+                    parameters={"value": parameter},
+                    depends_on=["first"],
+                )
+            )
+            return pipeline
+
+        assert {"first": "first", "second": 10} == create_pipeline(10).run()
+        assert ["first", "second"] == calls
+
+        # Only the stage with a different parameter is executed again
+        assert {"first": "first", "second": 20} == create_pipeline(20).run()
+        assert ["first", "second", "second"] == calls
+
+        # Changing the content of an input file invalidates the stage and its dependencies
+        write_file(input_file, "2")
+        create_pipeline(20).run()
+        assert ["first", "second", "second", "first", "second"] == calls
+
+        # Missing outputs are calculated again
+        output_file.unlink()
+        create_pipeline(20).run()
+        assert ["first", "second", "second", "first", "second", "first"] == calls
+        assert output_file.is_file()
@@ -11,6 +11,8 @@ from lightdock.prep.poses import (
     estimate_membrane,
     upper_layer,
     populate_poses,
+    populate_poses_batch,
+    create_file_from_poses,
     calculate_initial_poses,
     apply_restraints,
     mirror_vector,
@@ -496,6 +498,87 @@ class TestPoses:
         # We generate the expected poses
         assert np.allclose(expected, poses)
 
+    def test_populate_poses_batch(self):
+        to_generate = 500
+        center = [5.0, -5.0, 10.0]
+        radius = 10.0
+        rec_translation = [0.0, 0.0, 0.0]
+        lig_translation = [-15.0, -15.0, -15.0]
+
+        poses = populate_poses_batch(
+            to_generate,
+            center,
+            radius,
+            np.random.default_rng(1984),
+            rec_translation,
+            lig_translation,
+            np.random.default_rng(1984),
+            rec_nm=5,
+            lig_nm=3,
+        )
+        same_poses = populate_poses_batch(
+            to_generate,
+            center,
+            radius,
+            np.random.default_rng(1984),
+            rec_translation,
+            lig_translation,
+            np.random.default_rng(1984),
+            rec_nm=5,
+            lig_nm=3,
+        )
+
+        assert poses.shape == (to_generate, 7 + 5 + 3)
+        assert np.array_equal(poses, same_poses)
+        # Translations within the swarm sphere
+        assert np.all(np.linalg.norm(poses[:, :3] - center, axis=1) <= radius)
+        # Unit quaternions
+        assert np.allclose(np.linalg.norm(poses[:, 3:7], axis=1), 1.0)
+        # Different extents per pose
+        assert len(np.unique(poses[:, 7])) == to_generate
+
+    def test_populate_poses_batch_both_restraints(self):
+        to_generate = 10
+        center = [15.0, 15.0, 15.0]
+        radius = 10.0
+        rec_translation = [0.0, 0.0, 0.0]
+        lig_translation = [-15.0, -15.0, -15.0]
+        receptor_restraints = [Residue.dummy(1.0, 1.0, 1.0)]
+        ligand_restraints = [Residue.dummy(16.0, 16.0, 16.0)]
+
+        poses = populate_poses_batch(
+            to_generate,
+            center,
+            radius,
+            np.random.default_rng(1984),
+            rec_translation,
+            lig_translation,
+            receptor_restraints=receptor_restraints,
+            ligand_restraints=ligand_restraints,
+            ligand_diameter=10.0,
+        )
+
+        assert poses.shape == (to_generate, 7)
+        for pose in poses:
+            # Ligand restraint points to the receptor restraint
+            q = Quaternion(pose[3], pose[4], pose[5], pose[6])
+            expected = quaternion_from_vectors(
+                np.array([1.0, 1.0, 1.0]), np.array([1.0, 1.0, 1.0]) - pose[:3]
+            )
+            assert q == expected
+
+    def test_create_file_from_poses(self, tmp_path):
+        poses = [
+            [1.0, -2.5, 3.123456789123, 1.0, 0.0, 0.0, 0.0],
+            [-0.0000000001, 10.0, 20.0, 0.5, -0.5, 0.5, -0.5],
+        ]
+
+        create_file_from_poses(tmp_path / "poses.dat", poses)
+
+        with open(tmp_path / "poses.dat") as input_file:
+            lines = input_file.read().splitlines()
+        assert [" ".join("{:.9f}".format(c) for c in pose) for pose in poses] == lines
+
     def test_calculate_initial_poses(self, tmp_path):
 
         file_name = self.golden_data_path / "3p0g" / "receptor_membrane.pdb"
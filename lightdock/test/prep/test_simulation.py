@@ -5,7 +5,7 @@ import os
 import shutil
 from pathlib import Path
 from glob import glob
-from lightdock.error.lightdock_errors import LightDockError
+from lightdock.error.lightdock_errors import LightDockError, StructureError
 from lightdock.prep.simulation import (
     parse_restraints_file,
     get_restraints,
@@ -137,6 +137,7 @@ class TestSimulation:
             "anm_rec": 10,
             "anm_rec_rmsd": 0.5,
             "anm_seed": 324324,
+            "batch_poses": False,
             "dense_sampling": False,
             "fixed_distance": 0.0,
             "flip": False,
@@ -224,13 +225,25 @@ class TestSimulation:
         os.chdir(self.golden_data_path)
 
         structure = read_input_structure(
-            "pdb_files.list",
+            "pdb_ensemble.list",
             ignore_oxt=True,
             ignore_hydrogens=False,
             verbose_parser=False,
         )
 
         assert structure.num_structures == 2
+        assert structure.atom_coordinates.shape() == (2, 415, 3)
+
+    def test_read_multiple_input_structure_different_atoms(self):
+        os.chdir(self.golden_data_path)
+
+        with pytest.raises(StructureError):
+            read_input_structure(
+                "pdb_files.list",
+                ignore_oxt=True,
+                ignore_hydrogens=False,
+                verbose_parser=False,
+            )
 
     def test_load_starting_positions(self):
         working_path = self.golden_data_path / "load_starting_positions" / "ok"
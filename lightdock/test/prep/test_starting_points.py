@@ -3,7 +3,14 @@
 import pytest
 import filecmp
 from pathlib import Path
-from lightdock.prep.starting_points import points_on_sphere, calculate_surface_points
+import numpy as np
+from lightdock.prep.starting_points import (
+    points_on_sphere,
+    calculate_surface_points,
+    equidistant_points,
+    equidistant_segments,
+    max_consecutive_true,
+)
 from lightdock.structure.complex import Complex
 from lightdock.pdbutil.PDBIO import parse_complex_from_file, create_pdb_from_points
 
@@ -27,6 +34,27 @@ class TestStartingPoints:
             assert correct[1] == pytest.approx(point[1])
             assert correct[2] == pytest.approx(point[2])
 
+    def test_equidistant_segments(self):
+        p1 = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [5.0, 5.0, 5.0]])
+        p2 = np.array([[3.0, 0.0, 0.0], [-1.0, 0.5, 7.3], [5.0, 5.0, 5.0]])
+        parts = np.array([3, 7, 0])
+
+        points, segment_ids = equidistant_segments(p1, p2, parts)
+
+        expected = np.concatenate(
+            [equidistant_points(a, b, n) for a, b, n in zip(p1, p2, parts)]
+        )
+        assert np.array_equal(expected, points)
+        assert [0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 2] == segment_ids.tolist()
+
+    def test_max_consecutive_true(self):
+        values = np.array([1, 1, 0, 1, 1, 1, 1, 0, 1, 1, 0, 0], dtype=bool)
+        segment_ids = np.array([0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2])
+
+        max_runs = max_consecutive_true(values, segment_ids, 4)
+
+        assert [2, 3, 0, 0] == max_runs.tolist()
+
     def test_create_pdb_from_points(self, tmp_path):
         points = points_on_sphere(100)
         create_pdb_from_points(tmp_path / "points.pdb", points)
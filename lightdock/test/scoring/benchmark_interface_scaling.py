@@ -0,0 +1,122 @@
+"""Benchmark of the cell-list scoring kernels against the size of the interface.
+
+The ligand is moved away from the receptor along the line joining their centers, so the
+number of atoms of each partner stays fixed while the number of atom pairs within the
+cutoff of the kernel shrinks. The time per call of the VdW, SD and DNA kernels should
+follow the number of pairs, not the number of atoms.
+
+Run it from the root of the repository:
+
+    python -m lightdock.test.scoring.benchmark_interface_scaling
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+import numpy as np
+from scipy.spatial import cKDTree
+from lightdock.pdbutil.PDBIO import parse_complex_from_file
+from lightdock.structure.complex import Complex
+from lightdock.scoring.vdw.driver import VdW, VdWAdapter
+from lightdock.scoring.sd.driver import SD, SDAdapter
+from lightdock.scoring.dna.driver import DNA, DNAAdapter
+
+
+golden_data_path = Path(__file__).absolute().parent / "golden_data"
+
+# Name, scoring function, adapter, receptor, ligand and largest cutoff of the kernel
+kernels = [
+    ("vdw", VdW, VdWAdapter, "1AY7_rec.pdb", "1AY7_lig.pdb", 10.0),
+    ("sd", SD, SDAdapter, "1AY7_rec.pdb", "1AY7_lig.pdb", 9.0),
+    ("dna", DNA, DNAAdapter, "3mfk_homodimer.pdb", "3mfk_dna.pdb", 30.0),
+]
+
+
+def read_complex(file_name):
+    atoms, _, chains = parse_complex_from_file(golden_data_path / file_name)
+    return Complex(chains, atoms, structure_file_name=golden_data_path / file_name)
+
+
+def benchmark_kernel(
+    scoring_class, adapter_class, receptor, ligand, cutoff, shifts, number
+):
+    """Time per call in ms and number of pairs within cutoff for each shift"""
+    scoring_function = scoring_class()
+    adapter = adapter_class(read_complex(receptor), read_complex(ligand))
+    receptor_model = adapter.receptor_model
+    ligand_model = adapter.ligand_model
+    receptor_coordinates = receptor_model.coordinates[0]
+    receptor_tree = cKDTree(receptor_coordinates.coordinates)
+    direction = (
+        ligand_model.coordinates[0].coordinates.mean(axis=0)
+        - receptor_coordinates.coordinates.mean(axis=0)
+    )
+    direction /= np.linalg.norm(direction)
+
+    results = []
+    for shift in shifts:
+        ligand_coordinates = ligand_model.coordinates[0].clone()
+        ligand_coordinates.translate(direction * shift)
+        num_pairs = receptor_tree.count_neighbors(
+            cKDTree(ligand_coordinates.coordinates), cutoff
+        )
+        elapsed = min(
+            timeit.repeat(
+                lambda: scoring_function(
+                    receptor_model,
+                    receptor_coordinates,
+                    ligand_model,
+                    ligand_coordinates,
+                ),
+                number=number,
+                repeat=3,
+            )
+        )
+        results.append((shift, int(num_pairs), elapsed / number * 1e3))
+    return len(receptor_coordinates), len(ligand_model.coordinates[0]), results
+
+
+def parse_command_line():
+    parser = argparse.ArgumentParser(prog="benchmark_interface_scaling")
+    parser.add_argument(
+        "--kernels",
+        nargs="+",
+        choices=[kernel[0] for kernel in kernels],
+        default=[kernel[0] for kernel in kernels],
+        help="Kernels to benchmark",
+    )
+    parser.add_argument(
+        "--shifts",
+        nargs="+",
+        type=float,
+        default=[0.0, 5.0, 10.0, 15.0, 20.0, 30.0, 45.0, 60.0],
+        help="Distances in A the ligand is moved away from the receptor",
+    )
+    parser.add_argument(
+        "--number", type=int, default=50, help="Calls of the kernel per measure"
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_command_line()
+    for name, scoring_class, adapter_class, receptor, ligand, cutoff in kernels:
+        if name not in args.kernels:
+            continue
+        rec_len, lig_len, results = benchmark_kernel(
+            scoring_class,
+            adapter_class,
+            receptor,
+            ligand,
+            cutoff,
+            args.shifts,
+            args.number,
+        )
+        print(
+            "%s: %d receptor atoms, %d ligand atoms, pairs within %.1f A"
+            % (name, rec_len, lig_len, cutoff)
+        )
+        print("%10s %12s %12s" % ("Shift (A)", "Pairs", "ms/call"))
+        for shift, num_pairs, time_per_call in results:
+            print("%10.1f %12d %12.3f" % (shift, num_pairs, time_per_call))
+        print()
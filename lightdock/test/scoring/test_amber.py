@@ -0,0 +1,58 @@
+"""Tests for the shared AMBER94 parameters"""
+
+import numpy as np
+import pytest
+from lightdock.scoring.amber import AmberParameters, get_amber_parameters
+from lightdock.structure.atom import Atom
+
+
+class TestAmberParameters:
+    def setup_class(self):
+        self.amber = get_amber_parameters()
+
+    def test_shared(self):
+        assert get_amber_parameters() is self.amber
+
+    def test_lookup(self):
+        assert "ALA-CA" in self.amber
+        assert "ALA-XX" not in self.amber
+        assert self.amber.amber_type("ALA-CA") == "CT"
+        assert self.amber.charge("ALA-CA") == pytest.approx(0.0337)
+        assert self.amber.amber_type("DT-O1P") == "O2"
+
+    def test_parameters(self):
+        indexes = self.amber.get_indexes(["ALA-CA", "ALA-H", "ALA-O"])
+        atom_types = self.amber.atom_types[indexes]
+
+        assert np.allclose(self.amber.charges[indexes], [0.0337, 0.2719, -0.5679])
+        assert np.allclose(self.amber.masses[atom_types], [12.01, 1.008, 16.0])
+        assert np.allclose(self.amber.vdw_energy[atom_types], [0.1094, 0.0157, 0.21])
+        assert np.allclose(self.amber.vdw_radii[atom_types], [1.908, 0.6, 1.6612])
+
+    def test_unknown_atom(self):
+        with pytest.raises(KeyError):
+            self.amber.get_indexes(["ALA-CA", "ALA-XX"])
+
+    def test_assign(self):
+        atoms = [
+            Atom(atom_name="CA", residue_name="ALA"),
+            Atom(atom_name="O", residue_name="ALA"),
+        ]
+        atom_types = self.amber.assign(atoms, self.amber.get_indexes(["ALA-CA", "ALA-O"]))
+
+        assert [atom.amber_type for atom in atoms] == ["CT", "O"]
+        assert [atom.mass for atom in atoms] == pytest.approx([12.01, 16.0])
+        assert [self.amber.type_names[t] for t in atom_types] == ["CT", "O"]
+
+    def test_from_files(self, tmp_path):
+        atoms_file = tmp_path / "atoms.dat"
+        types_file = tmp_path / "types.dat"
+        atoms_file.write_text("# comment\nXXX-A  T1  0.5\nXXX-B  T2  -0.5\n")
+        types_file.write_text("T1 1.0 0.1 1.5\nT2 2.0 0.2 2.5\n")
+
+        amber = AmberParameters.from_files(atoms_file, types_file)
+
+        assert len(amber) == 2
+        assert amber.amber_type("XXX-B") == "T2"
+        assert np.array_equal(amber.atom_types, [0, 1])
+        assert np.array_equal(amber.vdw_radii, [1.5, 2.5])
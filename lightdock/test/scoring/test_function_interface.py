@@ -1,7 +1,9 @@
 """Tests for Scoring Function interface classes"""
 
 import pytest
+import numpy as np
 from lightdock.scoring.functions import ScoringFunction, ModelAdapter
+from lightdock.structure.model import CompiledRestraints
 
 
 class TestScoringFunction:
@@ -11,6 +13,29 @@ class TestScoringFunction:
             sf(None, None, None, None)
             assert False
 
+    def test_restraints_satisfied(self):
+        restraints = {"A.ALA.1": [0, 1], "A.HIS.2": [2, 3], "A.GLY.3": [7]}
+
+        assert ScoringFunction.restraints_satisfied(restraints, {1, 5}) == 1 / 3
+        assert ScoringFunction.restraints_satisfied(restraints, {1, 2, 7}) == 1.0
+        assert ScoringFunction.restraints_satisfied(restraints, set()) == 0.0
+        assert ScoringFunction.restraints_satisfied({}, {1, 2}) == 0.0
+
+    def test_compiled_restraints_satisfied(self):
+        restraints = CompiledRestraints(
+            {"A.ALA.1": [0, 1], "A.HIS.2": [2, 3], "A.GLY.3": [7]}
+        )
+
+        assert len(restraints) == 3
+        assert ScoringFunction.restraints_satisfied(
+            restraints, np.array([3, 9, 100])
+        ) == pytest.approx(1 / 3)
+        assert ScoringFunction.restraints_satisfied(
+            restraints, np.array([0, 1, 3, 7])
+        ) == 1.0
+        assert ScoringFunction.restraints_satisfied(restraints, []) == 0.0
+        assert ScoringFunction.restraints_satisfied(CompiledRestraints(), [1]) == 0.0
+
 
 class TestModelAdapter:
     def test_create_model_adapter_interface(self):
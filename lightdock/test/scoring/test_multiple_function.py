@@ -0,0 +1,115 @@
+"""Tests for multiple scoring functions module"""
+
+import pytest
+from pathlib import Path
+from lightdock.scoring.multiple import CompositeScoringFunction
+from lightdock.scoring.pisa.driver import PISA, PISAAdapter
+from lightdock.scoring.mj3h.driver import MJ3h, MJ3hAdapter
+from lightdock.scoring.tobia1.driver import TOBIA1, TOBIA1Adapter
+from lightdock.scoring.tobia2.driver import TOBIA2, TOBIA2Adapter
+from lightdock.scoring.tobibahar.driver import TOBIBAHAR, TOBIBAHARAdapter
+from lightdock.scoring.tobisc.driver import TOBISC, TOBISCAdapter
+from lightdock.scoring.functions import ScoringFunction
+from lightdock.pdbutil.PDBIO import parse_complex_from_file
+from lightdock.structure.complex import Complex
+
+
+class TestCompositeScoringFunction:
+    def setup_class(self):
+        self.path = Path(__file__).absolute().parent
+        self.golden_data_path = self.path / "golden_data"
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPErec.pdb"
+        )
+        self.receptor = Complex(chains, atoms)
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPElig.pdb"
+        )
+        self.ligand = Complex(chains, atoms)
+
+    def test_group(self):
+        adapters = [
+            PISAAdapter(self.receptor, self.ligand),
+            MJ3hAdapter(self.receptor, self.ligand),
+            PISAAdapter(self.receptor, self.ligand),
+        ]
+        functions = [PISA(1.0), MJ3h(1.0), PISA(0.5)]
+
+        assert CompositeScoringFunction.share_coordinates(adapters[0], adapters[2])
+        assert not CompositeScoringFunction.share_coordinates(adapters[0], adapters[1])
+
+        grouped_functions, grouped_adapters = CompositeScoringFunction.group(
+            functions, adapters
+        )
+
+        assert len(grouped_functions) == 2
+        assert grouped_adapters == adapters[:2]
+        assert isinstance(grouped_functions[0], CompositeScoringFunction)
+        assert grouped_functions[1] is functions[1]
+
+        composite = grouped_functions[0]
+        adapter = grouped_adapters[0]
+        energy = composite(
+            adapter.receptor_model,
+            adapter.receptor_model.coordinates[0],
+            adapter.ligand_model,
+            adapter.ligand_model.coordinates[0],
+        )
+        assert energy == pytest.approx(-0.4346 * 1.5, abs=1e-4)
+
+    def test_shared_pairs(self, monkeypatch):
+        get_pairs = ScoringFunction.get_pairs
+        calculated = []
+
+        def count_pairs(receptor_coordinates, ligand_coordinates, cutoff, pairs=None):
+            if pairs is None:
+                calculated.append(cutoff)
+            return get_pairs(receptor_coordinates, ligand_coordinates, cutoff, pairs)
+
+        for functions, adapters, cutoff in [
+            (
+                [TOBIA1(1.0), TOBIA2(0.5)],
+                [
+                    TOBIA1Adapter(self.receptor, self.ligand),
+                    TOBIA2Adapter(self.receptor, self.ligand),
+                ],
+                6.0,
+            ),
+            (
+                [TOBISC(1.0), TOBIBAHAR(0.5)],
+                [
+                    TOBISCAdapter(self.receptor, self.ligand),
+                    TOBIBAHARAdapter(self.receptor, self.ligand),
+                ],
+                8.0,
+            ),
+        ]:
+            expected = sum(
+                function(
+                    adapter.receptor_model,
+                    adapter.receptor_model.coordinates[0],
+                    adapter.ligand_model,
+                    adapter.ligand_model.coordinates[0],
+                )
+                for function, adapter in zip(functions, adapters)
+            )
+            grouped_functions, grouped_adapters = CompositeScoringFunction.group(
+                functions, adapters
+            )
+            assert len(grouped_functions) == 1
+            composite = grouped_functions[0]
+            adapter = grouped_adapters[0]
+            assert composite.shared_pair_cutoff == cutoff
+
+            calculated.clear()
+            monkeypatch.setattr(ScoringFunction, "get_pairs", staticmethod(count_pairs))
+            energy = composite(
+                adapter.receptor_model,
+                adapter.receptor_model.coordinates[0],
+                adapter.ligand_model,
+                adapter.ligand_model.coordinates[0],
+            )
+            monkeypatch.undo()
+
+            assert calculated == [cutoff]
+            assert energy == pytest.approx(expected)
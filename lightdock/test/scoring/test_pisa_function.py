@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from lightdock.scoring.pisa.driver import PISAPotential, PISA, PISAAdapter
+from lightdock.scoring.pisa.cython.cpisa import get_distance_to_bin
 from lightdock.pdbutil.PDBIO import parse_complex_from_file
 from lightdock.structure.complex import Complex
 
@@ -11,6 +12,16 @@ class TestPISAPotential:
     def test_create_PISAPotential_interface(self):
         potential = PISAPotential()
         assert potential is not None
+        assert potential.pisa_energy.shape == (32, 32, 3)
+
+    def test_get_distance_to_bin(self):
+        assert get_distance_to_bin(1.9) == -1
+        assert get_distance_to_bin(2.0) == 0
+        assert get_distance_to_bin(3.5) == 1
+        assert get_distance_to_bin(4.2) == 2
+        assert get_distance_to_bin(5.0) == 3
+        assert get_distance_to_bin(7.9) == 4
+        assert get_distance_to_bin(8.0) == -1
 
 
 class TestPISA:
@@ -0,0 +1,97 @@
+"""Tests for the binary cache of potential tables"""
+
+import os
+import numpy as np
+import pytest
+import lightdock.scoring.potentials as potentials
+from lightdock.scoring.potentials import load_potentials, get_cache_files
+from lightdock.scoring.pisa.driver import PISAPotential
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, data_file_name):
+        self.calls += 1
+        return np.loadtxt(data_file_name).reshape(2, 3)
+
+
+class TestPotentials:
+    def setup_method(self):
+        self.parser = CountingParser()
+
+    def test_load_and_cache(self, tmp_path):
+        data_file = tmp_path / "table.dat"
+        data_file.write_text("\n".join(str(v) for v in range(6)))
+
+        table = load_potentials(data_file, self.parser)
+        cached = load_potentials(data_file, self.parser)
+
+        assert self.parser.calls == 1
+        assert (tmp_path / f"table.dat.v{potentials.POTENTIALS_VERSION}.npy").is_file()
+        assert isinstance(cached, np.memmap)
+        assert not cached.flags.writeable
+        assert np.array_equal(table, np.arange(6.0).reshape(2, 3))
+        assert np.array_equal(cached, table)
+
+    def test_outdated_cache(self, tmp_path):
+        data_file = tmp_path / "table.dat"
+        data_file.write_text("\n".join(str(v) for v in range(6)))
+        load_potentials(data_file, self.parser)
+        cache_file = get_cache_files(data_file)[0]
+        stat = cache_file.stat()
+        os.utime(cache_file, (stat.st_atime - 10, stat.st_mtime - 10))
+
+        data_file.write_text("\n".join(str(v) for v in range(6, 12)))
+        table = load_potentials(data_file, self.parser)
+
+        assert self.parser.calls == 2
+        assert np.array_equal(table, np.arange(6.0, 12.0).reshape(2, 3))
+
+    def test_prebuilt_cache(self, tmp_path):
+        data_file = tmp_path / "table.dat"
+        np.save(get_cache_files(data_file)[0], np.ones((2, 3)))
+
+        table = load_potentials(data_file, self.parser)
+
+        assert self.parser.calls == 0
+        assert np.array_equal(table, np.ones((2, 3)))
+
+    def test_not_writable_folder(self, tmp_path, monkeypatch):
+        data_file = tmp_path / "table.dat"
+        data_file.write_text("\n".join(str(v) for v in range(6)))
+        monkeypatch.setattr(
+            potentials,
+            "get_cache_files",
+            lambda _: [tmp_path / "missing" / "file.npy", tmp_path / "file.npy"],
+        )
+        (tmp_path / "missing").write_text("not a folder")
+
+        table = load_potentials(data_file, self.parser)
+
+        assert isinstance(table, np.memmap)
+        assert (tmp_path / "file.npy").is_file()
+
+    def test_not_cached(self, tmp_path, monkeypatch):
+        data_file = tmp_path / "table.dat"
+        data_file.write_text("\n".join(str(v) for v in range(6)))
+        (tmp_path / "missing").write_text("not a folder")
+        monkeypatch.setattr(
+            potentials, "get_cache_files", lambda _: [tmp_path / "missing" / "file.npy"]
+        )
+
+        table = load_potentials(data_file, self.parser)
+
+        assert not isinstance(table, np.memmap)
+        assert np.array_equal(table, np.arange(6.0).reshape(2, 3))
+
+    def test_scoring_potential(self):
+        potential = PISAPotential()
+        data_file = potentials.Path(potentials.__file__).parent / "pisa/data/pisa.params"
+
+        assert np.array_equal(
+            potential.pisa_energy, PISAPotential._read_parameters(data_file)
+        )
+        with pytest.raises(ValueError):
+            potential.pisa_energy[0, 0, 0] = 1.0
@@ -1,10 +1,15 @@
 """Tests for CPyDock scoring function module"""
 
 import pytest
+import numpy as np
 from pathlib import Path
 from lightdock.scoring.cpydock.driver import CPyDock, CPyDockAdapter
+from lightdock.scoring.cpydock.energy.grid import CPyDockGrid
+import lightdock.scoring.cpydock.energy.c.cpydock as cpydock
+import lightdock.scoring.cpydock.energy.parameters as parameters
 from lightdock.pdbutil.PDBIO import parse_complex_from_file
 from lightdock.structure.complex import Complex
+from lightdock.error.lightdock_errors import NotSupportedInScoringError
 
 
 class TestPyDock:
@@ -13,7 +18,7 @@ class TestPyDock:
         self.golden_data_path = self.path / "golden_data"
         self.pydock = CPyDock()
 
-    def test_calculate_PyDock_1AY7(self):
+    def get_adapter(self):
         atoms, _, chains = parse_complex_from_file(
             self.golden_data_path / "1AY7_rec.pdb"
         )
@@ -30,8 +35,11 @@ class TestPyDock:
             atoms,
             structure_file_name=(self.golden_data_path / "1AY7_lig.pdb"),
         )
-        adapter = CPyDockAdapter(receptor, ligand)
-        assert -15.923994756 == pytest.approx(
+        return CPyDockAdapter(receptor, ligand)
+
+    def test_calculate_PyDock_1AY7(self):
+        adapter = self.get_adapter()
+        assert -16.060513185 == pytest.approx(
             self.pydock(
                 adapter.receptor_model,
                 adapter.receptor_model.coordinates[0],
@@ -39,3 +47,77 @@ class TestPyDock:
                 adapter.ligand_model.coordinates[0],
             )
         )
+
+    def test_calculate_PyDock_1AY7_grid(self, tmp_path):
+        adapter = self.get_adapter()
+        receptor = adapter.receptor_model
+        ligand = adapter.ligand_model
+        pydock_grid = CPyDock(
+            grid_spacing=parameters.default_grid_spacing, grid_cache_folder=tmp_path
+        )
+
+        assert -16.060513185 == pytest.approx(
+            pydock_grid(
+                receptor, receptor.coordinates[0], ligand, ligand.coordinates[0]
+            ),
+            rel=1e-3,
+        )
+        assert len(list(tmp_path.glob("cpydock_grid_*.npz"))) == 1
+        assert not pydock_grid.anm_rec_support
+
+        # Grid is loaded from the cache
+        grid = CPyDockGrid.from_receptor(
+            receptor.coordinates[0], receptor, parameters.default_grid_spacing, tmp_path
+        )
+        assert np.allclose(
+            grid.values, pydock_grid.get_grid(receptor, receptor.coordinates[0]).values
+        )
+
+        for translation in [
+            [2.0, -1.0, 1.5],
+            [-1.5, 2.0, 0.5],
+            [1.0, 1.0, -2.0],
+            [0.0, -3.0, 1.0],
+            [4.0, 2.0, -1.0],
+        ]:
+            ligand_coordinates = ligand.coordinates[0].clone()
+            ligand_coordinates.translate(np.array(translation))
+            exact = cpydock.calculate_energy(
+                receptor.coordinates[0],
+                ligand_coordinates,
+                receptor.charges,
+                ligand.charges,
+                receptor.vdw_energy,
+                ligand.vdw_energy,
+                receptor.vdw_radii,
+                ligand.vdw_radii,
+                receptor.hydrogens,
+                ligand.hydrogens,
+                receptor.sasa,
+                ligand.sasa,
+                receptor.des_energy,
+                ligand.des_energy,
+                3.9,
+            )
+            approximated = grid.calculate_energy(
+                receptor, ligand, ligand_coordinates, 3.9
+            )
+
+            assert approximated[0] == pytest.approx(exact[0], rel=2e-2)
+            assert approximated[1] == pytest.approx(exact[1])
+            assert approximated[2] == pytest.approx(exact[2])
+            assert approximated[3] == pytest.approx(exact[3])
+            assert set(approximated[4]) == set(exact[4])
+            assert set(approximated[5]) == set(exact[5])
+
+    def test_PyDock_grid_rigid_receptor(self, tmp_path):
+        adapter = self.get_adapter()
+        receptor = adapter.receptor_model
+        pydock_grid = CPyDock(grid_spacing=2.0, grid_cache_folder=tmp_path)
+
+        grid = pydock_grid.get_grid(receptor, receptor.coordinates[0])
+
+        assert pydock_grid.get_grid(receptor, receptor.coordinates[0]) is grid
+        # A receptor moved by its normal modes is a new conformation
+        with pytest.raises(NotSupportedInScoringError):
+            pydock_grid.get_grid(receptor, receptor.coordinates[0].clone())
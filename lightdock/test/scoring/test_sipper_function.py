@@ -0,0 +1,59 @@
+"""Tests for SIPPER scoring function module"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+from lightdock.scoring.sipper.driver import SIPPER, SIPPERAdapter
+from lightdock.pdbutil.PDBIO import parse_complex_from_file
+from lightdock.structure.complex import Complex
+
+
+class TestSIPPER:
+    def setup_class(self):
+        self.path = Path(__file__).absolute().parent
+        self.golden_data_path = self.path / "golden_data"
+        self.sipper = SIPPER()
+
+    def get_adapter(self, name):
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / f"{name}rec.pdb"
+        )
+        receptor = Complex(chains, atoms)
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / f"{name}lig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        return SIPPERAdapter(receptor, ligand)
+
+    def test_create_adapter(self):
+        adapter = self.get_adapter("1PPE")
+
+        assert adapter.receptor_model.indexes.dtype == np.intc
+        assert adapter.receptor_model.atoms_per_residue.dtype == np.intc
+        assert adapter.receptor_model.atoms_per_residue.sum() == len(
+            adapter.receptor_model.coordinates[0]
+        )
+
+    def test_calculate_SIPPER_1PPE(self):
+        adapter = self.get_adapter("1PPE")
+        assert -24.2231 == pytest.approx(
+            self.sipper(
+                adapter.receptor_model,
+                adapter.receptor_model.coordinates[0],
+                adapter.ligand_model,
+                adapter.ligand_model.coordinates[0],
+            ),
+            abs=1e-4,
+        )
+
+    def test_calculate_SIPPER_1EAW(self):
+        adapter = self.get_adapter("1EAW")
+        assert 10.9933 == pytest.approx(
+            self.sipper(
+                adapter.receptor_model,
+                adapter.receptor_model.coordinates[0],
+                adapter.ligand_model,
+                adapter.ligand_model.coordinates[0],
+            ),
+            abs=1e-4,
+        )
@@ -1,6 +1,7 @@
 """Tests for TOBIA1 scoring function module"""
 
 import pytest
+import numpy as np
 from pathlib import Path
 from lightdock.scoring.tobia1.driver import TOBIA1Potential, TOBIA1, TOBIA1Adapter
 from lightdock.pdbutil.PDBIO import parse_complex_from_file
@@ -29,6 +30,25 @@ class TestTOBIA1:
         self.golden_data_path = self.path / "golden_data"
         self.tobia1 = TOBIA1()
 
+    def test_create_adapter(self):
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPErec.pdb"
+        )
+        receptor = Complex(chains, atoms)
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1PPElig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        adapter = TOBIA1Adapter(receptor, ligand, ["A.ILE.16"], None)
+        model = adapter.receptor_model
+
+        assert len(model.atom_types) == len(receptor.atoms)
+        assert np.allclose(
+            model.get_residue_centers(model.coordinates[0].coordinates),
+            [residue.get_central_coordinate() for residue in receptor.residues],
+        )
+        assert model.restraints == {"A.ILE.16": [0]}
+
     def test_calculate_TOBIA1_1PPE(self):
         atoms, _, chains = parse_complex_from_file(
             self.golden_data_path / "1PPErec.pdb"
@@ -0,0 +1,44 @@
+"""Tests for VdW scoring function module"""
+
+import pytest
+from pathlib import Path
+from lightdock.scoring.vdw.driver import VdW, VdWAdapter
+from lightdock.pdbutil.PDBIO import parse_complex_from_file
+from lightdock.structure.complex import Complex
+
+
+class TestVdW:
+    def setup_class(self):
+        self.path = Path(__file__).absolute().parent
+        self.golden_data_path = self.path / "golden_data"
+        self.vdw = VdW()
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1AY7_rec.pdb"
+        )
+        receptor = Complex(chains, atoms)
+        atoms, _, chains = parse_complex_from_file(
+            self.golden_data_path / "1AY7_lig.pdb"
+        )
+        ligand = Complex(chains, atoms)
+        self.adapter = VdWAdapter(receptor, ligand)
+
+    def test_calculate_VdW_1AY7(self):
+        assert -91.11308260 == pytest.approx(
+            self.vdw(
+                self.adapter.receptor_model,
+                self.adapter.receptor_model.coordinates[0],
+                self.adapter.ligand_model,
+                self.adapter.ligand_model.coordinates[0],
+            )
+        )
+
+    def test_calculate_VdW_no_contacts(self):
+        ligand_coordinates = self.adapter.ligand_model.coordinates[0].clone()
+        ligand_coordinates.translate([200.0, 0.0, 0.0])
+
+        assert 0.0 == self.vdw(
+            self.adapter.receptor_model,
+            self.adapter.receptor_model.coordinates[0],
+            self.adapter.ligand_model,
+            ligand_coordinates,
+        )
@@ -0,0 +1,97 @@
+"""Tests for SpacePoints and Ensemble classes"""
+
+import numpy as np
+from lightdock.mathutil.cython.quaternion import Quaternion
+from lightdock.structure.space import SpacePoints, Ensemble
+from lightdock.structure.model import DockingModel
+
+
+class TestEnsemble:
+    def setup_class(self):
+        self.coordinates = [
+            [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]],
+            [[1.5, 1.0, 1.0], [2.5, 2.0, 2.0]],
+            [[3.0, 1.0, 1.0], [4.0, 2.0, 2.0]],
+        ]
+
+    def test_create(self):
+        ensemble = Ensemble(self.coordinates)
+
+        assert len(ensemble) == 3
+        assert ensemble.shape() == (3, 2, 3)
+        assert not ensemble.is_mapped
+        assert np.allclose(ensemble, self.coordinates)
+
+    def test_from_points(self):
+        ensemble = Ensemble.from_points(
+            [SpacePoints(coordinates) for coordinates in self.coordinates]
+        )
+
+        assert ensemble == Ensemble(self.coordinates)
+
+    def test_empty(self):
+        ensemble = Ensemble([[]])
+
+        assert ensemble.shape() == (1, 0, 3)
+
+    def test_structures_are_views(self):
+        ensemble = Ensemble(self.coordinates)
+
+        structure = ensemble[1]
+        structure.translate([1.0, 0.0, 0.0])
+
+        assert np.shares_memory(structure.coordinates, ensemble.coordinates)
+        assert np.allclose(ensemble[1].coordinates, [[2.5, 1, 1], [3.5, 2, 2]])
+        assert [len(structure) for structure in ensemble] == [2, 2, 2]
+
+    def test_set_structure(self):
+        ensemble = Ensemble(self.coordinates)
+
+        ensemble[0] = SpacePoints([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+
+        assert np.allclose(ensemble[0].coordinates, [[0, 0, 0], [1, 1, 1]])
+
+    def test_copy(self):
+        ensemble = Ensemble(self.coordinates)
+
+        copy = ensemble.copy()
+        copy.translate([1.0, 1.0, 1.0])
+
+        assert not np.shares_memory(copy.coordinates, ensemble.coordinates)
+        assert ensemble == Ensemble(self.coordinates)
+        assert ensemble != copy
+
+    def test_rotate(self):
+        ensemble = Ensemble(self.coordinates)
+        q = Quaternion(0.707106781, 0.0, 0.707106781, 0.0)
+
+        ensemble.rotate(q)
+
+        for structure, coordinates in zip(ensemble, self.coordinates):
+            expected = SpacePoints(coordinates)
+            expected.rotate(q)
+            assert expected == structure
+
+    def test_memory_mapped(self):
+        ensemble = Ensemble(self.coordinates, mmap_size=0)
+
+        assert ensemble.is_mapped
+        assert np.allclose(ensemble, self.coordinates)
+
+        ensemble.translate([-1.0, -1.0, -1.0])
+
+        assert np.allclose(ensemble[0].coordinates, [[0, 0, 0], [1, 1, 1]])
+        assert ensemble.copy().is_mapped
+
+    def test_shared_by_models(self):
+        ensemble = Ensemble(self.coordinates)
+        model1 = DockingModel([], ensemble)
+        model2 = DockingModel([], ensemble)
+
+        assert model1.coordinates is model2.coordinates
+
+        # Moving a model does not change the shared coordinates
+        model1.translate([1.0, 1.0, 1.0])
+
+        assert model2.coordinates is ensemble
+        assert ensemble == Ensemble(self.coordinates)
@@ -0,0 +1,113 @@
+"""Tests for the reading and ranking of LightDock results"""
+
+import os
+import numpy as np
+from pathlib import Path
+from lightdock.util.analysis import (
+    read_lightdock_output,
+    write_ranking_to_file,
+    read_solutions,
+    read_swarm_solutions,
+    SolutionsTable,
+)
+
+
+class TestSolutionsTable:
+    def setup_class(self):
+        self.path = Path(__file__).absolute().parent
+        self.golden_data_path = (
+            self.path.parent / "bin" / "post" / "golden_data" / "4IZ7"
+        )
+        self.result_file_name = self.golden_data_path / "swarm_0" / "gso_10.out"
+
+    def read_table(self):
+        table = read_solutions(
+            self.result_file_name,
+            id_swarm=3,
+            rmsds={0: 2.5, 1: 1.0, 2: 2.5},
+            contacts={0: 4, 1: 2},
+        )
+        # Ties in luciferin and scoring
+        table.luciferin[5:10] = 1.0
+        table.scoring[10:20] = -5.0
+        return table
+
+    def test_read(self):
+        results = read_lightdock_output(self.result_file_name)
+
+        table = read_solutions(self.result_file_name, id_swarm=3)
+
+        assert len(table) == len(results)
+        assert np.all(table.id_swarm == 3)
+        assert table.id_glowworm.tolist() == [r.id_glowworm for r in results]
+        assert np.allclose(table.luciferin, [r.luciferin for r in results])
+        assert np.allclose(table.scoring, [r.scoring for r in results])
+        assert np.all(table.rmsd == -1.0)
+        assert table.poses[0] == results[0].pose
+
+    def test_read_glowworms(self):
+        table = read_solutions(self.result_file_name, glowworm_ids={28, 3})
+
+        assert table.id_glowworm.tolist() == [3, 28]
+
+    def test_read_swarm_clusters(self):
+        table = read_swarm_solutions(
+            0,
+            self.result_file_name,
+            self.golden_data_path / "swarm_0" / "cluster.repr",
+        )
+
+        assert table.id_glowworm.tolist() == [11, 22, 23, 28, 35, 40, 43, 47]
+
+    def test_read_swarm_not_found(self):
+        assert read_swarm_solutions(0, self.golden_data_path / "missing.out") is None
+
+    def test_rankings(self, tmp_path):
+        table = self.read_table()
+        solutions = []
+        for row in range(len(table)):
+            result = read_lightdock_output(self.result_file_name)[row]
+            result.id_swarm = 3
+            result.luciferin = table.luciferin[row]
+            result.scoring = table.scoring[row]
+            result.rmsd = table.rmsd[row]
+            result.contacts = table.contacts[row]
+            result.pdb_file = "lightdock_%d.pdb" % result.id_glowworm
+            solutions.append(result)
+
+        os.chdir(tmp_path)
+        for order_by in [None, "luciferin", "rmsd", "scoring"]:
+            output_file, _ = SolutionsTable.rankings[order_by]
+            write_ranking_to_file(solutions, order_by=order_by)
+            expected = Path(output_file).read_text()
+
+            table.write_ranking(order_by)
+
+            assert Path(output_file).read_text() == expected
+
+    def test_rank_top(self):
+        table = self.read_table()
+
+        for order_by in [None, "luciferin", "rmsd", "scoring"]:
+            ranking = table.rank(order_by)
+            for top in [1, 7, 15, len(table), len(table) + 5]:
+                assert np.array_equal(table.rank(order_by, top), ranking[:top])
+
+    def test_select(self):
+        table = self.read_table()
+
+        selected = table.select(table.contacts > 0)
+
+        assert selected.id_glowworm.tolist() == [0, 1]
+        assert selected.contacts.tolist() == [4, 2]
+        assert selected.poses == table.poses[:2]
+        assert selected.format_row(1) == table.format_row(1)
+
+    def test_concatenate(self):
+        table = self.read_table()
+
+        tables = SolutionsTable.concatenate([table, table.select([0])])
+
+        assert len(tables) == len(table) + 1
+        assert tables.format_row(len(table)) == table.format_row(0)
+        assert len(SolutionsTable.concatenate([])) == 0
@@ -0,0 +1,51 @@
+"""Tests for the startup profile"""
+
+import sys
+import subprocess
+import time
+from lightdock.util.profiling import StartupProfile
+
+
+class TestStartupProfile:
+    def test_mark(self):
+        profile = StartupProfile()
+        time.sleep(0.01)
+        profile.mark("First")
+        profile.mark("Second")
+
+        assert [name for name, _ in profile.stages] == ["First", "Second"]
+        assert profile.stages[0][1] >= 0.01
+        assert profile.stages[1][1] < profile.stages[0][1]
+        assert profile.total() == profile.stages[0][1] + profile.stages[1][1]
+
+    def test_reset(self):
+        profile = StartupProfile()
+        profile.mark("First")
+        profile.reset()
+
+        assert profile.stages == []
+
+    def test_report(self):
+        profile = StartupProfile()
+        profile.stages = [("Imports", 0.1234), ("Scoring functions", 0.5)]
+
+        assert profile.report() == (
+            "Startup profile:\n"
+            "  Imports                123.4 ms\n"
+            "  Scoring functions      500.0 ms\n"
+            "  Total                  623.4 ms"
+        )
+
+    def test_simulation_imports(self):
+        """Running a simulation does not need setup dependencies"""
+        code = (
+            "import sys\n"
+            "import lightdock.simulation.docking_multiprocessing\n"
+            "print(','.join(m for m in ('prody', 'freesasa', 'scipy.cluster', "
+            "'scipy.optimize') if m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert output.stdout.strip() == ""
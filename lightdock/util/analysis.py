@@ -7,12 +7,20 @@ from lightdock.constants import (
     RANKING_BY_SCORING_FILE,
     RANKING_BY_RMSD_FILE,
     RANKING_FILE,
+    LIGHTDOCK_PDB_FILE,
 )
 from lightdock.util.logger import LoggingManager
 
 
 log = LoggingManager.get_logger("analysis")
 
+RANKING_HEADER = (
+    "Swarm  Glowworm   Coordinates                                             "
+    "RecID  LigID  Luciferin  Neigh   VR     RMSD    PDB             Clashes  Scoring\n"
+)
+
+RANKING_FORMAT = "%5d %6d %60s %6d %6d %11.5f %5d %7.3f %8.3f %16s %6d %8.3f"
+
 
 class DockingResult(object):
     """Represents a LightDock docking result line"""
@@ -49,7 +57,7 @@ class DockingResult(object):
         self.scoring = scoring
 
     def __str__(self):
-        return "%5d %6d %60s %6d %6d %11.5f %5d %7.3f %8.3f %16s %6d %8.3f" % (
+        return RANKING_FORMAT % (
             self.id_swarm,
             self.id_glowworm,
             self.coord,
@@ -131,6 +139,205 @@ def read_lightdock_output(file_name, initial=None, final=None):
         return results
 
 
+class SolutionsTable(object):
+    """Docking results stored by columns, one row per glowworm.
+
+    Rankings are calculated as arrays of row indexes and only the rows written to a
+    ranking file are formatted, once.
+    """
+
+    integer_columns = [
+        "id_swarm",
+        "id_glowworm",
+        "receptor_id",
+        "ligand_id",
+        "num_neighbors",
+        "contacts",
+    ]
+    float_columns = ["luciferin", "vision_range", "rmsd", "scoring"]
+
+    # Files and sorting keys of the rankings, the first key is the main one
+    rankings = {
+        None: (RANKING_FILE, []),
+        "luciferin": (RANKING_BY_LUCIFERIN_FILE, [("luciferin", True)]),
+        "rmsd": (RANKING_BY_RMSD_FILE, [("rmsd", False), ("luciferin", True)]),
+        "scoring": (
+            RANKING_BY_SCORING_FILE,
+            [("scoring", True), ("rmsd", False), ("luciferin", True)],
+        ),
+    }
+
+    def __init__(self, poses, columns):
+        self.poses = list(poses)
+        for name in SolutionsTable.integer_columns:
+            setattr(self, name, np.asarray(columns[name], dtype=np.int64))
+        for name in SolutionsTable.float_columns:
+            setattr(self, name, np.asarray(columns[name], dtype=float))
+        self._lines = {}
+
+    @staticmethod
+    def concatenate(tables):
+        """Single table with the rows of tables, in order"""
+        names = SolutionsTable.integer_columns + SolutionsTable.float_columns
+        return SolutionsTable(
+            [pose for table in tables for pose in table.poses],
+            {
+                name: np.concatenate([[]] + [getattr(table, name) for table in tables])
+                for name in names
+            },
+        )
+
+    def __len__(self):
+        return len(self.poses)
+
+    def select(self, rows):
+        """Table with the given rows, as indexes or as a mask"""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        names = SolutionsTable.integer_columns + SolutionsTable.float_columns
+        return SolutionsTable(
+            [self.poses[row] for row in rows],
+            {name: getattr(self, name)[rows] for name in names},
+        )
+
+    def rank(self, order_by=None, top=None):
+        """Indexes of the rows sorted by order_by, only the first top ones if given.
+
+        Ties are sorted as if the rankings were calculated in the order luciferin, RMSD
+        and scoring by stable sorts of the same list, as write_ranking_to_file does.
+        """
+        num_rows = len(self)
+        if top is None or top > num_rows:
+            top = num_rows
+        _, keys = SolutionsTable.rankings[order_by]
+        if not keys:
+            return np.arange(top)
+        keys = [
+            -getattr(self, name) if descending else getattr(self, name)
+            for name, descending in keys
+        ]
+        rows = np.arange(num_rows)
+        if top < num_rows:
+            # Partial selection of the rows up to the top one, including its ties
+            kth = np.partition(keys[0], top - 1)[top - 1]
+            rows = np.flatnonzero(keys[0] <= kth)
+            keys = [key[rows] for key in keys]
+        # Last key of lexsort is the main one
+        return rows[np.lexsort(keys[::-1])[:top]]
+
+    def format_row(self, row):
+        """Line of a ranking file for row"""
+        line = self._lines.get(row)
+        if line is None:
+            id_glowworm = int(self.id_glowworm[row])
+            line = RANKING_FORMAT % (
+                int(self.id_swarm[row]),
+                id_glowworm,
+                DockingResult.pose_repr(self.poses[row]),
+                int(self.receptor_id[row]),
+                int(self.ligand_id[row]),
+                float(self.luciferin[row]),
+                int(self.num_neighbors[row]),
+                float(self.vision_range[row]),
+                float(self.rmsd[row]),
+                LIGHTDOCK_PDB_FILE % id_glowworm,
+                int(self.contacts[row]),
+                float(self.scoring[row]),
+            )
+            self._lines[row] = line
+        return line
+
+    def write_ranking(self, order_by=None, top=None):
+        """Writes the ranking by order_by to its file"""
+        output_file, _ = SolutionsTable.rankings[order_by]
+        with open(output_file, "w") as output:
+            output.write(RANKING_HEADER)
+            for row in self.rank(order_by, top).tolist():
+                output.write("%s\n" % self.format_row(row))
+
+
+def read_solutions(file_name, id_swarm=0, glowworm_ids=None, rmsds=None, contacts=None):
+    """Reads a LightDock output file as a SolutionsTable.
+
+    Only the glowworms in glowworm_ids are kept if given. RMSD and contacts of the
+    glowworms are taken from the rmsds and contacts dictionaries if found.
+    """
+    rmsds = rmsds or {}
+    contacts = contacts or {}
+    poses = []
+    rows = []
+    with open(file_name) as fin:
+        raw_lines = [line for line in fin if line[0] != "#"]
+    for id_line, line in enumerate(raw_lines):
+        if glowworm_ids is not None and id_line not in glowworm_ids:
+            continue
+        try:
+            coord, _, last = parse_coordinates(line)
+        except ValueError:
+            continue
+        rest = line[last + 1 :].split()
+        try:
+            # Conformer solution
+            fields = [
+                int(rest[0]),
+                int(rest[1]),
+                float(rest[2]),
+                int(rest[3]),
+                float(rest[4]),
+                float(rest[5]),
+            ]
+        except ValueError:
+            # Default solution
+            fields = [
+                0,
+                0,
+                float(rest[0]),
+                int(rest[1]),
+                float(rest[2]),
+                float(rest[3]),
+            ]
+        poses.append(coord)
+        rows.append(
+            [id_line] + fields + [rmsds.get(id_line, -1.0), contacts.get(id_line, 0)]
+        )
+    columns = np.array(rows, dtype=float).reshape(-1, 9).T
+    return SolutionsTable(
+        poses,
+        {
+            "id_swarm": np.full(len(rows), id_swarm),
+            "id_glowworm": columns[0],
+            "receptor_id": columns[1],
+            "ligand_id": columns[2],
+            "luciferin": columns[3],
+            "num_neighbors": columns[4],
+            "vision_range": columns[5],
+            "scoring": columns[6],
+            "rmsd": columns[7],
+            "contacts": columns[8],
+        },
+    )
+
+
+def read_swarm_solutions(
+    id_swarm, result_file_name, cluster_file_name=None, rmsds=None, contacts=None
+):
+    """Solutions of a swarm as a SolutionsTable, None if its results are not found.
+
+    Only the cluster representatives are kept if cluster_file_name is given and it
+    exists. Suitable for a pool of processes.
+    """
+    glowworm_ids = None
+    if cluster_file_name and os.path.isfile(cluster_file_name):
+        glowworm_ids = set(read_cluster_representatives_file(cluster_file_name))
+    try:
+        return read_solutions(
+            result_file_name, id_swarm, glowworm_ids or None, rmsds, contacts
+        )
+    except IOError:
+        return None
+
+
 def read_ranking_file(ranking_file):
     """Reads a LightDock ranking file"""
     with open(ranking_file) as fin:
@@ -184,10 +391,7 @@ def write_ranking_to_file(solutions, clashes_cutoff=None, order_by=None):
         output_file = RANKING_FILE
 
     output = open(output_file, "w")
-    output.write(
-        "Swarm  Glowworm   Coordinates                                             "
-        "RecID  LigID  Luciferin  Neigh   VR     RMSD    PDB             Clashes  Scoring\n"
-    )
+    output.write(RANKING_HEADER)
     for solution in solutions:
         if clashes_cutoff:
             if solution.contacts <= clashes_cutoff:
@@ -19,6 +19,16 @@ from lightdock.constants import (
     DEFAULT_ANM_RMSD,
     DEFAULT_SWARM_DISTANCE,
     DEFAULT_SWARMS_PER_RESTRAINT,
+    DEFAULT_MINIMIZER,
+    DEFAULT_MINIMIZATION_TOP,
+    DEFAULT_MINIMIZATION_BUDGET,
+    DEFAULT_CONVERGENCE_PATIENCE,
+    DEFAULT_CONVERGENCE_SCORING,
+    DEFAULT_CONVERGENCE_LUCIFERIN,
+    DEFAULT_CONVERGENCE_MOVING,
+    DEFAULT_SWAP_RATE,
+    DEFAULT_PRUNE_FRACTION,
+    DEFAULT_WORKER_TIMEOUT,
 )
 from lightdock.error.lightdock_errors import LightDockError
 from lightdock.version import CURRENT_VERSION
@@ -88,6 +98,46 @@ def valid_float_number(float_value):
     return float_value
 
 
+def valid_address(address):
+    """[HOST:]PORT as a (host, port) tuple, host is empty if not given"""
+    host, _, port = address.rpartition(":")
+    try:
+        port = int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{address} is an invalid address")
+    if not 0 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"{address} is an invalid address")
+    return host, port
+
+
+def get_worker_address(input_args=None):
+    """Address of the coordinator if lgd_run is run as a worker, None otherwise"""
+    parser = argparse.ArgumentParser(prog="lgd_run", add_help=False)
+    parser.add_argument("--worker", type=valid_address)
+    args, _ = parser.parse_known_args(input_args)
+    return args.worker
+
+
+def valid_fraction(float_value):
+    try:
+        float_value = float(float_value)
+    except:
+        raise argparse.ArgumentTypeError(f"{float_value} is an invalid value")
+    if float_value <= 0.0 or float_value >= 1.0:
+        raise argparse.ArgumentTypeError(f"{float_value} is an invalid value")
+    return float_value
+
+
+def valid_probability(float_value):
+    try:
+        float_value = float(float_value)
+    except:
+        raise argparse.ArgumentTypeError(f"{float_value} is an invalid value")
+    if float_value < 0.0 or float_value > 1.0:
+        raise argparse.ArgumentTypeError(f"{float_value} is an invalid value")
+    return float_value
+
+
 class SetupCommandLineParser(object):
     """Parses the command line of lightdock_setup"""
 
@@ -333,6 +383,15 @@ class SetupCommandLineParser(object):
             action="store_true",
             default=False,
         )
+        # Enable batch generation of starting poses
+        parser.add_argument(
+            "--batch_poses",
+            "-batch_poses",
+            help="Generate starting poses in batches using NumPy random generators (not reproducible with previous versions)",
+            dest="batch_poses",
+            action="store_true",
+            default=False,
+        )
         # Version
         parser.add_argument(
             "-V",
@@ -470,6 +529,109 @@ class CommandLineParser(object):
             action="store_true",
             default=False,
         )
+        # Local minimization method
+        parser.add_argument(
+            "--minimizer",
+            help="local minimization method: Powell on the best glowworm of each swarm "
+            "or pattern search on the --min_top best ones",
+            dest="minimizer",
+            choices=["powell", "pattern"],
+            default=DEFAULT_MINIMIZER,
+        )
+        # Glowworms refined by local minimization
+        parser.add_argument(
+            "--min_top",
+            help="number of best glowworms of each swarm to minimize at each step "
+            "with pattern search",
+            dest="minimization_top",
+            type=valid_integer_number,
+            default=DEFAULT_MINIMIZATION_TOP,
+        )
+        # Evaluations allowed to local minimization
+        parser.add_argument(
+            "--min_budget",
+            help="scoring evaluations of the pattern search per swarm and step",
+            dest="minimization_budget",
+            type=valid_integer_number,
+            default=DEFAULT_MINIMIZATION_BUDGET,
+        )
+        # Early stopping of converged swarms
+        parser.add_argument(
+            "--patience",
+            help="stops a swarm after these steps without changes, 0 to disable",
+            dest="convergence_patience",
+            type=valid_natural_number,
+            default=DEFAULT_CONVERGENCE_PATIENCE,
+        )
+        parser.add_argument(
+            "--patience_scoring",
+            help="maximum change of the best scoring of a converged swarm",
+            dest="convergence_scoring",
+            type=valid_float_number,
+            default=DEFAULT_CONVERGENCE_SCORING,
+        )
+        parser.add_argument(
+            "--patience_luciferin",
+            help="maximum change of the mean luciferin of a converged swarm",
+            dest="convergence_luciferin",
+            type=valid_float_number,
+            default=DEFAULT_CONVERGENCE_LUCIFERIN,
+        )
+        parser.add_argument(
+            "--patience_moving",
+            help="maximum fraction of moving glowworms of a converged swarm",
+            dest="convergence_moving",
+            type=valid_float_number,
+            default=DEFAULT_CONVERGENCE_MOVING,
+        )
+        # Ensembles
+        parser.add_argument(
+            "--swap_rate",
+            help="probability of trying other receptor and ligand conformers when a "
+            "glowworm moves, 0 to disable",
+            dest="swap_rate",
+            type=valid_probability,
+            default=DEFAULT_SWAP_RATE,
+        )
+        # Successive halving of swarms
+        parser.add_argument(
+            "--prune_steps",
+            help="steps of each round after which the worst swarms are pruned, "
+            "0 to disable",
+            dest="prune_steps",
+            type=valid_natural_number,
+            default=0,
+        )
+        parser.add_argument(
+            "--prune_fraction",
+            help="fraction of the running swarms pruned after each round",
+            dest="prune_fraction",
+            type=valid_fraction,
+            default=DEFAULT_PRUNE_FRACTION,
+        )
+        parser.add_argument(
+            "--prune_by",
+            help="scoring of the swarm glowworms used to prune swarms",
+            dest="prune_by",
+            choices=["best", "median"],
+            default="best",
+        )
+        # Distributed execution
+        parser.add_argument(
+            "--coordinator",
+            help="serves the swarms to workers started elsewhere with "
+            "lgd_run.py --worker HOST:PORT in a copy of this folder",
+            dest="coordinator",
+            type=valid_address,
+            metavar="[HOST:]PORT",
+        )
+        parser.add_argument(
+            "--worker_timeout",
+            help="seconds without news from a worker to serve its swarms again",
+            dest="worker_timeout",
+            type=valid_float_number,
+            default=DEFAULT_WORKER_TIMEOUT,
+        )
         # List of available scoring functions
         parser.add_argument(
             "--listscoring",
@@ -487,6 +649,23 @@ class CommandLineParser(object):
             type=int,
             required=False,
         )
+        # Shared pose for multiple scoring functions
+        parser.add_argument(
+            "-composite",
+            "--composite",
+            help="evaluates the scoring functions sharing coordinates on the same pose",
+            dest="composite_scoring",
+            action="store_true",
+            default=False,
+        )
+        # Startup time report
+        parser.add_argument(
+            "--startup-profile",
+            help="reports the time spent importing and preparing the simulation",
+            dest="startup_profile",
+            action="store_true",
+            default=False,
+        )
         if input_args:
             self.args = parser.parse_args(input_args)
         else:
@@ -0,0 +1,36 @@
+"""Wall time of the stages of the start of a simulation"""
+
+import time
+
+
+class StartupProfile(object):
+    """Records the time elapsed between consecutive marks, each one closing a stage"""
+
+    def __init__(self):
+        self.stages = []
+        self.last_mark = time.perf_counter()
+
+    def reset(self):
+        self.stages = []
+        self.last_mark = time.perf_counter()
+
+    def mark(self, name):
+        """Closes the stage name, started at the previous mark"""
+        now = time.perf_counter()
+        self.stages.append((name, now - self.last_mark))
+        self.last_mark = now
+
+    def total(self):
+        return sum(elapsed for _, elapsed in self.stages)
+
+    def report(self):
+        """Table of the stages and their time in milliseconds"""
+        width = max([len(name) for name, _ in self.stages] + [len("Total")])
+        lines = ["Startup profile:"]
+        for name, elapsed in self.stages + [("Total", self.total())]:
+            lines.append(f"  {name:<{width}s} {elapsed * 1000.0:10.1f} ms")
+        return "\n".join(lines)
+
+
+# Shared by lgd_run and the simulation drivers, so imports are also accounted
+startup_profile = StartupProfile()
@@ -106,7 +106,8 @@ exts = [
     LDExtension(
         name="lightdock.scoring.sd.energy.c.sd",
         sources=["lightdock/scoring/sd/energy/c/sd.c"],
-        include_dirs=[get_numpy_include],
+        include_dirs=[get_numpy_include, "lightdock/scoring/c"],
+        depends=["lightdock/scoring/c/neighbors.h"],
     ),
     LDExtension(
         name="lightdock.scoring.fastdfire.c.cdfire",
@@ -121,12 +122,14 @@ exts = [
     LDExtension(
         name="lightdock.scoring.vdw.energy.c.cvdw",
         sources=["lightdock/scoring/vdw/energy/c/cvdw.c"],
-        include_dirs=[get_numpy_include],
+        include_dirs=[get_numpy_include, "lightdock/scoring/c"],
+        depends=["lightdock/scoring/c/neighbors.h"],
     ),
     LDExtension(
         name="lightdock.scoring.dna.energy.c.cdna",
         sources=["lightdock/scoring/dna/energy/c/cdna.c"],
-        include_dirs=[get_numpy_include],
+        include_dirs=[get_numpy_include, "lightdock/scoring/c"],
+        depends=["lightdock/scoring/c/neighbors.h"],
     ),
     LDExtension(
         name="lightdock.scoring.sipper.c.sipper",